@@ -2,7 +2,8 @@
 cd /data/project/spbot/logs/
 today=`(date +%F)`
 mkdir "$today"
-mv archive-resolved-* bot-stats* daily-log-* pers-bek* mp-helper* "$today"
+mv archive-resolved-* archiv-* bot-stats* daily-log-* pers-bek* mp-helper* "$today"
 
-bzip2 --compress "$today"/*
-rm "$today"/*.err "$today"/*.out
+# rotated pywikibot logs and reports are already compressed (config.logfilecompression)
+find "$today" -type f ! -name '*.bz2' ! -name '*.gz' ! -name '*.xz' -exec bzip2 --compress {} +
+rm -f "$today"/*.err "$today"/*.out
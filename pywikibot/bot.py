@@ -162,6 +162,8 @@ from pywikibot.logging import (
     STDOUT,
     VERBOSE,
     WARNING,
+    CompressedRotatingFileHandler,
+    CompressedTimedRotatingFileHandler,
     add_init_routine,
     critical,
     debug,
@@ -361,6 +363,9 @@ def init_handlers() -> None:
     .. versionchanged:: 6.2
       Different logfiles are used if multiple processes of the same
       script are running.
+    .. versionchanged:: 8.6
+      Rotated logfiles are compressed if ``config.logfilecompression``
+      is set and rotated by time if ``config.logfilerotation`` is set.
     """
     module_name = calledModuleName()
     if not module_name:
@@ -429,12 +434,21 @@ def init_handlers() -> None:
                                       warning_class=ArgumentDeprecationWarning,
                                       since='6.5.0')
 
-        file_handler = logging.handlers.RotatingFileHandler(
-            filename=logfile,
-            maxBytes=config.logfilesize << 10,
-            backupCount=max_count,
-            encoding='utf-8'
-        )
+        kwargs = {'backupCount': max_count, 'encoding': 'utf-8'}
+        if config.logfilecompression:
+            kwargs['compression'] = config.logfilecompression
+        if config.logfilerotation:
+            handler_class = (CompressedTimedRotatingFileHandler
+                             if config.logfilecompression
+                             else logging.handlers.TimedRotatingFileHandler)
+            kwargs['when'] = config.logfilerotation
+        else:
+            handler_class = (CompressedRotatingFileHandler
+                             if config.logfilecompression
+                             else logging.handlers.RotatingFileHandler)
+            kwargs['maxBytes'] = config.logfilesize << 10
+
+        file_handler = handler_class(filename=logfile, **kwargs)
         file_handler.namer = handler_namer
 
         file_handler.setLevel(DEBUG)
@@ -622,6 +622,14 @@ logfilesize = 1024
 # renamed if the logfile is full. The newest file gets the highest number until
 # some logfiles where deleted.
 logfilecount = 5
+# Compress rotated logfiles with one of the formats 'bz2', 'gz', 'lzma' or
+# 'xz'. The files are compressed by a background thread. If None, rotated
+# logfiles are kept uncompressed.
+logfilecompression: Optional[str] = None
+# Rotate logfiles by time instead of by logfilesize. Use one of the 'when'
+# values of Python's TimedRotatingFileHandler like 'midnight' or 'H'.
+# logfilecount is the number of rotated files kept.
+logfilerotation: Optional[str] = None
 # set to 1 (or higher) to generate "informative" messages to terminal
 verbose_output = 0
 # set to True to fetch the pywiki version online
@@ -685,6 +693,10 @@ interwiki_graph = False
 # once.
 interwiki_min_subjects = 100
 
+# How many sites should interwiki.py query at the same time? Each site is
+# still queried with one request at a time within its own throttle.
+interwiki_query_sites = 4
+
 # If interwiki graphs are enabled, which format(s) should be used?
 # Supported formats include png, jpg, ps, and svg. See:
 # https://graphviz.org/docs/outputs/
@@ -727,6 +739,12 @@ sort_ignore_case = False
 # Commons by default.
 upload_to_commons = False
 
+# Files larger than this size in bytes are uploaded in chunks of this size
+# if no chunk size is given for the upload. Only two chunks are kept in
+# memory then. The default 0 uploads files as a whole unless a chunk size
+# is given, e.g. use 16 * 1024 * 1024 for chunks of 16 MiB.
+upload_chunk_size = 0
+
 # ############# SETTINGS TO AVOID SERVER OVERLOAD ##############
 
 # Slow down the robot such that it never requests a second page within
@@ -775,6 +793,11 @@ retry_max = 120
 # that slow servers won't slow you down.
 max_external_links = 50
 
+# How many links of the same host may be checked at the same time and how
+# many seconds must pass between two requests to the same host?
+weblink_host_connections = 1
+weblink_host_delay = 6
+
 report_dead_links_on_talk = False
 
 # Don't alert on links days_dead old or younger
@@ -881,6 +904,24 @@ simulate: Union[bool, str] = False
 # processing. As higher this value this effect will decrease.
 max_queue_size = 64
 
+# Number of worker processes used by regex filters like -grep and
+# -titleregex and by XMLDumpPageGenerator text predicates. Evaluating
+# expensive regexes over page content is CPU-bound; with a value > 0 the
+# patterns are evaluated in a process pool. 0 evaluates them in the bot
+# process.
+regex_filter_processes = 0
+
+# How many titles or texts should be sent to a filter worker process at
+# once if regex_filter_processes is enabled.
+regex_filter_chunk_size = 20
+
+# Use the built-in template scanner of textlib instead of wikitextparser
+# or mwparserfromhell to extract templates and their parameters e.g. for
+# Page.templatesWithParams(). It is much faster with template-heavy pages
+# but does not build a parse tree. The built-in scanner is always used if
+# none of these packages is installed.
+builtin_template_parser = False
+
 # Pickle protocol version to use for storing dumps.
 # This config variable is not used for loading dumps.
 # Version 0 is a more or less human-readable protocol
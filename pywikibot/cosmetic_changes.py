@@ -343,10 +343,13 @@ class CosmeticChangesToolkit:
 
         categories = []
         interwiki_links = {}
+        # categories and interwiki are searched in the same text
+        lexer = textlib.WikitextLexer.for_text(text, self.site)
 
         # get categories
         if not self.template:
-            categories = textlib.getCategoryLinks(text, site=self.site)
+            categories = textlib.getCategoryLinks(text, site=self.site,
+                                                  lexer=lexer)
 
         if not self.talkpage:
             subpage = False
@@ -361,7 +364,8 @@ class CosmeticChangesToolkit:
 
             # get interwiki
             interwiki_links = textlib.getLanguageLinks(
-                text, insite=self.site, template_subpage=subpage)
+                text, insite=self.site, template_subpage=subpage,
+                lexer=lexer)
 
             # remove interwiki
             text = textlib.removeLanguageLinks(text, site=self.site)
@@ -646,7 +650,10 @@ class CosmeticChangesToolkit:
 
         text = textlib.replaceExcept(text, linkR, handleOneLink,
                                      ['comment', 'math', 'nowiki', 'pre',
-                                      'startspace'])
+                                      'startspace'],
+                                     site=self.site,
+                                     lexer=textlib.WikitextLexer(text,
+                                                                 self.site))
         return text
 
     def resolveHtmlEntities(self, text: str) -> str:
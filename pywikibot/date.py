@@ -7,8 +7,8 @@
 import calendar
 import datetime
 import re
+import threading
 from collections import abc, defaultdict
-from contextlib import suppress
 from functools import singledispatch
 from string import digits as _decimalDigits  # noqa: N812
 from typing import Optional, Union
@@ -25,6 +25,7 @@ from pywikibot.backports import (
     Sequence,
     Tuple,
 )
+from pywikibot.logging import debug
 from pywikibot.site import BaseSite
 from pywikibot.textlib import NON_LATIN_DIGITS
 from pywikibot.tools import first_lower, first_upper
@@ -243,6 +244,7 @@ def slh(value: int, lst: Sequence[str]) -> str:
 
 @slh.register(str)
 def _(value: str, lst: Sequence[str]) -> int:
+    _record_pattern('|'.join(re.escape(item) for item in lst))
     return lst.index(value) + 1
 
 
@@ -271,11 +273,28 @@ def dh_constVal(value: int, ind: int, match: str) -> str:
 
 @dh_constVal.register(str)
 def _(value: str, ind: int, match: str) -> int:
+    _record_pattern(re.escape(match))
     if value == match:
         return ind
     raise ValueError(f'unknown value {value}')
 
 
+# Collects the regex patterns used by the decoders while a language index
+# for getAutoFormat is built; thread local to keep concurrent decoding out
+_pattern_recorder = threading.local()
+
+
+def _record_pattern(pattern: str) -> None:
+    """Record a decoder pattern while an auto format index is built.
+
+    .. versionadded:: 8.6
+    .. seealso:: :func:`getAutoFormat`
+    """
+    patterns = getattr(_pattern_recorder, 'patterns', None)
+    if patterns is not None:
+        patterns.append(pattern)
+
+
 def alwaysTrue(x: Any) -> bool:
     """
     Return True, always.
@@ -515,6 +534,7 @@ def dh(value: int, pattern: str, encf: encf_type, decf: decf_type,
 def _(value: str, pattern: str, encf: encf_type, decf: decf_type,
       filter: Optional[Callable[[int], bool]] = None) -> int:
     compPattern, _strPattern, decoders = escapePattern2(pattern)
+    _record_pattern(compPattern.pattern[:-1])  # strip the '$' anchor
     m = compPattern.match(value)
     if m:
         # decode each found value using provided decoder
@@ -1947,29 +1967,116 @@ for monthId in range(12):
         formatLimits[dayMnthFmts[monthId]] = _format_limit_dom(30)
 
 
+# A map of language code to its getAutoFormat index
+_auto_format_index: Dict[str, Tuple[
+    Optional[Pattern[str]],
+    List[Tuple[str, Mapping[str, Callable[[Any], Any]], Pattern[str]]]]] = {}
+_auto_format_lock = threading.Lock()
+
+
+def _build_auto_format_index(lang: str) -> Tuple[
+    Optional[Pattern[str]],
+    List[Tuple[str, Mapping[str, Callable[[Any], Any]], Pattern[str]]]
+]:
+    """Create the reverse lookup index of all formats for a language.
+
+    Each decoder of *lang* is probed once with an empty string while the
+    patterns it tries are recorded. The recorded patterns of every format
+    are joined into a single alternation regex whose named groups keep
+    the order of :data:`formats`. Formats which cannot be probed (e.g.
+    month names which could not be retrieved from the site) are left
+    out of the index.
+
+    .. versionadded:: 8.6
+
+    :param lang: language code
+    :return: the combined regex or None and a list of entries with
+        dictName, dictionary and the format pattern; the group ``f<n>``
+        of the regex belongs to the entry at index *n*
+    """
+    entries = []
+    alternatives = []
+    for dict_name, dictionary in formats.items():
+        try:
+            decoder = dictionary[lang]
+        except KeyError:
+            continue
+        except Exception as e:
+            debug(f'{dict_name} format of {lang!r} skipped: {e!r}')
+            continue
+
+        _pattern_recorder.patterns = patterns = []
+        try:
+            decoder('')
+        except ValueError:
+            probed = bool(patterns)
+        except Exception as e:
+            debug(f'{dict_name} format of {lang!r} skipped: {e!r}')
+            probed = False
+        else:
+            probed = False
+        finally:
+            del _pattern_recorder.patterns
+
+        if not probed:
+            continue
+
+        pattern = '|'.join(f'(?:{p})' for p in patterns)
+        alternatives.append(f'(?P<f{len(entries)}>{pattern})')
+        entries.append((dict_name, dictionary, re.compile(pattern)))
+
+    regex = re.compile('|'.join(alternatives)) if alternatives else None
+    return regex, entries
+
+
 def getAutoFormat(lang: str, title: str, ignoreFirstLetterCase: bool = True
                   ) -> Tuple[Optional[str], Optional[str]]:
     """
     Return first matching formatted date value.
 
+    The title is matched against an index of all format patterns of
+    *lang* which is built on first use. Only the decoders of formats
+    whose pattern matches the title are called; formats with the same
+    pattern like ``'January %d'`` for days and years are told apart by
+    the value range which their decoder accepts.
+
+    .. versionchanged:: 8.6
+       use a lazily built per-language index
+
     :param lang: language code
     :param title: value to format
     :return: dictName ('YearBC', 'December', ...) and value (a year, date, ...)
     """
-    for dict_name, dictionary in formats.items():
-        with suppress(Exception):
-            year = dictionary[lang](title)
-            return dict_name, year
+    index = _auto_format_index.get(lang)
+    if index is None:
+        with _auto_format_lock:
+            index = _auto_format_index.get(lang)
+            if index is None:
+                index = _build_auto_format_index(lang)
+                _auto_format_index[lang] = index
+
+    regex, entries = index
+    match = regex.fullmatch(title) if regex else None
+    first = int(match.lastgroup[1:]) if match else len(entries)
+    for dict_name, dictionary, pattern in entries[first:]:
+        if not pattern.fullmatch(title):
+            continue
+        try:
+            value = dictionary[lang](title)
+        except ValueError:
+            # the value is out of the range of this format
+            continue
+        return dict_name, value
+
     # sometimes the title may begin with an upper case while its listed as
     # lower case, or the other way around
     # change case of the first character to the opposite, and try again
-    if ignoreFirstLetterCase:
-        with suppress(Exception):
-            if title[0].isupper():
-                title = first_lower(title)
-            else:
-                title = first_upper(title)
-            return getAutoFormat(lang, title, ignoreFirstLetterCase=False)
+    if ignoreFirstLetterCase and title:
+        if title[0].isupper():
+            title = first_lower(title)
+        else:
+            title = first_upper(title)
+        return getAutoFormat(lang, title, ignoreFirstLetterCase=False)
     return None, None
 
 
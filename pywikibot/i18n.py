@@ -20,11 +20,14 @@ See :py:obj:`twtranslate` for more information on the messages.
 # Distributed under the terms of the MIT license.
 #
 import json
+import mmap
 import os
 import pkgutil
 import re
+import struct
 from collections import abc, defaultdict
 from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
 from textwrap import fill
 from typing import Optional, Union
@@ -40,6 +43,7 @@ from pywikibot.backports import (
     Mapping,
     Match,
     Sequence,
+    Tuple,
     cache,
     removesuffix,
 )
@@ -57,6 +61,8 @@ PLURAL_PATTERN = r'{{PLURAL:(?:%\()?([^\)]*?)(?:\)d)?\|(.*?)}}'
 _messages_package_name = 'scripts.i18n'
 # Flag to indicate whether translation messages are available
 _messages_available = None
+# Name of the compiled message bundles file inside the messages package
+COMPILED_BUNDLES = 'bundles.bin'
 
 _LANG_TO_GROUP_NAME = defaultdict(str, {
     'aa': 'aa',
@@ -368,6 +374,10 @@ def set_messages_package(package_name: str) -> None:
     global _messages_available
     _messages_package_name = package_name
     _messages_available = None
+    _get_bundle.cache_clear()
+    _get_store.cache_clear()
+    _resolve_translation.cache_clear()
+    _resolve_plural.cache_clear()
 
 
 def messages_available() -> bool:
@@ -440,17 +450,231 @@ def _get_bundle(lang: str, dirname: str) -> Dict[str, str]:
     return json.loads(trans_text)
 
 
+class _BundleStore:
+
+    """Message store of a compiled bundles file.
+
+    The file is memory-mapped. It starts with a header which holds the
+    position of an index for each language. A language index maps the
+    TranslateWiki string titles to the position of their messages and
+    is loaded with the first lookup of that language. Messages are
+    decoded on demand. The file is created by :func:`compile_bundles`.
+
+    Whether a bundle file was modified after it was compiled is checked
+    with its first lookup; see :meth:`is_fresh`.
+
+    .. versionadded:: 8.6
+    """
+
+    MAGIC = b'PWBI18N1'
+
+    def __init__(self, filename: Union[str, os.PathLike]) -> None:
+        """Initializer.
+
+        :raises ValueError: not a compiled bundles file
+        """
+        self.filename = Path(filename)
+        with open(filename, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic = self._data[:len(self.MAGIC)]
+        if magic != self.MAGIC:
+            raise ValueError(f'{filename} is not a compiled bundles file')
+
+        start = len(self.MAGIC) + 8
+        size, = struct.unpack('<Q', self._data[len(self.MAGIC):start])
+        header = json.loads(self._data[start:start + size].decode('utf-8'))
+        self.mtime = header['mtime']
+        self._offset = start + size
+        self._positions = header['langs']
+        self._indexes: Dict[str, Dict[str, List[int]]] = {}
+        self._fresh: Dict[Tuple[str, str], bool] = {}
+        self._warned = False
+
+    def _read(self, position: Sequence[int]) -> str:
+        offset, length = position
+        offset += self._offset
+        return self._data[offset:offset + length].decode('utf-8')
+
+    def is_fresh(self, dirname: str, lang: str) -> bool:
+        """Return whether a bundle file is unchanged since compiling.
+
+        Only the bundle directory and the JSON file of the given
+        language are checked, once per process.
+
+        :param dirname: the bundle name
+        :param lang: the language code
+        """
+        key = (dirname, lang)
+        fresh = self._fresh.get(key)
+        if fresh is None:
+            path = self.filename.parent / dirname
+            mtime = 0.0
+            for filepath in (path, path / f'{lang}.json'):
+                with suppress(OSError):
+                    mtime = max(mtime, filepath.stat().st_mtime)
+            fresh = self._fresh[key] = mtime <= self.mtime
+            if not fresh and not self._warned:
+                self._warned = True
+                pywikibot.warning(f'{self.filename} is outdated; use '
+                                  'compile_bundles() to update it')
+        return fresh
+
+    def get(self, lang: str, twtitle: str) -> Optional[str]:
+        """Return message of certain twtitle if exists."""
+        index = self._indexes.get(lang)
+        if index is None:
+            position = self._positions.get(lang)
+            index = json.loads(self._read(position)) if position else {}
+            self._indexes[lang] = index
+
+        position = index.get(twtitle)
+        return self._read(position) if position else None
+
+
+def _bundles_mtime(path: Path) -> float:
+    """Return the latest modification time of all bundle files.
+
+    The bundle directories are included to notice added or removed
+    files.
+    """
+    mtimes = []
+    for dirpath in path.iterdir():
+        if dirpath.is_dir() and not dirpath.match('*__'):
+            mtimes.append(dirpath.stat().st_mtime)
+            mtimes.extend(fname.stat().st_mtime
+                          for fname in dirpath.glob('*.json'))
+    return max(mtimes, default=0.0)
+
+
+@cache
+def _get_store() -> Optional[_BundleStore]:
+    """Return the compiled bundles store of the messages package.
+
+    The store is not used if no compiled bundles file exists.
+
+    For internal use, don't use it directly.
+
+    .. versionadded:: 8.6
+    """
+    try:
+        mod = __import__(_messages_package_name, fromlist=['__path__'])
+    except ImportError:
+        return None
+
+    path = Path(next(iter(mod.__path__)))
+    filename = path / COMPILED_BUNDLES
+    if not filename.exists():
+        return None
+
+    try:
+        store = _BundleStore(filename)
+    except (OSError, ValueError) as e:
+        pywikibot.warning(f'Compiled bundles file cannot be used: {e}')
+        return None
+
+    return store
+
+
+def compile_bundles(filename: Union[str, os.PathLike, None] = None) -> Path:
+    """Compile all message bundles into a single indexed file.
+
+    The compiled file is used by :func:`twtranslate` and related
+    functions instead of reading a JSON file per bundle and language.
+    It must be compiled again whenever the message bundles are updated;
+    messages of bundle files modified after compiling are read from
+    their JSON files.
+
+    .. versionadded:: 8.6
+
+    :param filename: the target file. Defaults to
+        :data:`COMPILED_BUNDLES` inside the messages package
+    :return: the path of the compiled file
+    """
+    mod = __import__(_messages_package_name, fromlist=['__path__'])
+    path = Path(next(iter(mod.__path__)))
+    target = Path(filename) if filename else path / COMPILED_BUNDLES
+    mtime = _bundles_mtime(path)
+
+    messages: Dict[str, Dict[str, str]] = defaultdict(dict)
+    for dirpath in sorted(path.iterdir()):
+        if not dirpath.is_dir() or dirpath.match('*__'):
+            continue
+        for fname in sorted(dirpath.glob('*.json')):
+            with open(fname, encoding='utf-8') as f:
+                data = json.load(f)
+            messages[fname.stem].update(
+                (key, value) for key, value in data.items()
+                if key.split('-')[0] == dirpath.stem)
+
+    blob = bytearray()
+
+    def append(data: bytes) -> List[int]:
+        position = [len(blob), len(data)]
+        blob.extend(data)
+        return position
+
+    langs = {}
+    for lang, transdict in sorted(messages.items()):
+        index = {key: append(value.encode('utf-8'))
+                 for key, value in transdict.items()}
+        langs[lang] = append(json.dumps(
+            index, separators=(',', ':')).encode('utf-8'))
+
+    header = json.dumps({'mtime': mtime, 'langs': langs},
+                        separators=(',', ':')).encode('utf-8')
+    with open(target, 'wb') as f:
+        f.write(_BundleStore.MAGIC)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+        f.write(blob)
+
+    _get_store.cache_clear()
+    _resolve_translation.cache_clear()
+    _resolve_plural.cache_clear()
+    return target
+
+
 def _get_translation(lang: str, twtitle: str) -> Optional[str]:
     """
     Return message of certain twtitle if exists.
 
     For internal use, don't use it directly.
+
+    .. versionchanged:: 8.6
+       use the compiled bundles file if available and not outdated
     """
     message_bundle = twtitle.split('-')[0]
+    store = _get_store()
+    if store is not None and store.is_fresh(message_bundle, lang):
+        return store.get(lang, twtitle)
+
     transdict = _get_bundle(lang, message_bundle)
     return transdict.get(twtitle)
 
 
+@lru_cache(maxsize=1024)
+def _resolve_translation(lang: str, twtitle: str, fallback: bool
+                         ) -> Tuple[Optional[str], Optional[str]]:
+    """Return the language and message found for twtitle.
+
+    For internal use, don't use it directly.
+
+    .. versionadded:: 8.6
+
+    :return: the language code of the translation and the translation
+        or None, None if no translation was found
+    """
+    langs = [lang]
+    if fallback:
+        langs += _altlang(lang) + ['en']
+    for alt in langs:
+        trans = _get_translation(alt, twtitle)
+        if trans:
+            return alt, trans
+    return None, None
+
+
 def _extract_plural(lang: str, message: str, parameters: Mapping[str, int]
                     ) -> str:
     """Check for the plural variants in message and replace them.
@@ -516,6 +740,20 @@ def _extract_plural(lang: str, message: str, parameters: Mapping[str, int]
     return re.sub(PLURAL_PATTERN, replace_plural, message)
 
 
+@lru_cache(maxsize=1024)
+def _resolve_plural(lang: str, message: str,
+                    numbers: Tuple[Tuple[str, int], ...]) -> str:
+    """Return the message with plural instances replaced.
+
+    For internal use, don't use it directly.
+
+    .. versionadded:: 8.6
+
+    :param numbers: pairs of plural selectors and their numbers
+    """
+    return _extract_plural(lang, message, dict(numbers))
+
+
 class _PluralMappingAlias(abc.Mapping):
 
     """
@@ -789,19 +1027,13 @@ def twtranslate(
     # There are two possible failure modes: the translation dict might not have
     # the language altogether, or a specific key could be untranslated. Both
     # modes are caught with the KeyError.
-    langs = [lang]
-    if fallback:
-        langs += _altlang(lang) + ['en']
-    for alt in langs:
-        trans = _get_translation(alt, twtitle)
-        if trans:
-            break
-    else:
+    alt, trans = _resolve_translation(lang, twtitle, fallback)
+    if trans is None:
         raise pywikibot.exceptions.TranslationError(fill(
             'No {} translation has been defined for TranslateWiki key "{}". '
             'It can happen due to lack of i18n submodule or files or an '
             'outdated submodule. See {}/i18n'
-            .format('English' if 'en' in langs else f"'{lang}'",
+            .format('English' if fallback or lang == 'en' else f"'{lang}'",
                     twtitle, __url__)))
 
     if '{{PLURAL:' in trans:
@@ -809,7 +1041,12 @@ def twtranslate(
         # deprecated
         if not isinstance(parameters, Mapping):
             raise TypeError('parameters must be a mapping.')
-        trans = _extract_plural(alt, trans, parameters)
+        numbers = tuple((selector, parameters[selector])
+                        for selector, _ in re.findall(PLURAL_PATTERN, trans))
+        if all(type(num) is int for _, num in numbers):
+            trans = _resolve_plural(alt, trans, numbers)
+        else:
+            trans = _extract_plural(alt, trans, parameters)
 
     if parameters is not None and not isinstance(parameters, Mapping):
         raise ValueError('parameters should be a mapping, not {}'
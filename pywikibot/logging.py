@@ -24,16 +24,25 @@ argument, which is a string indicating the debugging layer.
 #
 # Distributed under the terms of the MIT license.
 #
+import atexit
 import logging
+import logging.handlers
 import os
+import shutil
 import sys
+import threading
 
 # logging levels
 from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING
+from queue import Queue
 from typing import Any
 
 from pywikibot.backports import Callable, List, Tuple
-from pywikibot.tools import deprecated_args, issue_deprecation_warning
+from pywikibot.tools import (
+    deprecated_args,
+    issue_deprecation_warning,
+    open_archive,
+)
 
 
 STDOUT = 16  #:
@@ -335,3 +344,108 @@ def exception(msg: Any = None, *args: Any,
             msg += f' ({exc_type.__name__})'
     assert msg is not None
     error(msg, *args, exc_info=exc_info, **kwargs)
+
+
+# Queue of (source, target) log files to be compressed
+_compression_queue: Queue = Queue()
+_compression_thread = None
+_compression_lock = threading.Lock()
+
+
+def _compress_logfiles() -> None:
+    """Compress rotated log files from the queue; runs as daemon thread.
+
+    The uncompressed source file is removed after it was compressed. If
+    compressing fails it is kept.
+    """
+    while True:
+        source, target = _compression_queue.get()
+        try:
+            with open(source, 'rb') as src, open_archive(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+        except OSError:
+            pass
+        else:
+            os.remove(source)
+        finally:
+            _compression_queue.task_done()
+
+
+class _CompressionMixin:
+
+    """Compress rotated log files in a background thread.
+
+    The rotated file is renamed immediately and compressed later, so the
+    logging thread is not blocked. Pending compressions are finished
+    before the next rollover and at exit.
+    """
+
+    compression = 'gz'
+
+    def rotation_filename(self, default_name: str) -> str:
+        """Append the compression extension to the rotated filename."""
+        return f'{super().rotation_filename(default_name)}.{self.compression}'
+
+    def rotate(self, source: str, dest: str) -> None:
+        """Rename *source* and queue it to be compressed into *dest*."""
+        global _compression_thread
+        if not os.path.exists(source):
+            return
+
+        uncompressed = dest[:-len(self.compression) - 1]
+        os.replace(source, uncompressed)
+        with _compression_lock:
+            if _compression_thread is None:
+                _compression_thread = threading.Thread(
+                    target=_compress_logfiles, name='Log-Compression',
+                    daemon=True)
+                _compression_thread.start()
+                atexit.register(_compression_queue.join)
+        _compression_queue.put((uncompressed, dest))
+
+    def doRollover(self) -> None:  # noqa: N802
+        """Wait for pending compressions, then do a rollover."""
+        # backups are renamed during rollover
+        _compression_queue.join()
+        super().doRollover()
+
+
+class CompressedRotatingFileHandler(_CompressionMixin,
+                                    logging.handlers.RotatingFileHandler):
+
+    """Size based rotating file handler which compresses rotated files.
+
+    >>> handler = CompressedRotatingFileHandler(
+    ...     'bot.log', maxBytes=1024, compression='xz', delay=True)
+    >>> handler.rotation_filename('bot.log.1')
+    'bot.log.1.xz'
+
+    .. versionadded:: 8.6
+
+    :param compression: the compression format of the rotated files;
+        all formats which can be written by :func:`tools.open_archive`
+        are supported: ``'bz2'``, ``'gz'``, ``'lzma'`` or ``'xz'``
+    """
+
+    def __init__(self, *args, compression: str = 'gz', **kwargs) -> None:
+        """Initializer."""
+        super().__init__(*args, **kwargs)
+        self.compression = compression
+
+
+class CompressedTimedRotatingFileHandler(
+        _CompressionMixin, logging.handlers.TimedRotatingFileHandler):
+
+    """Time based rotating file handler which compresses rotated files.
+
+    .. versionadded:: 8.6
+
+    :param compression: the compression format of the rotated files;
+        all formats which can be written by :func:`tools.open_archive`
+        are supported: ``'bz2'``, ``'gz'``, ``'lzma'`` or ``'xz'``
+    """
+
+    def __init__(self, *args, compression: str = 'gz', **kwargs) -> None:
+        """Initializer."""
+        super().__init__(*args, **kwargs)
+        self.compression = compression
@@ -4,11 +4,13 @@
 #
 # Distributed under the terms of the MIT license.
 #
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Any, Optional, Union
 
 import pywikibot
-from pywikibot.backports import Dict, Generator, Iterable
+from pywikibot.backports import Dict, Generator, Iterable, Tuple
 from pywikibot.page._page import Page
 
 
@@ -98,6 +100,8 @@ class Category(Page):
         *B, C, D, E, F, G, H, I, J, E, H, K, L, G*
 
         .. seealso:: :attr:`categoryinfo`
+        .. seealso:: :meth:`subcategory_edges` to walk deep category
+           trees level by level with concurrent requests
         .. warning:: Categories may have infinite recursions of
            subcategories. If ``recurse`` option is given as ``True`` or
            an ``int`` value and this value is less than
@@ -132,6 +136,78 @@ class Category(Page):
         yield from self.members(member_type='subcat', recurse=recurse,
                                 **kwargs)
 
+    def subcategory_edges(
+        self, *,
+        depth: Optional[int] = None,
+        workers: int = 4,
+        **kwargs: Any
+    ) -> Generator[Tuple[int, 'Category', 'Category'], None, None]:
+        """Yield the subcategory graph breadth first as edges.
+
+        The tree is processed one level at a time. The subcategories of
+        the categories of a level are queried concurrently by up to
+        *workers* threads; the requests are still subject to the site
+        throttle. Each category is expanded only once even if it is
+        reached by several paths or by a loop, but every edge is
+        yielded. Edges are yielded in level order and grouped by their
+        parent category. Categories known to have no subcategories are
+        not queried.
+
+        **Usage:**
+
+        >>> site = pywikibot.Site('wikipedia:test')
+        >>> cat = pywikibot.Category(site, 'Pywikibot')
+        >>> for level, parent, child in cat.subcategory_edges(depth=1):
+        ...     print(level, parent.title(), child.title())
+        1 Category:Pywikibot Category:Subpage testing
+
+        .. versionadded:: 8.6
+        .. seealso:: :meth:`subcategories`
+
+        :param depth: the maximum level of edges to yield; direct
+            subcategories have level 1. None for no limit.
+        :param workers: maximum number of simultaneous requests
+        :param kwargs: Additional parameters. Refer to
+            :meth:`APISite.categorymembers()
+            <pywikibot.site._generators.GeneratorsMixin.categorymembers>`
+            for complete list (*member_type* excluded).
+        :return: (level, parent, subcategory) tuples
+        """
+        if kwargs.pop('member_type', False):
+            raise TypeError('subcategory_edges() got an unexpected keyword '
+                            "argument 'member_type'")
+
+        def subcats(cat):
+            catinfo = getattr(cat, '_catinfo', None)
+            if catinfo is not None and not catinfo['subcats']:
+                return []
+            return list(self.site.categorymembers(cat, member_type='subcat',
+                                                  **kwargs))
+
+        seen = {self.pageid}
+        categories = [self]
+        level = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while categories and (depth is None or level < depth):
+                level += 1
+                parents = iter(categories)
+                categories = []
+                queue = deque()
+                while True:
+                    # keep a bounded number of queries in flight
+                    queue.extend((cat, executor.submit(subcats, cat))
+                                 for cat in islice(parents,
+                                                   2 * workers - len(queue)))
+                    if not queue:
+                        break
+
+                    parent, future = queue.popleft()
+                    for child in future.result():
+                        yield level, parent, child
+                        if child.pageid not in seen:
+                            seen.add(child.pageid)
+                            categories.append(child)
+
     def articles(self, *,
                  recurse: Union[int, bool] = False,
                  total: Optional[int] = None,
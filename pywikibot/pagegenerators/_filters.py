@@ -7,12 +7,14 @@
 import datetime
 import re
 from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from functools import partial
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 import pywikibot
 from pywikibot import config
 from pywikibot.backports import (
+    Callable,
     Dict,
     FrozenSet,
     Iterable,
@@ -21,6 +23,7 @@ from pywikibot.backports import (
     Pattern,
     Sequence,
     Type,
+    batched,
 )
 from pywikibot.exceptions import NoPageError
 from pywikibot.proofreadpage import ProofreadPage
@@ -48,6 +51,73 @@ def _output_if(predicate: bool, msg: str) -> None:
         pywikibot.info(msg)
 
 
+# Predicate of the current worker process, set by _init_pool_worker
+_worker_predicate: Optional[Callable[[str], bool]] = None
+
+
+def _init_pool_worker(predicate: Callable[[str], bool]) -> None:
+    """Store the predicate once per worker process."""
+    global _worker_predicate
+    _worker_predicate = predicate
+
+
+def _call_pool_worker(string: str) -> bool:
+    """Evaluate the worker predicate for a single string."""
+    return bool(_worker_predicate(string))
+
+
+def _pool_filter(items: Iterable[Any],
+                 key: Callable[[Any], str],
+                 predicate: Callable[[str], bool],
+                 processes: int,
+                 chunk_size: Optional[int] = None) -> Iterator[Any]:
+    """Yield items whose key string passes predicate in a process pool.
+
+    Items are collected in chunks; the strings retrieved by *key* are
+    sent to the worker processes and the surviving items are yielded in
+    their original order. The predicate is transferred once to every
+    worker when the pool is started.
+
+    .. versionadded:: 8.6
+
+    :param items: items to be filtered, e.g. pages or dump entries
+    :param key: function to retrieve the string to be tested from an
+        item. It is called in the current process.
+    :param predicate: a callable with a string as parameter and boolean
+        as result. It must be picklable if the multiprocessing start
+        method is not *fork*.
+    :param processes: number of worker processes
+    :param chunk_size: number of strings sent to a worker at once.
+        Defaults to :ref:`config.regex_filter_chunk_size
+        <Further Settings>`.
+    """
+    if chunk_size is None:
+        chunk_size = config.regex_filter_chunk_size
+    with ProcessPoolExecutor(max_workers=processes,
+                             initializer=_init_pool_worker,
+                             initargs=(predicate, )) as executor:
+        for chunk in batched(items, chunk_size * processes):
+            results = executor.map(_call_pool_worker,
+                                   [key(item) for item in chunk],
+                                   chunksize=chunk_size)
+            for item, passed in zip(chunk, results):
+                if passed:
+                    yield item
+
+
+def _regex_match(regex: Sequence[Pattern[str]], quantifier: str,
+                 string: str) -> bool:
+    """Return True if string matches precompiled regex list.
+
+    :param quantifier: a qualifier
+    """
+    if quantifier == 'all':
+        match = all(r.search(string) for r in regex)
+    else:
+        match = any(r.search(string) for r in regex)
+    return (quantifier == 'none') ^ match
+
+
 def NamespaceFilterPageGenerator(
     generator: Iterable['pywikibot.page.Page'],
     namespaces: Union[FrozenSet['pywikibot.site.Namespace'],
@@ -246,11 +316,7 @@ class RegexFilter:
 
         :param quantifier: a qualifier
         """
-        if quantifier == 'all':
-            match = all(r.search(string) for r in regex)
-        else:
-            match = any(r.search(string) for r in regex)
-        return (quantifier == 'none') ^ match
+        return _regex_match(regex, quantifier, string)
 
     @classmethod
     def __precompile(cls: REGEX_FILTER_CLASS, regex: PATTERN_STR_OR_SEQ_TYPE,
@@ -274,7 +340,8 @@ class RegexFilter:
                     generator: Iterable['pywikibot.page.Page'],
                     regex: PATTERN_STR_OR_SEQ_TYPE,
                     quantifier: str = 'any',
-                    ignore_namespace: bool = True
+                    ignore_namespace: bool = True,
+                    processes: Optional[int] = None
                     ) -> Iterator['pywikibot.page.Page']:
         """Yield pages from another generator whose title matches regex.
 
@@ -285,6 +352,9 @@ class RegexFilter:
         .. note:: if you want to check for a match at the beginning of
            the title, you have to start the regex with "^"
 
+        .. versionchanged:: 8.6
+           *processes* parameter was added.
+
         :param generator: another generator
         :param regex: a regex which should match the page title
         :param quantifier: must be one of the following values:
@@ -292,6 +362,11 @@ class RegexFilter:
             'any' - yields page if title is matched by any regexes
             'none' - yields page if title is NOT matched by any regexes
         :param ignore_namespace: ignore the namespace when matching the title
+        :param processes: number of worker processes used to evaluate
+            the regex in parallel. Pages are still yielded in their
+            original order. If 0, the regex is evaluated in the current
+            process. Defaults to :ref:`config.regex_filter_processes
+            <Further Settings>`.
         :return: return a page depending on the matching parameters
         """
         # for backwards compatibility with compat for inverse parameter
@@ -300,6 +375,16 @@ class RegexFilter:
         elif quantifier is True:
             quantifier = 'none'
         reg = cls.__precompile(regex, re.I)
+        if processes is None:
+            processes = config.regex_filter_processes
+        if processes:
+            yield from _pool_filter(
+                generator,
+                lambda page: page.title(with_ns=not ignore_namespace),
+                partial(_regex_match, reg, quantifier),
+                processes)
+            return
+
         for page in generator:
             title = page.title(with_ns=not ignore_namespace)
             if cls.__filter_match(reg, title, quantifier):
@@ -309,15 +394,25 @@ class RegexFilter:
     def contentfilter(cls: REGEX_FILTER_CLASS,
                       generator: Iterable['pywikibot.page.Page'],
                       regex: PATTERN_STR_OR_SEQ_TYPE,
-                      quantifier: str = 'any'
+                      quantifier: str = 'any',
+                      processes: Optional[int] = None
                       ) -> Iterator['pywikibot.page.Page']:
         """Yield pages from another generator whose body matches regex.
 
         Uses regex option re.IGNORECASE depending on the quantifier parameter.
 
         For parameters see titlefilter above.
+
+        .. versionchanged:: 8.6
+           *processes* parameter was added.
         """
         reg = cls.__precompile(regex, re.IGNORECASE | re.DOTALL)
+        if processes is None:
+            processes = config.regex_filter_processes
+        if processes:
+            return _pool_filter(generator, lambda page: page.text,
+                                partial(_regex_match, reg, quantifier),
+                                processes)
         return (page for page in generator
                 if cls.__filter_match(reg, page.text, quantifier))
 
@@ -32,6 +32,7 @@ from pywikibot.backports import (
 )
 from pywikibot.comms import http
 from pywikibot.exceptions import APIError, ServerError
+from pywikibot.pagegenerators._filters import _pool_filter
 from pywikibot.site import Namespace
 from pywikibot.tools import deprecated
 from pywikibot.tools.collections import GeneratorWrapper
@@ -930,6 +931,8 @@ class XMLDumpPageGenerator(abc.Iterator):  # type: ignore[type-arg]
 
     .. versionadded:: 7.2
        the `content` parameter
+    .. versionadded:: 8.6
+       the `processes` parameter
 
     :param filename: filename of XML dump
     :param start: skip entries below that value
@@ -938,6 +941,11 @@ class XMLDumpPageGenerator(abc.Iterator):  # type: ignore[type-arg]
     :param text_predicate: a callable with entry.text as parameter and boolean
         as result to indicate the generator should return the page or not
     :param content: If True, assign old page content to Page.text
+    :param processes: number of worker processes used to evaluate
+        *text_predicate* in parallel. Pages are still yielded in dump
+        order. If 0, the predicate is evaluated in the current process.
+        Defaults to :ref:`config.regex_filter_processes
+        <Further Settings>`.
 
     :ivar skipping: True if start parameter is given, else False
     :ivar parser: holds the xmlreader.XmlDump parse method
@@ -949,10 +957,14 @@ class XMLDumpPageGenerator(abc.Iterator):  # type: ignore[type-arg]
                      Sequence[NAMESPACE_OR_STR_TYPE]] = None,
                  site: OPT_SITE_TYPE = None,
                  text_predicate: Optional[Callable[[str], bool]] = None,
-                 content=False) -> None:
+                 content=False,
+                 processes: Optional[int] = None) -> None:
         """Initializer."""
         self.text_predicate = text_predicate
         self.content = content
+        if processes is None:
+            processes = config.regex_filter_processes
+        self.processes = processes
         self.skipping = bool(start)
 
         self.start: Optional[str] = None
@@ -966,22 +978,38 @@ class XMLDumpPageGenerator(abc.Iterator):  # type: ignore[type-arg]
             self.namespaces = self.site.namespaces.resolve(namespaces)
         dump = xmlreader.XmlDump(filename, on_error=pywikibot.error)
         self.parser = dump.parse()
+        self._pages = self._generate()
 
-    def __next__(self) -> 'pywikibot.page.Page':
-        """Get next Page."""
-        while True:
-            entry = next(self.parser)
+    def _entries(self) -> Generator[Tuple['pywikibot.page.Page',
+                                          xmlreader.XmlEntry], None, None]:
+        """Yield pages and their dump entries within start and namespaces."""
+        for entry in self.parser:
             if self.skipping:
                 if entry.title < self.start:
                     continue
                 self.skipping = False
             page = pywikibot.Page(self.site, entry.title)
-            if page.namespace() not in self.namespaces:
-                continue
-            if not self.text_predicate or self.text_predicate(entry.text):
-                if self.content:
-                    page.text = entry.text
-                return page
+            if page.namespace() in self.namespaces:
+                yield page, entry
+
+    def _generate(self) -> Generator['pywikibot.page.Page', None, None]:
+        """Yield pages whose text passes the text predicate."""
+        entries = self._entries()
+        if self.text_predicate and self.processes:
+            entries = _pool_filter(entries, lambda item: item[1].text,
+                                   self.text_predicate, self.processes)
+        elif self.text_predicate:
+            entries = (item for item in entries
+                       if self.text_predicate(item[1].text))
+
+        for page, entry in entries:
+            if self.content:
+                page.text = entry.text
+            yield page
+
+    def __next__(self) -> 'pywikibot.page.Page':
+        """Get next Page."""
+        return next(self._pages)
 
 
 @deprecated('XMLDumpPageGenerator with content=True parameter', since='7.2.0')
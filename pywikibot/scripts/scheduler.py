@@ -0,0 +1,525 @@
+#!/usr/bin/env python3
+"""Run scheduled scripts from a single long-running process.
+
+The scheduler reads a job table with cron expressions and runs the
+scripts when they are due. Python, Pywikibot, the user config and the
+sites given with ``-warmup`` are loaded only once. Every job runs in a
+forked child process of the scheduler, so it starts with this warm state
+but cannot change global options, ``sys.argv`` or the config of other
+jobs. On platforms without ``os.fork`` a new interpreter is started for
+each job instead.
+
+The job table is a YAML (requires PyYAML) or JSON list of mappings. A
+job has a ``name``, a five field cron ``schedule`` (UTC) and either a
+``script`` with optional ``args`` or a Toolforge style ``command`` with
+a ``pwb.py`` call. The output of a job is appended to ``log`` which
+defaults to ``<logdir>/<name>.log``::
+
+    - name: mp-helper
+      schedule: "*/20 * * * *"
+      script: mp-helper
+      emails: onfailure
+    - name: archive-resolved-asia
+      schedule: "8 19 * * *"
+      command: python pwb.py archive-resolved-bot.py -projects:jawikipedia
+
+Like in a Toolforge jobs file, ``emails`` may be ``onfailure`` to get
+a mail if the job fails or ``onfinish`` to get a mail whenever it
+finishes; the default is ``none``.
+
+Entries without a schedule or with a command which is not a pwb.py
+call are ignored; therefore a Toolforge jobs file can be used directly.
+
+Syntax:
+
+    python pwb.py scheduler -jobs:<file> [<options>]
+
+The following parameters are supported:
+
+-jobs:<file>      The job table. This parameter is required.
+
+-workers:<num>    The number of jobs which may run at the same time.
+                  Default is 4.
+
+-logdir:<dir>     The directory for the job logs. Default is the
+                  ``logs`` directory in the base directory.
+
+-warmup:<sites>   Comma separated list of sites like ``wikipedia:de`` or
+                  ``commons`` which are loaded and logged in before the
+                  first job starts. The default site is always loaded.
+
+-run:<names>      Run the given comma separated jobs immediately and
+                  exit when they are finished instead of scheduling.
+
+-mailto:<address> The address which is notified about finished jobs. On
+                  Toolforge the default is the maintainers address of the
+                  tool.
+
+-smtp:<host>      The SMTP server used for notifications. The default is
+                  the Toolforge mail relay on Toolforge and ``localhost``
+                  elsewhere.
+
+.. versionadded:: 8.6
+"""
+#
+# (C) Pywikibot team, 2024
+#
+# Distributed under the terms of the MIT license.
+#
+import getpass
+import json
+import os
+import shlex
+import smtplib
+import subprocess
+import sys
+import time
+import traceback
+import warnings
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from email.message import EmailMessage
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import pywikibot
+from pywikibot import config
+from pywikibot.backports import Dict, List, Set, Tuple, removeprefix
+from pywikibot.bot import suggest_help
+from pywikibot.comms import http
+
+
+class CronSchedule:
+
+    """A five field cron expression.
+
+    Fields are minute, hour, day of month, month and day of week. Each
+    field may be ``*``, a number, a range ``a-b`` or a comma separated
+    list of them, optionally with a step like ``*/20``. Like cron, a job
+    is due on a day if either the day of month or the day of week
+    matches when both are restricted.
+
+    >>> schedule = CronSchedule('*/20 3 * * 1-5')
+    >>> schedule.match(datetime(2024, 1, 1, 3, 40))
+    True
+    >>> schedule.match(datetime(2024, 1, 6, 3, 40))
+    False
+    """
+
+    #: valid (low, high) values of each field
+    ranges = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+    def __init__(self, expression: str) -> None:
+        """Initializer.
+
+        :raises ValueError: invalid cron expression
+        """
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(
+                f'cron expression {expression!r} must have five fields')
+        self.expression = expression
+        (self.minutes, self.hours, self.days, self.months,
+         weekdays) = (self._parse(field, *limits)
+                      for field, limits in zip(fields, self.ranges))
+        self.weekdays = {day % 7 for day in weekdays}  # 0 and 7 are Sunday
+        self.any_day = '*' in (fields[2], fields[4])
+
+    @staticmethod
+    def _parse(field: str, low: int, high: int) -> Set[int]:
+        """Return the values of a single cron field."""
+        values = set()
+        for part in field.split(','):
+            span, sep, step = part.partition('/')
+            try:
+                step = int(step) if sep else 1
+                if span == '*':
+                    start, stop = low, high
+                elif '-' in span:
+                    start, stop = map(int, span.split('-'))
+                else:
+                    start = int(span)
+                    stop = high if sep else start
+            except ValueError:
+                raise ValueError(f'invalid cron field {field!r}') from None
+
+            if step < 1 or not low <= start <= stop <= high:
+                raise ValueError(f'invalid cron field {field!r}')
+            values.update(range(start, stop + 1, step))
+        return values
+
+    def match(self, when: datetime) -> bool:
+        """Return True if the schedule is due at the given minute."""
+        if (when.minute not in self.minutes or when.hour not in self.hours
+                or when.month not in self.months):
+            return False
+        day = when.day in self.days
+        weekday = when.isoweekday() % 7 in self.weekdays
+        return day and weekday if self.any_day else day or weekday
+
+    def __repr__(self) -> str:
+        """Return representation string."""
+        return f'{type(self).__name__}({self.expression!r})'
+
+
+class Job(NamedTuple):
+
+    """A scheduled script."""
+
+    name: str
+    schedule: CronSchedule
+    script: str
+    args: Tuple[str, ...] = ()
+    log: Optional[str] = None
+    emails: str = 'none'
+
+
+def parse_command(command: str) -> Tuple[str, List[str]]:
+    """Return the script and its arguments of a pwb.py command line.
+
+    >>> parse_command('python bot/pwb.py bot-stats.py -always')
+    ('bot-stats.py', ['-always'])
+
+    :raises ValueError: *command* does not call pwb.py
+    """
+    tokens = shlex.split(command)
+    pwb_indexes = [index for index, token in enumerate(tokens)
+                   if Path(token).name in ('pwb', 'pwb.py')]
+    if not pwb_indexes or pwb_indexes[-1] + 1 >= len(tokens):
+        raise ValueError(f'{command!r} is not a pwb.py command')
+    index = pwb_indexes[-1] + 1
+    return tokens[index], tokens[index + 1:]
+
+
+def load_jobs(filename: str) -> List[Job]:
+    """Read the job table.
+
+    :param filename: a YAML file if its suffix is ``.yaml`` or ``.yml``,
+        a JSON file otherwise
+    :raises ImportError: PyYAML is required but not installed
+    :raises ValueError: a job has an invalid schedule
+    """
+    with open(filename, encoding='utf-8') as f:
+        if Path(filename).suffix in ('.yaml', '.yml'):
+            import yaml
+            entries = yaml.safe_load(f)
+        else:
+            entries = json.load(f)
+
+    jobs = []
+    for entry in entries or []:
+        name = entry['name']
+        if 'schedule' not in entry:
+            pywikibot.log(f'Job {name!r} has no schedule; ignored')
+            continue
+
+        if 'script' in entry:
+            script, args = entry['script'], entry.get('args', [])
+            if isinstance(args, str):
+                args = shlex.split(args)
+        else:
+            try:
+                script, args = parse_command(entry.get('command', ''))
+            except ValueError:
+                pywikibot.log(f'Job {name!r} is not a pwb.py command; ignored')
+                continue
+
+        if not script.endswith('.py'):
+            script += '.py'
+        emails = entry.get('emails', 'none')
+        if emails not in ('none', 'onfailure', 'onfinish', 'all'):
+            raise ValueError(f'Job {name!r} has invalid emails {emails!r}')
+        jobs.append(Job(name, CronSchedule(entry['schedule']), script,
+                        tuple(args), entry.get('log'), emails))
+    return jobs
+
+
+class _ForkedJob:
+
+    """A job running in a forked child process.
+
+    It provides the :meth:`poll` interface of :class:`subprocess.Popen`.
+    """
+
+    def __init__(self, pid: int) -> None:
+        """Initializer."""
+        self.pid = pid
+        self.returncode: Optional[int] = None
+
+    def poll(self) -> Optional[int]:
+        """Return the exit code or None if the job is still running."""
+        if self.returncode is None:
+            pid, status = os.waitpid(self.pid, os.WNOHANG)
+            if pid:
+                self.returncode = (os.WEXITSTATUS(status)
+                                   if os.WIFEXITED(status)
+                                   else -os.WTERMSIG(status))
+        return self.returncode
+
+
+def _run_job(job: Job, filename: str) -> int:
+    """Run a job in the current process and return its exit code."""
+    from pywikibot.scripts.wrapper import run_python_file
+
+    print(f'### {job.name} started at {datetime.now(timezone.utc):%c} UTC: '
+          f'{filename} {" ".join(map(shlex.quote, job.args))}', flush=True)
+    # connections of the scheduler must not be shared with the job
+    http.session.close()
+    with warnings.catch_warnings():
+        # the warm sites were created before the job handles its arguments
+        warnings.filterwarnings('ignore', 'Site objects have been created',
+                                UserWarning)
+        try:
+            run_python_file(filename, list(job.args))
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            print(e.code, file=sys.stderr)
+            return 1
+        except BaseException:
+            traceback.print_exc()
+            return 1
+        finally:
+            # wait for asynchronous page saves
+            pywikibot.page_put_queue.join()
+    return 0
+
+
+class Scheduler:
+
+    """Run due jobs on a bounded number of worker processes."""
+
+    def __init__(self, jobs: List[Job], *, workers: int = 4,
+                 logdir: Optional[str] = None,
+                 mailto: Optional[str] = None,
+                 smtp: Optional[str] = None) -> None:
+        """Initializer.
+
+        :param mailto: the address which is notified about failed jobs;
+            defaults to the maintainers of the tool on Toolforge
+        :param smtp: the SMTP server for notifications; defaults to the
+            Toolforge mail relay on Toolforge, ``localhost`` otherwise
+        """
+        self.jobs = jobs
+        self.workers = workers
+        self.logdir = logdir or config.datafilepath('logs')
+        user = getpass.getuser()
+        on_toolforge = user.startswith('tools.')
+        if mailto is None and on_toolforge:
+            mailto = (removeprefix(user, 'tools.')
+                      + '.maintainers@toolforge.org')
+        self.mailto = mailto
+        self.smtp = smtp or ('mail.tools.wmcloud.org' if on_toolforge
+                             else 'localhost')
+        self.pending: deque = deque()
+        self.running: Dict[str, Tuple[Job, object, datetime]] = {}
+        #: exit code of the last run of each job
+        self.exit_codes: Dict[str, int] = {}
+
+    def log_file(self, job: Job) -> str:
+        """Return the log file of a job."""
+        return job.log or os.path.join(self.logdir, job.name + '.log')
+
+    def submit(self, job: Job) -> None:
+        """Queue a job unless it is still queued or running."""
+        if job.name in self.running or job in self.pending:
+            pywikibot.warning(f'Job {job.name} is still running; skipped')
+            return
+        self.pending.append(job)
+
+    def start_pending(self) -> None:
+        """Start queued jobs while workers are free."""
+        while self.pending and len(self.running) < self.workers:
+            job = self.pending.popleft()
+            from pywikibot.scripts.wrapper import find_filename
+            filename = find_filename(job.script)
+            if filename is None:
+                msg = f'Script {job.script} of job {job.name} not found'
+                pywikibot.error(msg)
+                self.exit_codes[job.name] = 127
+                self.notify(job, 127, msg)
+                continue
+            pywikibot.info(f'Starting job {job.name}')
+            self.running[job.name] = (job, self._start(job, filename),
+                                      datetime.now())
+
+    def _start(self, job: Job, filename: str):
+        """Start a job in a child process and return its handle."""
+        logfile = self.log_file(job)
+        Path(logfile).parent.mkdir(parents=True, exist_ok=True)
+        with open(logfile, 'a', encoding='utf-8') as log:
+            if not hasattr(os, 'fork'):
+                return subprocess.Popen(
+                    [sys.executable, '-m', 'pywikibot.scripts.wrapper',
+                     filename, *job.args],
+                    stdout=log, stderr=subprocess.STDOUT)
+
+            sys.stdout.flush()
+            sys.stderr.flush()
+            pid = os.fork()
+            if pid:
+                return _ForkedJob(pid)
+
+            # child process
+            code = 1
+            try:
+                os.dup2(log.fileno(), sys.stdout.fileno())
+                os.dup2(log.fileno(), sys.stderr.fileno())
+                code = _run_job(job, filename)
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(code)
+
+    def reap(self) -> None:
+        """Collect the exit codes of finished jobs."""
+        for name, (job, handle, start) in list(self.running.items()):
+            code = handle.poll()
+            if code is None:
+                continue
+            del self.running[name]
+            self.exit_codes[name] = code
+            msg = (f'Job {name} finished with exit code {code} after '
+                   f'{datetime.now() - start}')
+            with open(self.log_file(job), 'a', encoding='utf-8') as log:
+                print(f'### {msg}', file=log)
+            if code:
+                pywikibot.warning(msg)
+            else:
+                pywikibot.info(msg)
+            self.notify(job, code, msg)
+
+    def notify(self, job: Job, code: int, msg: str) -> None:
+        """Send a mail about a finished job if its *emails* setting asks.
+
+        Like the Toolforge jobs framework, ``onfailure`` sends a mail if
+        the job failed, ``onfinish`` and ``all`` whenever it finished.
+        The end of the job log is added to the mail.
+        """
+        if job.emails == 'none' or job.emails == 'onfailure' and not code:
+            return
+        if not self.mailto:
+            pywikibot.warning(f'No -mailto address; cannot send a mail '
+                              f'about job {job.name}')
+            return
+
+        try:
+            with open(self.log_file(job), encoding='utf-8',
+                      errors='replace') as log:
+                tail = ''.join(deque(log, maxlen=50))
+        except OSError:
+            tail = ''
+        mail = EmailMessage()
+        mail['Subject'] = f'[scheduler] {msg}'
+        mail['From'] = self.mailto
+        mail['To'] = self.mailto
+        mail.set_content(f'{msg}\n\nEnd of {self.log_file(job)}:\n\n{tail}')
+        try:
+            with smtplib.SMTP(self.smtp, timeout=30) as smtp:
+                smtp.send_message(mail)
+        except (OSError, smtplib.SMTPException) as e:
+            pywikibot.error(f'Could not send a mail about job {job.name}: '
+                            f'{e}')
+
+    def run_now(self, names: List[str]) -> int:
+        """Run the given jobs immediately and wait for them.
+
+        :return: the highest exit code of the jobs
+        """
+        jobs = {job.name: job for job in self.jobs}
+        for name in names:
+            if name in jobs:
+                self.submit(jobs[name])
+            else:
+                pywikibot.error(f'Unknown job {name}')
+                self.exit_codes[name] = 127
+        while self.pending or self.running:
+            self.start_pending()
+            time.sleep(1)
+            self.reap()
+        return max(self.exit_codes.values(), default=0)
+
+    def submit_due(self, last: datetime, now: datetime) -> datetime:
+        """Queue the jobs which are due after minute *last* up to *now*.
+
+        Every minute in between is checked, so no job is missed if the
+        scheduler was stalled for more than a minute.
+
+        :return: the last checked minute
+        """
+        minute = last + timedelta(minutes=1)
+        while minute <= now:
+            for job in self.jobs:
+                if job.schedule.match(minute):
+                    self.submit(job)
+            last = minute
+            minute += timedelta(minutes=1)
+        return last
+
+    def run(self) -> None:
+        """Start the jobs when they are due; run forever."""
+        pywikibot.info(f'Scheduling {len(self.jobs)} jobs with '
+                       f'{self.workers} workers')
+        now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+        last_checked = now - timedelta(minutes=1)
+        while True:
+            now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+            last_checked = self.submit_due(last_checked, now)
+            next_minute = now + timedelta(minutes=1)
+            while datetime.now(timezone.utc) < next_minute:
+                self.reap()
+                self.start_pending()
+                time.sleep(1)
+
+
+def warmup(sites: List[str]) -> None:
+    """Load and log in the default site and the given sites."""
+    for site in [None] + sites:
+        try:
+            site = pywikibot.Site(site)
+            site.login()
+        except Exception as e:
+            pywikibot.warning(f'Could not warm up site {site}: {e}')
+
+
+def main(*args: str) -> None:
+    """Process command line arguments and run the scheduler.
+
+    :param args: command line arguments
+    """
+    jobfile = None
+    options = {}
+    sites: List[str] = []
+    run = []
+    unknown = []
+    for arg in pywikibot.handle_args(args):
+        opt, _, value = arg.partition(':')
+        opt = removeprefix(opt, '-')
+        if opt == 'jobs' and value:
+            jobfile = value
+        elif opt == 'workers' and value.isdigit():
+            options['workers'] = int(value)
+        elif opt == 'logdir' and value:
+            options['logdir'] = value
+        elif opt == 'warmup' and value:
+            sites = [site for site in value.split(',') if site]
+        elif opt in ('mailto', 'smtp') and value:
+            options[opt] = value
+        elif opt == 'run' and value:
+            run = [name for name in value.split(',') if name]
+        else:
+            unknown.append(arg)
+
+    if suggest_help(missing_parameters=[] if jobfile else ['-jobs'],
+                    unknown_parameters=unknown):
+        return
+
+    scheduler = Scheduler(load_jobs(jobfile), **options)
+    warmup(sites)
+    if run:
+        sys.exit(scheduler.run_now(run))
+    scheduler.run()
+
+
+if __name__ == '__main__':
+    main()
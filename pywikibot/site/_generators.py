@@ -95,7 +95,8 @@ class GeneratorsMixin:
         pageprops: bool = False,
         categories: bool = False,
         content: bool = True,
-        quiet: bool = True
+        quiet: bool = True,
+        protection: bool = False
     ):
         """Return a generator to a list of preloaded pages.
 
@@ -111,6 +112,8 @@ class GeneratorsMixin:
            *groupsize* is maxlimit by default. *quiet* parameter was
            added. No longer show the "Retrieving pages from site"
            message by default.
+        .. versionchanged:: 8.6
+           *protection* parameter was added.
 
         :param pagelist: an iterable that returns Page objects
         :param groupsize: how many Pages to query at a time. If None
@@ -126,6 +129,9 @@ class GeneratorsMixin:
         :param content: preload page content
         :param quiet: If True (default), do not show the "Retrieving
             pages" message
+        :param protection: preload the page protection which is used by
+            :meth:`BasePage.has_permission()
+            <pywikibot.page.BasePage.has_permission>`
         """
         props = 'revisions|info|categoryinfo'
         if templates:
@@ -163,6 +169,8 @@ class GeneratorsMixin:
             else:
                 rvgen.request['titles'] = list(cache.keys())
             rvgen.request['rvprop'] = self._rvprops(content=content)
+            if protection:
+                rvgen.request['inprop'] = 'protection'
             if not quiet:
                 pywikibot.info(f'Retrieving {len(cache)} pages from {self}.')
 
@@ -1709,6 +1717,41 @@ class GeneratorsMixin:
                 'ususers': usernames, 'usprop': usprop})
         return usgen
 
+    def preloadusers(
+        self,
+        userlist: Iterable['pywikibot.User'],
+        *,
+        groupsize: Optional[int] = None
+    ) -> Generator['pywikibot.User', None, None]:
+        """Return a generator to a list of users with preloaded properties.
+
+        Users are iterated in the same order than in the underlying
+        userlist. Their properties are retrieved with :meth:`users` in
+        batches and stored in the User objects, so that
+        :meth:`User.editCount()<pywikibot.User.editCount>`,
+        :meth:`User.registration()<pywikibot.User.registration>` and
+        :meth:`User.groups()<pywikibot.User.groups>` need no further
+        request. IP addresses are not preloaded.
+
+        .. versionadded:: 8.6
+
+        :param userlist: an iterable that returns User objects
+        :param groupsize: how many users to query at a time. If None
+            (default), :attr:`maxlimit
+            <pywikibot.site._apisite.APISite.maxlimit>` is used.
+        """
+        groupsize = min(groupsize or self.maxlimit, self.maxlimit)
+        for batch in batched(userlist, groupsize):
+            usernames = list(dict.fromkeys(
+                user.username for user in batch if not user.isAnonymous()))
+            props = {}
+            if usernames:
+                props = {item['name']: item for item in self.users(usernames)}
+            for user in batch:
+                if user.username in props:
+                    user._userprops = props[user.username]
+                yield user
+
     def randompages(self, total: Optional[int] = None, namespaces=None,
                     redirects: Optional[bool] = False, content: bool = False):
         """Iterate a number of random pages.
@@ -1,21 +1,96 @@
 """Objects representing API upload to MediaWiki site."""
 #
-# (C) Pywikibot team, 2009-2023
+# (C) Pywikibot team, 2009-2024
 #
 # Distributed under the terms of the MIT license.
 #
+import hashlib
 import mimetypes
 import os
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from warnings import warn
 
 import pywikibot
+from pywikibot import config
+from pywikibot.backports import nullcontext
 from pywikibot.exceptions import APIError, Error, UploadError
 from pywikibot.tools import compute_file_hash
 
 
-__all__ = ('Uploader', )
+__all__ = ('ChunkReader', 'Uploader')
+
+
+class ChunkReader:
+
+    """Read chunks of a file ahead and hash them in the same pass.
+
+    While a chunk is uploaded the next chunk is read in a background
+    thread. At most two chunks are kept in memory. Chunks which
+    continue the already hashed part of the file are added to the
+    *digest*.
+
+    .. versionadded:: 8.6
+
+    :param file: a file object opened in binary mode
+    :param chunk_size: the size of the chunks in bytes
+    :param digest: a hash object which contains the first *hashed*
+        bytes of the file
+    :param hashed: number of bytes already added to *digest*
+    """
+
+    def __init__(self, file, chunk_size: int, *,
+                 digest=None, hashed: int = 0) -> None:
+        """Initializer."""
+        self.file = file
+        self.chunk_size = chunk_size
+        self.digest = digest or hashlib.sha1()
+        self.hashed = hashed
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._ahead = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _read(self, offset: int) -> bytes:
+        """Read a chunk and update the digest."""
+        self.file.seek(offset)
+        chunk = self.file.read(self.chunk_size)
+        if offset == self.hashed:
+            self.digest.update(chunk)
+            self.hashed += len(chunk)
+        return chunk
+
+    def read(self, offset: int) -> bytes:
+        """Return the chunk at offset and start reading the next one."""
+        chunk = None
+        if self._ahead:
+            ahead, future = self._ahead
+            # always wait for the read ahead, it moves the file position
+            chunk = future.result()
+            if ahead != offset:
+                chunk = None
+        if chunk is None:
+            chunk = self._read(offset)
+
+        self._ahead = None
+        if len(chunk) == self.chunk_size:
+            offset += len(chunk)
+            self._ahead = offset, self._executor.submit(self._read, offset)
+        return chunk
+
+    def hexdigest(self, size: int) -> Optional[str]:
+        """Return the hash of the file if its *size* bytes were read."""
+        return self.digest.hexdigest() if self.hashed == size else None
+
+    def close(self) -> None:
+        """Stop reading ahead."""
+        self._executor.shutdown()
+        self._ahead = None
 
 
 class Uploader:
@@ -38,7 +113,9 @@ class Uploader:
     :param chunk_size: The chunk size in bytes for chunked uploading
         (see :api:`Upload#Chunked_uploading`). It will only upload in
         chunks, if the chunk size is positive but lower than the file
-        size.
+        size. If it is 0, ``config.upload_chunk_size`` is used, which
+        is 0 by default. Chunks are read ahead by :class:`ChunkReader`
+        and only two chunks are held in memory.
     :param asynchronous: Make potentially large file operations
         asynchronous on the server side when possible.
     :param ignore_warnings: It may be a static boolean, a callable
@@ -57,6 +134,12 @@ class Uploader:
         raise an UploadError if a warning occurred. If it's None
         (default) it'll be True if ignore_warnings is a bool and False
         otherwise. If it's True or None ignore_warnings must be a bool.
+
+    .. versionchanged:: 8.6
+       large files are uploaded in chunks by default; chunks are read
+       ahead and the SHA1 of a chunked upload is
+       computed while reading; it is kept in :attr:`sha1` and compared
+       with the SHA1 of the published file.
     """
 
     upload_warnings = {
@@ -114,6 +197,9 @@ class Uploader:
         self.filename = source_filename
         self.url = source_url
 
+        #: SHA1 of the file computed during a chunked upload
+        self.sha1: Optional[str] = None
+
     def upload(self) -> bool:
         """Check for required parameters to upload and run the job.
 
@@ -192,6 +278,7 @@ class Uploader:
         # file size if the offset is an int. If offset is False if
         # verifies that the file size match with the local file.
         verify_stash = False
+        digest = hashlib.sha1()
         if self.filename and file_key:
             assert offset is False or file_size is not None
             verify_stash = True
@@ -231,7 +318,9 @@ class Uploader:
                 # The SHA1 was also requested so calculate and compare it
                 assert 'sha1' in stash_info, \
                     f'sha1 not in stash info: {stash_info}'
-                sha1 = compute_file_hash(self.filename, bytes_to_read=offset)
+                # keep the hash object to continue it with the chunks
+                sha1 = compute_file_hash(self.filename, lambda: digest,
+                                         bytes_to_read=offset)
                 if sha1 != stash_info['sha1']:
                     raise ValueError(
                         'The SHA1 of {} bytes of the stashed "{}" is {} '
@@ -264,8 +353,13 @@ class Uploader:
             # upload local file
             throttle = True
             filesize = os.path.getsize(self.filename)
-            chunked_upload = 0 < self.chunk_size < filesize
-            with open(self.filename, 'rb') as f:
+            chunk_size = self.chunk_size or config.upload_chunk_size
+            chunked_upload = 0 < chunk_size < filesize
+            # the file is read ahead by a ChunkReader for chunks only
+            with open(self.filename, 'rb') as f, \
+                    (ChunkReader(f, chunk_size, digest=digest,
+                                 hashed=offset if verify_stash else 0)
+                     if chunked_upload else nullcontext()) as reader:
                 final_request = self.site._request(
                     throttle=throttle, parameters={
                         'action': 'upload', 'token': token, 'text': self.text,
@@ -285,13 +379,12 @@ class Uploader:
                                 filekey=file_key,
                                 checkstatus=True)
                         else:
-                            f.seek(offset)
-                            chunk = f.read(self.chunk_size)
+                            chunk = reader.read(offset)
                             # workaround (hack) for T132676
                             # append another '\r' so that one is the payload
                             # and the second is used for newline when mangled
                             # by email package.
-                            if (len(chunk) < self.chunk_size
+                            if (len(chunk) < chunk_size
                                     or (offset + len(chunk)) == filesize
                                     and chunk[-1] == b'\r'[0]):
                                 chunk += b'\r'
@@ -405,6 +498,7 @@ class Uploader:
                                           'assemble chunks.')
                         elif data['result'] == 'Success':  # finished
                             pywikibot.log('Finished uploading last chunk.')
+                            self.sha1 = reader.hexdigest(filesize)
                             final_request['filekey'] = file_key
                             final_request['async'] = self.asynchronous
                             break
@@ -520,7 +614,14 @@ class Uploader:
                 # If we receive a nochange, that would mean we're in simulation
                 # mode, don't attempt to access imageinfo
                 if 'nochange' not in result:
-                    self.filepage._load_file_revisions([result['imageinfo']])
+                    imageinfo = result['imageinfo']
+                    if self.sha1 and imageinfo.get('sha1',
+                                                   self.sha1) != self.sha1:
+                        pywikibot.warning(
+                            'The SHA1 {} of the uploaded file differs from '
+                            'the local file {}'
+                            .format(imageinfo['sha1'], self.sha1))
+                    self.filepage._load_file_revisions([imageinfo])
                 return True
 
             raise Error(
@@ -74,7 +74,8 @@ class UploadRobot(BaseBot):
             True to abort on any warning.
         :param chunk_size: Upload the file in chunks (more overhead, but
             restartable) specified in bytes. If no value is specified the file
-            will be uploaded as whole.
+            will be uploaded as whole unless ``config.upload_chunk_size``
+            is set and the file is larger than it.
         :param asynchronous: Make potentially large file operations
             asynchronous on the server side when possible.
         :param filename_prefix: Specify prefix for the title of every
@@ -6,9 +6,11 @@
 #
 import itertools
 import re
+from bisect import bisect_left
 from collections import OrderedDict, namedtuple
 from collections.abc import Sequence
 from contextlib import suppress
+from functools import lru_cache
 from html.parser import HTMLParser
 from typing import NamedTuple, Optional, Union
 
@@ -41,7 +43,10 @@ from pywikibot.userinterfaces.transliteration import NON_LATIN_DIGITS
 try:
     import wikitextparser
 except ImportError:
-    import mwparserfromhell as wikitextparser
+    try:
+        import mwparserfromhell as wikitextparser
+    except ImportError:
+        wikitextparser = None
 
 
 ETPType = List[Tuple[str, OrderedDictType[str, str]]]
@@ -380,6 +385,232 @@ def get_regexes(
     return result
 
 
+SpanType = Tuple[int, int]
+
+
+class WikitextLexer:
+
+    """Tokenize a wikitext once into spans of its markup parts.
+
+    The matches of the regexes known by :func:`get_regexes` like
+    ``comment``, ``nowiki``, ``pre``, ``syntaxhighlight``, ``template``,
+    ``link``, ``header`` or ``table`` are scanned at most once per text
+    and kept by the lexer. :func:`removeDisabledParts`,
+    :func:`replaceExcept`, :func:`isDisabled`, :func:`extract_sections`,
+    :func:`getCategoryLinks`, :func:`getLanguageLinks` and
+    :func:`extract_templates_and_params` accept a lexer with their
+    *lexer* parameter and reuse these spans instead of re-scanning the
+    text. Use :meth:`for_text` to get a lexer cached for a text:
+
+    >>> text = 'a<!-- b -->c<nowiki>d</nowiki>e'
+    >>> lexer = WikitextLexer.for_text(text)
+    >>> lexer.spans('comment')
+    [(1, 11)]
+    >>> lexer.is_disabled(5)
+    True
+    >>> removeDisabledParts(text, lexer=lexer)
+    'ace'
+
+    .. note:: Spans are always related to the text the lexer was
+       created for. The result of a text processing function may differ
+       from the regex based implementation in pathological cases where
+       removing one disabled part creates another one.
+
+    .. versionadded:: 8.6
+    """
+
+    #: Number of lexers kept by :meth:`for_text`
+    cache_size = 16
+
+    _cache: OrderedDictType[
+        Tuple[str, Optional['pywikibot.site.BaseSite']],
+        'WikitextLexer'] = OrderedDict()
+
+    def __init__(self, text: str,
+                 site: Optional['pywikibot.site.BaseSite'] = None) -> None:
+        """Initializer.
+
+        :param text: the wikitext to be tokenized
+        :param site: a BaseSite object needed for ``category``, ``file``,
+            ``interwiki``, ``invoke`` and ``property`` keys
+        """
+        self.text = text
+        self.site = site
+        self._matches: Dict[Union[str, Pattern[str]], List[Match[str]]] = {}
+        self._disabled: Dict[Tuple[Union[str, Pattern[str]], ...],
+                             List[SpanType]] = {}
+        self._stripped: Dict[Tuple[Union[str, Pattern[str]], ...], str] = {}
+
+    @classmethod
+    def for_text(cls, text: str,
+                 site: Optional['pywikibot.site.BaseSite'] = None
+                 ) -> 'WikitextLexer':
+        """Return a cached lexer for the given text and site.
+
+        The most recently used :attr:`cache_size` lexers are kept.
+        """
+        key = (text, site)
+        lexer = cls._cache.get(key)
+        if lexer is None:
+            lexer = cls._cache[key] = cls(text, site)
+            while len(cls._cache) > cls.cache_size:
+                cls._cache.popitem(last=False)
+        else:
+            cls._cache.move_to_end(key)
+        return lexer
+
+    def check(self, text: str,
+              site: Optional['pywikibot.site.BaseSite'] = None) -> None:
+        """Verify that the lexer was created for the given text and site.
+
+        :param text: the text passed to a text processing function
+        :param site: the site passed to a text processing function; it
+            is not verified if None
+        :raises ValueError: lexer was created for another text or site
+        """
+        if self.text is not text and self.text != text:
+            raise ValueError('lexer was created for a different text')
+        if site is not None and site != self.site:
+            raise ValueError(
+                f'lexer was created for site {self.site} but {site} is given')
+
+    def matches(self, key: Union[str, Pattern[str]]) -> List[Match[str]]:
+        """Return all matches of a regex key ordered by their start.
+
+        :param key: a key of :func:`get_regexes` or a compiled regex
+        """
+        if key not in self._matches:
+            regexes = get_regexes(key, self.site)
+            if len(regexes) == 1:
+                found = list(regexes[0].finditer(self.text))
+            else:
+                # tag aliases like source and syntaxhighlight
+                found = sorted(
+                    itertools.chain.from_iterable(
+                        regex.finditer(self.text) for regex in regexes),
+                    key=lambda match: match.start())
+            self._matches[key] = found
+        return self._matches[key]
+
+    def spans(self, keys: Union[str, Pattern[str],
+                                Iterable[Union[str, Pattern[str]]]]
+              ) -> List[SpanType]:
+        """Return the spans of all matches of the given keys.
+
+        :param keys: a single key or an iterable of keys of
+            :func:`get_regexes` or compiled regexes
+        :return: (start, end) tuples ordered by start
+        """
+        if isinstance(keys, str) or not hasattr(keys, '__iter__'):
+            keys = [keys]
+        return sorted(match.span()
+                      for key in keys for match in self.matches(key))
+
+    @staticmethod
+    def _disabled_tags(tags: Optional[Iterable] = None,
+                       include: Optional[Container] = None
+                       ) -> Tuple[Union[str, Pattern[str]], ...]:
+        """Return the tags used by :func:`removeDisabledParts`."""
+        if not tags:
+            tags = ['comment', 'includeonly', 'nowiki', 'pre',
+                    'syntaxhighlight']
+        if include:
+            tags = [tag for tag in tags if tag not in include]
+        return tuple(tags)
+
+    def disabled_spans(self, tags: Optional[Iterable] = None,
+                       include: Optional[Container] = None
+                       ) -> List[SpanType]:
+        """Return the spans of the parts where wiki markup is disabled.
+
+        The tags are handled in the given order like
+        :func:`removeDisabledParts` does: the text parts found for a tag
+        are masked before the next tag is scanned.
+
+        :param tags: the parts to be found; see
+            :func:`removeDisabledParts`
+        :param include: default parts that shall not be found
+        :return: (start, end) tuples ordered by start; spans of
+            different tags may overlap.
+        """
+        tags = self._disabled_tags(tags, include)
+        if tags not in self._disabled:
+            spans: List[SpanType] = []
+            text = self.text
+            for i, tag in enumerate(tags):
+                if not spans:
+                    found = self.spans(tag)
+                else:
+                    found = [match.span()
+                             for regex in get_regexes(tag, self.site)
+                             for match in regex.finditer(text)]
+                spans.extend(found)
+                if found and i + 1 < len(tags):
+                    text = self._mask(text, found)
+            spans.sort()
+            self._disabled[tags] = spans
+        return self._disabled[tags]
+
+    @staticmethod
+    def _mask(text: str, spans: Iterable[SpanType]) -> str:
+        """Replace the spans of text by the same number of NUL chars."""
+        chars = list(text)
+        for start, end in spans:
+            chars[start:end] = '\0' * (end - start)
+        return ''.join(chars)
+
+    @staticmethod
+    def merge(spans: Iterable[SpanType]) -> List[SpanType]:
+        """Merge overlapping spans.
+
+        >>> WikitextLexer.merge([(0, 3), (2, 5), (5, 6), (8, 9)])
+        [(0, 5), (5, 6), (8, 9)]
+
+        :param spans: (start, end) tuples ordered by start
+        """
+        merged: List[SpanType] = []
+        for start, end in spans:
+            if merged and start < merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return merged
+
+    def remove(self, spans: Iterable[SpanType]) -> str:
+        """Return the text without the given spans.
+
+        :param spans: (start, end) tuples ordered by start
+        """
+        parts = []
+        index = 0
+        for start, end in self.merge(spans):
+            parts.append(self.text[index:start])
+            index = end
+        parts.append(self.text[index:])
+        return ''.join(parts)
+
+    def remove_disabled_parts(self, tags: Optional[Iterable] = None,
+                              include: Optional[Container] = None) -> str:
+        """Return the text without disabled parts.
+
+        The result is cached; for parameters see
+        :func:`removeDisabledParts`.
+        """
+        tags = self._disabled_tags(tags, include)
+        if tags not in self._stripped:
+            self._stripped[tags] = self.remove(self.disabled_spans(tags))
+        return self._stripped[tags]
+
+    def is_disabled(self, index: int, tags: Optional[Iterable] = None) -> bool:
+        """Return True if text[index] is disabled.
+
+        For parameters see :func:`isDisabled`.
+        """
+        return any(start < index < end
+                   for start, end in self.disabled_spans(tags))
+
+
 def replaceExcept(text: str,
                   old: Union[str, Pattern[str]],
                   new: Union[str, Callable[[Match[str]], str]],
@@ -388,7 +619,9 @@ def replaceExcept(text: str,
                   allowoverlap: bool = False,
                   marker: str = '',
                   site: Optional['pywikibot.site.BaseSite'] = None,
-                  count: int = 0) -> str:
+                  count: int = 0,
+                  *,
+                  lexer: Optional[WikitextLexer] = None) -> str:
     """
     Return text with *old* replaced by *new*, ignoring specified types of text.
 
@@ -412,7 +645,18 @@ def replaceExcept(text: str,
         if nothing is changed, it is added at the end
     :param count: how many replacements to do at most. See parameter
         *count* of ``re.sub()``.
+    :param lexer: a :class:`WikitextLexer` of *text*. The exceptions
+        are taken from its spans of the original text instead of being
+        searched again after each replacement.
+    :raises ValueError: *lexer* was created for another text or for
+        another site than *site*
+
+    .. versionchanged:: 8.6
+       *lexer* parameter was added.
     """
+    if lexer is not None:
+        lexer.check(text, site)
+
     # if we got a string, compile it as a regular expression
     if isinstance(old, str):
         old = re.compile(old, flags=re.IGNORECASE if caseInsensitive else 0)
@@ -421,7 +665,13 @@ def replaceExcept(text: str,
     if not old.search(text):
         return text + marker
 
-    dontTouchRegexes = get_regexes(exceptions, site)
+    if lexer is None:
+        dontTouchRegexes = get_regexes(exceptions, site)
+    else:
+        exception_spans = lexer.spans(exceptions)
+        exception_starts = [start for start, _ in exception_spans]
+        # length difference between the current and the original text
+        delta = 0
 
     index = 0
     replaced = 0
@@ -436,19 +686,24 @@ def replaceExcept(text: str,
             break
 
         # check which exception will occur next.
-        nextExceptionMatch = None
-        for dontTouchR in dontTouchRegexes:
-            excMatch = dontTouchR.search(text, index)
-            if excMatch and (
-                    nextExceptionMatch is None
-                    or excMatch.start() < nextExceptionMatch.start()):
-                nextExceptionMatch = excMatch
-
-        if nextExceptionMatch is not None \
-                and nextExceptionMatch.start() <= match.start():
+        if lexer is None:
+            nextException = None
+            for dontTouchR in dontTouchRegexes:
+                excMatch = dontTouchR.search(text, index)
+                if excMatch and (nextException is None
+                                 or excMatch.start() < nextException[0]):
+                    nextException = excMatch.span()
+        else:
+            i = bisect_left(exception_starts, index - delta)
+            nextException = None
+            if i < len(exception_spans):
+                start, end = exception_spans[i]
+                nextException = start + delta, end + delta
+
+        if nextException is not None and nextException[0] <= match.start():
             # an HTML comment or text in nowiki tags stands before the next
             # valid match. Skip.
-            index = nextExceptionMatch.end()
+            index = nextException[1]
             continue
 
         # We found a valid match. Replace it.
@@ -487,6 +742,8 @@ def replaceExcept(text: str,
             replacement += new[last:]
 
         text = text[:match.start()] + replacement + text[match.end():]
+        if lexer is not None:
+            delta += len(replacement) - (match.end() - match.start())
 
         # continue the search on the remaining text
         if allowoverlap:
@@ -507,7 +764,9 @@ def replaceExcept(text: str,
 def removeDisabledParts(text: str,
                         tags: Optional[Iterable] = None,
                         include: Optional[Container] = None,
-                        site: Optional['pywikibot.site.BaseSite'] = None
+                        site: Optional['pywikibot.site.BaseSite'] = None,
+                        *,
+                        lexer: Optional[WikitextLexer] = None
                         ) -> str:
     """
     Return text without portions where wiki markup is disabled.
@@ -523,6 +782,8 @@ def removeDisabledParts(text: str,
     .. versionchanged:: 7.0
        the order of removals will correspond to the tags argument
        if provided as an ordered collection (list, tuple)
+    .. versionchanged:: 8.6
+       *lexer* parameter was added.
 
     :param tags: The exact set of parts which should be removed using
         keywords from :func:`get_regexes`.
@@ -530,8 +791,16 @@ def removeDisabledParts(text: str,
         be removed.
     :param site: Site to be used for site-dependent regexes. Default
         disabled parts listed above do not need it.
+    :param lexer: a :class:`WikitextLexer` of *text* whose spans are
+        used instead of scanning the text again. Its site is used for
+        site-dependent regexes and must match *site* if given.
     :return: text stripped from disabled parts.
+    :raises ValueError: *lexer* was created for another text or site
     """
+    if lexer is not None:
+        lexer.check(text, site)
+        return lexer.remove_disabled_parts(tags, include)
+
     if not tags:
         tags = ['comment', 'includeonly', 'nowiki', 'pre', 'syntaxhighlight']
     # avoid set(tags) because sets are internally ordered using the hash
@@ -604,12 +873,23 @@ class _GetDataHTML(HTMLParser):
             self.textdata += f'</{tag}>'
 
 
-def isDisabled(text: str, index: int, tags=None) -> bool:
+def isDisabled(text: str, index: int, tags=None, *,
+               lexer: Optional[WikitextLexer] = None) -> bool:
     """
     Return True if text[index] is disabled, e.g. by a comment or nowiki tags.
 
     For the tags parameter, see :py:obj:`removeDisabledParts`.
+
+    .. versionchanged:: 8.6
+       *lexer* parameter was added.
+
+    :param lexer: a :class:`WikitextLexer` of *text* whose spans are
+        used instead of scanning the text again.
     """
+    if lexer is not None:
+        lexer.check(text)
+        return lexer.is_disabled(index, tags)
+
     # Find a marker that is not already in the text.
     marker = findmarker(text)
     text = text[:index] + marker + text[index:]
@@ -999,13 +1279,12 @@ class Content(NamedTuple):
         return m[1].strip() if m else ''
 
 
-def _extract_headings(text: str) -> List[_Heading]:
+def _extract_headings(text: str, lexer: WikitextLexer) -> List[_Heading]:
     """Return _Heading objects."""
     headings = []
-    heading_regex = get_regexes('header')[0]
-    for match in heading_regex.finditer(text):
+    for match in lexer.matches('header'):
         start, end = match.span(1)
-        if not isDisabled(text, start) and not isDisabled(text, end):
+        if not lexer.is_disabled(start) and not lexer.is_disabled(end):
             headings.append(_Heading(match[1], start, end))
     return headings
 
@@ -1026,7 +1305,9 @@ def _extract_sections(text: str, headings) -> List[Section]:
 
 def extract_sections(
     text: str,
-    site: Optional['pywikibot.site.BaseSite'] = None
+    site: Optional['pywikibot.site.BaseSite'] = None,
+    *,
+    lexer: Optional[WikitextLexer] = None
 ) -> Content:
     """Return section headings and contents found in text.
 
@@ -1088,10 +1369,20 @@ def extract_sections(
     .. versionchanged:: 8.2
        The :class:`Content` and :class:`Section` class have additional
        properties.
+    .. versionchanged:: 8.6
+       *lexer* parameter was added; headings are checked against the
+       disabled parts of a single scan.
 
+    :param lexer: a :class:`WikitextLexer` of *text* whose spans are
+        used instead of scanning the text again. A cached lexer is used
+        if it is not given.
     :return: The parsed namedtuple.
     """  # noqa: D300, D301
-    headings = _extract_headings(text)
+    if lexer is None:
+        lexer = WikitextLexer.for_text(text, site)
+    else:
+        lexer.check(text, site)
+    headings = _extract_headings(text, lexer)
     sections = _extract_sections(text, headings)
     # Find header and footer contents
     header = text[:headings[0].start] if headings else text
@@ -1138,7 +1429,9 @@ def extract_sections(
 def getLanguageLinks(
     text: str,
     insite=None,
-    template_subpage: bool = False
+    template_subpage: bool = False,
+    *,
+    lexer: Optional[WikitextLexer] = None
 ) -> Dict['pywikibot.site.BaseSite', 'pywikibot.Page']:
     """Return a dict of inter-language links found in text.
 
@@ -1147,6 +1440,12 @@ def getLanguageLinks(
 
     Do not call this routine directly, use
     :meth:`page.BasePage.interwiki` method instead.
+
+    .. versionchanged:: 8.6
+       *lexer* parameter was added.
+
+    :param lexer: a :class:`WikitextLexer` of *text* used to remove
+        disabled parts without scanning the text again.
     """
     if insite is None:
         insite = pywikibot.Site()
@@ -1161,7 +1460,7 @@ def getLanguageLinks(
     include = []
     if template_subpage:
         include = ['includeonly']
-    text = removeDisabledParts(text, include=include)
+    text = removeDisabledParts(text, include=include, lexer=lexer)
 
     # This regular expression will find every link that is possibly an
     # interwiki link.
@@ -1443,11 +1742,19 @@ def interwikiSort(sites, insite=None):
 
 def getCategoryLinks(text: str, site=None,
                      include: Optional[List[str]] = None,
-                     expand_text: bool = False) -> List['pywikibot.Category']:
+                     expand_text: bool = False,
+                     *,
+                     lexer: Optional[WikitextLexer] = None
+                     ) -> List['pywikibot.Category']:
     """Return a list of category links found in text.
 
+    .. versionchanged:: 8.6
+       *lexer* parameter was added.
+
     :param include: list of tags which should not be removed by
         removeDisabledParts() and where CategoryLinks can be searched.
+    :param lexer: a :class:`WikitextLexer` of *text* used to remove
+        disabled parts without scanning the text again.
     :return: all category links found
     """
     result = []
@@ -1455,7 +1762,7 @@ def getCategoryLinks(text: str, site=None,
         site = pywikibot.Site()
     # Ignore category links within nowiki tags, pre tags, includeonly tags,
     # and HTML comments
-    text = removeDisabledParts(text, include=include or [])
+    text = removeDisabledParts(text, include=include or [], lexer=lexer)
     catNamespace = '|'.join(site.namespaces.CATEGORY)
     R = re.compile(r'\[\[\s*(?P<namespace>{})\s*:\s*(?P<rest>.+?)\]\]'
                    .format(catNamespace), re.I)
@@ -1768,7 +2075,10 @@ def compileLinkR(withoutBracketed: bool = False, onlyBracketed: bool = False):
 
 def extract_templates_and_params(text: str,
                                  remove_disabled_parts: bool = False,
-                                 strip: bool = False) -> ETPType:
+                                 strip: bool = False,
+                                 *,
+                                 lexer: Optional[WikitextLexer] = None
+                                 ) -> ETPType:
     """Return a list of templates found in text.
 
     Return value is a list of tuples. There is one tuple for each use of a
@@ -1798,12 +2108,23 @@ def extract_templates_and_params(text: str,
     :param remove_disabled_parts: If enabled, remove disabled wikitext
         such as comments and pre.
     :param strip: If enabled, strip arguments and values of templates.
+    :param lexer: a :class:`WikitextLexer` of *text* used to remove
+        disabled parts without scanning the text again.
     :return: list of template name and params
 
     .. versionchanged:: 6.1
        *wikitextparser* package is supported; either *wikitextparser* or
        *mwparserfromhell* is strictly recommended.
+    .. versionchanged:: 8.6
+       *lexer* parameter was added. The built-in scanner of
+       :func:`extract_templates_and_params_builtin` is used if
+       :ref:`config.builtin_template_parser<Further Settings>` is set or
+       no parser package is installed.
     """
+    if pywikibot.config.builtin_template_parser or wikitextparser is None:
+        return extract_templates_and_params_builtin(
+            text, remove_disabled_parts, strip, lexer=lexer)
+
     def explicit(param):
         try:
             attr = param.showkey
@@ -1812,7 +2133,7 @@ def extract_templates_and_params(text: str,
         return attr
 
     if remove_disabled_parts:
-        text = removeDisabledParts(text)
+        text = removeDisabledParts(text, lexer=lexer)
 
     parser_name = wikitextparser.__name__
     pywikibot.debug(f'Using {parser_name!r} wikitext parser')
@@ -1888,6 +2209,227 @@ def extract_templates_and_params_regex_simple(text: str):
     return result
 
 
+#: Tags whose content is not parsed like mwparserfromhell does
+_OPAQUE_TAGS = frozenset({
+    'categorytree', 'ce', 'chem', 'gallery', 'graph', 'hiero', 'imagemap',
+    'inputbox', 'math', 'nowiki', 'pre', 'score', 'section', 'source',
+    'syntaxhighlight', 'templatedata', 'timeline',
+})
+
+_TEMPLATE_TOKEN_REGEX = re.compile(r"""
+    (?P<comment><!--)
+  | (?P<open>\{{2,})
+  | (?P<close>\}{2,})
+  | (?P<link>\[\[)
+  | (?P<extlink>\[(?:https?:|ftp:|//|mailto:))
+  | (?P<bracket>\]+)
+  | (?P<pipe>\|)
+  | (?P<equal>=)
+  | <(?P<endtag>/)?(?P<tag>[A-Za-z][\w-]*)[^<>]*?(?P<selfclosing>/)?>
+""", re.VERBOSE)
+_CLOSING_TAG_REGEX = re.compile(r'</([A-Za-z][\w-]*)\s*>')
+_TEMPLATE_NAME_COMMENT_REGEX = re.compile(r'<!--.*?-->', re.S)
+_TEMPLATE_NAME_NESTED_REGEX = re.compile(r'\{\{.*\}\}', re.S)
+_INVALID_TEMPLATE_NAME_REGEX = re.compile(r'[][{}<>|\n]')
+
+_ScannedTemplate = Tuple[str, Tuple[Tuple[Optional[str], str], ...]]
+
+
+class _ScannerElement:
+
+    """An open element on the stack of :func:`_scan_templates`."""
+
+    __slots__ = ('kind', 'start', 'count', 'content', 'pipes', 'equals')
+
+    def __init__(self, kind: str, start: int, count: int = 0) -> None:
+        self.kind = kind  # '{', '[[', '[' or a tag name
+        self.start = start  # start of the opening run
+        self.count = count  # remaining braces of the opening run
+        self.content = start + count  # start of name part
+        self.pipes: List[int] = []
+        self.equals: Dict[int, int] = {}
+
+
+@lru_cache(maxsize=64)
+def _scan_templates(text: str) -> Tuple[_ScannedTemplate, ...]:
+    """Scan text for templates with a single linear pass.
+
+    The text is scanned for brace runs like the MediaWiki preprocessor
+    does, using a stack of open elements. Wikilinks, external links and
+    tags protect their pipes and equal signs; comments and the content
+    of :data:`_OPAQUE_TAGS` are skipped.
+
+    The result is memoized for the most recently scanned texts.
+
+    :return: tuples of raw template name and parameters in order of
+        their appearance. Each parameter is a tuple of its raw key or
+        None for positional parameters and its raw value.
+    """
+    closing_tags: Dict[str, List[int]] = {}
+    for match in _CLOSING_TAG_REGEX.finditer(text):
+        closing_tags.setdefault(match[1].lower(), []).append(match.start())
+
+    def closed_later(tag: str, pos: int) -> bool:
+        positions = closing_tags.get(tag, [])
+        return bisect_left(positions, pos) < len(positions)
+
+    found: List[Tuple[int, _ScannedTemplate]] = []
+    stack: List[_ScannerElement] = []
+
+    def template(elem: _ScannerElement, start: int, end: int) -> None:
+        """Create a template from a closed brace element."""
+        bounds = [elem.content] + [pipe + 1 for pipe in elem.pipes]
+        ends = elem.pipes + [end]
+        name = text[bounds[0]:ends[0]].strip()
+        bare_name = _TEMPLATE_NAME_COMMENT_REGEX.sub('', name).strip()
+        if not bare_name or _INVALID_TEMPLATE_NAME_REGEX.search(
+                _TEMPLATE_NAME_NESTED_REGEX.sub('', bare_name)):
+            return
+
+        params = []
+        for i, (first, last) in enumerate(zip(bounds[1:], ends[1:])):
+            equal = elem.equals.get(i)
+            if equal is None:
+                params.append((None, text[first:last]))
+            else:
+                params.append((text[first:equal], text[equal + 1:last]))
+        found.append((start, (name, tuple(params))))
+
+    pos = 0
+    while True:
+        match = _TEMPLATE_TOKEN_REGEX.search(text, pos)
+        if not match:
+            break
+
+        token = match.lastgroup
+        pos = match.end()
+        top = stack[-1] if stack else None
+
+        if token == 'comment':
+            end = text.find('-->', pos)
+            if end >= 0:  # unclosed comments are text
+                pos = end + 3
+
+        elif token == 'open':
+            stack.append(_ScannerElement('{', match.start(), len(match[0])))
+
+        elif token == 'close':
+            index = match.start()
+            count = len(match[0])
+            while count >= 2 and stack:
+                # unclosed links are text but braces within a tag too
+                for i in range(len(stack) - 1, -1, -1):
+                    if stack[i].kind not in ('[[', '['):
+                        break
+                elem = stack[i]
+                if elem.kind != '{':
+                    break
+                del stack[i + 1:]
+                matched = min(elem.count, count, 3)
+                if matched == 2:
+                    template(elem, elem.start + elem.count - 2, index)
+                elem.count -= matched
+                if elem.count >= 2:
+                    elem.content = elem.start + elem.count
+                    elem.pipes = []
+                    elem.equals = {}
+                else:
+                    stack.pop()
+                index += matched
+                count -= matched
+
+        elif token == 'link':
+            stack.append(_ScannerElement('[[', match.start()))
+
+        elif token == 'extlink':
+            stack.append(_ScannerElement('[', match.start()))
+
+        elif token == 'bracket':
+            count = len(match[0])
+            while count and top is not None and top.kind in ('[[', '['):
+                if top.kind == '[[':
+                    if count < 2:
+                        break
+                    count -= 2
+                else:
+                    count -= 1
+                stack.pop()
+                top = stack[-1] if stack else None
+
+        elif token == 'pipe':
+            if top is not None and top.kind == '{':
+                top.pipes.append(match.start())
+
+        elif token == 'equal':
+            if top is not None and top.kind == '{' and top.pipes:
+                top.equals.setdefault(len(top.pipes) - 1, match.start())
+
+        else:  # tag
+            tag = match['tag'].lower()
+            if match['selfclosing']:
+                pass
+            elif match['endtag']:
+                for i in range(len(stack) - 1, -1, -1):
+                    if stack[i].kind == tag:
+                        del stack[i:]
+                        break
+                    if stack[i].kind == '{':
+                        break
+            elif closed_later(tag, pos):
+                if tag in _OPAQUE_TAGS:
+                    closing = re.compile(fr'</{tag}\s*>', re.I)
+                    pos = closing.search(text, pos).end()
+                else:
+                    stack.append(_ScannerElement(tag, match.start()))
+
+    found.sort(key=lambda item: item[0])
+    return tuple(item for _, item in found)
+
+
+def extract_templates_and_params_builtin(
+    text: str,
+    remove_disabled_parts: bool = False,
+    strip: bool = False,
+    *,
+    lexer: Optional[WikitextLexer] = None
+) -> ETPType:
+    """Return a list of templates found in text using a built-in scanner.
+
+    The result is the same as of :func:`extract_templates_and_params`
+    with *mwparserfromhell* but no parser package is needed. Nested
+    templates, comments, wikilinks, tags and nowiki parts are handled
+    with a single linear pass over the text; the scan results are
+    memoized for recently used texts.
+
+    >>> extract_templates_and_params_builtin('{{a|b={{c|[[d|e]]}}}}')
+    [('a', OrderedDict([('b', '{{c|[[d|e]]}}')])), \
+('c', OrderedDict([('1', '[[d|e]]')]))]
+
+    .. versionadded:: 8.6
+
+    For parameters see :func:`extract_templates_and_params`.
+    """
+    if remove_disabled_parts:
+        text = removeDisabledParts(text, lexer=lexer)
+
+    result = []
+    for name, params in _scan_templates(text):
+        if name.startswith('#'):
+            continue  # parser function
+
+        numbered_param_identifiers = itertools.count(1)
+        template_params = OrderedDict()
+        for key, value in params:
+            if key is None:
+                key = str(next(numbered_param_identifiers))
+            elif strip:
+                key = key.strip()
+                value = value.strip()
+            template_params[key] = value
+        result.append((name, template_params))
+    return result
+
+
 def glue_template_and_params(template_and_params) -> str:
     """Return wiki text of template glued from params.
 
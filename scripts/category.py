@@ -116,9 +116,10 @@ supported:
 &params;
 
 For the actions tidy and tree, the bot will store the category structure
-locally in category.dump. This saves time and server load, but if it uses
-these data later, they may be outdated; use the -rebuild parameter in this
-case.
+locally in category-graph.sqlite. This saves time and server load. Members
+of a category are reloaded if the numbers of pages, files or subcategories
+changed, supercategories after one day; use the -rebuild parameter to reset
+the stored data.
 
 For example, to create a new category from a list of persons, type:
 
@@ -150,8 +151,10 @@ are also in 'Pneumatics' category.
 import codecs
 import math
 import os
-import pickle
 import re
+import sqlite3
+import time
+from collections import defaultdict
 from contextlib import suppress
 from itertools import chain
 from operator import methodcaller
@@ -176,7 +179,6 @@ from pywikibot.exceptions import (
     NoUsernameError,
     PageSaveRelatedError,
 )
-from pywikibot.tools import open_archive
 from pywikibot.tools.itertools import intersect_generators
 
 
@@ -324,124 +326,216 @@ class CategoryPreprocess(BaseBot):
 
 class CategoryDatabase:
 
-    """Temporary database saving pages and subcategories for each category.
+    """Database saving pages and subcategories for each category.
 
     This prevents loading the category pages over and over again.
+
+    The category graph is stored as edges (parent, child, type) in a
+    SQLite database. Edges are read when they are needed and every
+    change is written immediately. The members of a category are
+    refreshed if its :attr:`categoryinfo
+    <pywikibot.page.Category.categoryinfo>` counts differ from the
+    stored counts; supercategories are refreshed after *max_age*
+    seconds.
+
+    .. versionchanged:: 8.6
+       the category graph is stored in a SQLite database instead of a
+       pickle file which was loaded and written completely.
+    """
+
+    schema = """
+        CREATE TABLE IF NOT EXISTS nodes (
+            site TEXT NOT NULL,
+            title TEXT NOT NULL,
+            members_fetched REAL,
+            subcats INTEGER,
+            pages INTEGER,
+            files INTEGER,
+            parents_fetched REAL,
+            PRIMARY KEY (site, title)
+        );
+        CREATE TABLE IF NOT EXISTS edges (
+            site TEXT NOT NULL,
+            parent TEXT NOT NULL,
+            child TEXT NOT NULL,
+            type TEXT NOT NULL,
+            PRIMARY KEY (site, parent, child)
+        );
+        CREATE INDEX IF NOT EXISTS edges_child ON edges (site, child);
     """
 
     def __init__(
         self,
         rebuild: bool = False,
-        filename: str = 'category.dump.bz2'
+        filename: str = 'category-graph.sqlite',
+        max_age: float = 24 * 60 * 60
     ) -> None:
-        """Initializer."""
+        """Initializer.
+
+        :param rebuild: clear the database
+        :param filename: the database file; relative paths are in the
+            data folder
+        :param max_age: seconds after which stored members are checked
+            against categoryinfo counts and supercategories are reloaded
+        """
         if not os.path.isabs(filename):
             filename = config.datafilepath(filename)
         self.filename = filename
+        self.max_age = max_age
+        self._db = None
         if rebuild:
             self.rebuild()
 
     @property
-    def is_loaded(self) -> bool:
-        """Return whether the contents have been loaded."""
-        return (hasattr(self, 'cat_content_db')
-                and hasattr(self, 'superclass_db'))
-
-    def _load(self) -> None:
-        if not self.is_loaded:
-            try:
-                if config.verbose_output:
-                    pywikibot.info('Reading dump from '
-                                   + config.shortpath(self.filename))
-                with open_archive(self.filename, 'rb') as f:
-                    databases = pickle.load(f)
-                # keys are categories, values are 2-tuples with lists as
-                # entries.
-                self.cat_content_db = databases['cat_content_db']
-                # like the above, but for supercategories
-                self.superclass_db = databases['superclass_db']
-                del databases
-            except Exception:
-                # If something goes wrong, just rebuild the database
-                self.rebuild()
+    def db(self) -> sqlite3.Connection:
+        """Return the database connection; open it on first use."""
+        if self._db is None:
+            self._db = sqlite3.connect(self.filename)
+            with self._db:
+                self._db.executescript(self.schema)
+        return self._db
 
     def rebuild(self) -> None:
         """Rebuild the dabatase."""
-        self.cat_content_db = {}
-        self.superclass_db = {}
+        with self.db:
+            self.db.execute('DELETE FROM edges')
+            self.db.execute('DELETE FROM nodes')
+
+    def _node(self, page):
+        """Return the key and the nodes row of a page."""
+        key = (page.site.sitename, page.title())
+        row = self.db.execute(
+            'SELECT members_fetched, subcats, pages, files, parents_fetched'
+            ' FROM nodes WHERE site = ? AND title = ?', key).fetchone()
+        return key, row
+
+    def _update_node(self, key, **values) -> None:
+        """Insert or update a nodes row. The caller commits."""
+        self.db.execute('INSERT OR IGNORE INTO nodes (site, title)'
+                        ' VALUES (?, ?)', key)
+        self.db.execute(
+            'UPDATE nodes SET {} WHERE site = ? AND title = ?'.format(
+                ', '.join(f'{name} = ?' for name in values)),
+            (*values.values(), *key))
+
+    def _children(self, cat, edge_type: str, cls):
+        """Return stored children of cat with the given edge type."""
+        return {cls(cat.site, title) for title, in self.db.execute(
+            'SELECT child FROM edges WHERE site = ? AND parent = ?'
+            ' AND type = ?', (cat.site.sitename, cat.title(), edge_type))}
+
+    def _members(self, cat, edge_type: str):
+        """Return subcategories or articles of cat.
+
+        The members are loaded from the server if they are not stored
+        or the stored counts are outdated.
+        """
+        cls = pywikibot.Category if edge_type == 'subcat' else pywikibot.Page
+        key, row = self._node(cat)
+        now = time.time()
+        if row and row[0] is not None:
+            if now - row[0] < self.max_age:
+                return self._children(cat, edge_type, cls)
+            info = cat.categoryinfo
+            if row[1:4] == (info['subcats'], info['pages'], info['files']):
+                with self.db:
+                    self._update_node(key, members_fetched=now)
+                return self._children(cat, edge_type, cls)
+        else:
+            info = cat.categoryinfo
+
+        subcatset = set(cat.subcategories())
+        articleset = set(cat.articles())
+        with self.db:
+            self.db.execute('DELETE FROM edges WHERE site = ? AND parent = ?',
+                            key)
+            self.db.executemany(
+                'INSERT OR REPLACE INTO edges (site, parent, child, type)'
+                ' VALUES (?, ?, ?, ?)',
+                chain(((*key, sub.title(), 'subcat') for sub in subcatset),
+                      ((*key, page.title(), 'page') for page in articleset)))
+            self._update_node(key, members_fetched=now,
+                              subcats=info['subcats'], pages=info['pages'],
+                              files=info['files'])
+        return subcatset if edge_type == 'subcat' else articleset
 
     def get_subcats(self, supercat) -> Set[pywikibot.Category]:
         """Return the list of subcategories for a given supercategory.
 
-        Saves this list in a temporary database so that it won't be loaded
-        from the server next time it's required.
+        Saves this list in a database so that it won't be loaded from
+        the server next time it's required.
         """
-        self._load()
-        # if we already know which subcategories exist here
-        if supercat in self.cat_content_db:
-            return self.cat_content_db[supercat][0]
-        subcatset = set(supercat.subcategories())
-        articleset = set(supercat.articles())
-        # add to dictionary
-        self.cat_content_db[supercat] = (subcatset, articleset)
-        return subcatset
+        return self._members(supercat, 'subcat')
 
     def get_articles(self, cat) -> Set[pywikibot.Page]:
         """Return the list of pages for a given category.
 
-        Saves this list in a temporary database so that it won't be loaded
-        from the server next time it's required.
+        Saves this list in a database so that it won't be loaded from
+        the server next time it's required.
         """
-        self._load()
-        # if we already know which articles exist here.
-        if cat in self.cat_content_db:
-            return self.cat_content_db[cat][1]
-        subcatset = set(cat.subcategories())
-        articleset = set(cat.articles())
-        # add to dictionary
-        self.cat_content_db[cat] = (subcatset, articleset)
-        return articleset
+        return self._members(cat, 'page')
+
+    def _supercats_fresh(self, row) -> bool:
+        """Return whether stored supercategories are not outdated."""
+        return bool(row and row[4] is not None
+                    and time.time() - row[4] < self.max_age)
+
+    def _store_supercats(self, key, subcat, supercatset) -> None:
+        """Replace the stored supercategories of subcat."""
+        edge_type = 'subcat' if subcat.is_categorypage() else 'page'
+        with self.db:
+            self.db.execute('DELETE FROM edges WHERE site = ? AND child = ?',
+                            key)
+            self.db.executemany(
+                'INSERT OR REPLACE INTO edges (site, parent, child, type)'
+                ' VALUES (?, ?, ?, ?)',
+                ((key[0], cat.title(), key[1], edge_type)
+                 for cat in supercatset))
+            self._update_node(key, parents_fetched=time.time())
 
     def get_supercats(self, subcat) -> Set[pywikibot.Category]:
         """Return the supercategory (or a set of) for a given subcategory."""
-        self._load()
-        # if we already know which subcategories exist here.
-        if subcat in self.superclass_db:
-            return self.superclass_db[subcat]
+        key, row = self._node(subcat)
+        if self._supercats_fresh(row):
+            return {pywikibot.Category(subcat.site, title)
+                    for title, in self.db.execute(
+                        'SELECT parent FROM edges WHERE site = ?'
+                        ' AND child = ?', key)}
+
         supercatset = set(subcat.categories())
-        # add to dictionary
-        self.superclass_db[subcat] = supercatset
+        self._store_supercats(key, subcat, supercatset)
         return supercatset
 
-    def dump(self, filename=None) -> None:
-        """Save the dictionaries to disk if not empty.
+    def preload_supercats(self, subcats) -> None:
+        """Load outdated supercategories of many pages in batches.
 
-        Pickle the contents of the dictionaries superclass_db and
-        cat_content_db if at least one is not empty. If both are empty,
-        removes the file from the disk.
+        .. versionadded:: 8.6
 
-        If the filename is None, it'll use the filename determined in __init__.
+        :param subcats: pages of a single site
         """
-        if filename is None:
-            filename = self.filename
-        elif not os.path.isabs(filename):
-            filename = config.datafilepath(filename)
-        if self.is_loaded and (self.cat_content_db or self.superclass_db):
-            pywikibot.info(
-                f'Dumping to {config.shortpath(filename)}, please wait...')
-            databases = {
-                'cat_content_db': self.cat_content_db,
-                'superclass_db': self.superclass_db
-            }
-            # store dump to disk in binary format
-            with open_archive(filename, 'wb') as f, \
-                 suppress(pickle.PicklingError):
-                pickle.dump(databases, f, protocol=config.pickle_protocol)
-        else:
-            with suppress(EnvironmentError):
-                os.remove(filename)
-                pywikibot.info('Database is empty. {} removed'
-                               .format(config.shortpath(filename)))
+        stale = {}
+        for subcat in subcats:
+            key, row = self._node(subcat)
+            if not self._supercats_fresh(row):
+                stale[key] = subcat
+        if not stale:
+            return
+
+        site = next(iter(stale.values())).site
+        for page in site.preloadpages(stale.values(), categories=True,
+                                      content=False):
+            key = (site.sitename, page.title())
+            self._store_supercats(key, page, set(page.categories()))
+
+    def dump(self, filename=None) -> None:
+        """Close the database.
+
+        .. versionchanged:: 8.6
+           all changes are already written; *filename* is ignored.
+        """
+        if self._db is not None:
+            self._db.close()
+            self._db = None
 
 
 class CategoryAddBot(CategoryPreprocess):
@@ -1346,6 +1440,9 @@ class CategoryTreeRobot:
         The multi-line string contains a tree view of all subcategories of cat,
         up to level max_depth. Recursively calls itself.
 
+        .. versionchanged:: 8.6
+           subcategories are taken from the tree loaded by :meth:`load`.
+
         Parameters:
             * cat - the Category of the node we're currently opening.
             * current_depth - the current level in the tree (for recursion).
@@ -1377,14 +1474,35 @@ class CategoryTreeRobot:
         del supercat_names
         result += '\n'
         if current_depth < self.max_depth:
-            for subcat in self.cat_db.get_subcats(cat):
+            for subcat in self.subcats[cat]:
                 # recurse into subdirectories
                 result += self.treeview(subcat, current_depth + 1, parent=cat)
-        elif self.cat_db.get_subcats(cat):
+        elif self.subcats[cat]:
             # show that there are more categories beyond the depth limit
             result += '#' * (current_depth + 1) + ' [...]\n'
         return result
 
+    def load(self, cat) -> None:
+        """Load the category tree of cat level by level.
+
+        Subcategories are loaded with :meth:`Category.subcategory_edges()
+        <pywikibot.page.Category.subcategory_edges>` which also provides
+        the page counts; supercategories of all categories are loaded
+        in batches.
+
+        .. versionadded:: 8.6
+        """
+        self.subcats = defaultdict(list)
+        nodes = {cat: None}
+        # one level more to show whether there are more categories
+        for _, parent, child in cat.subcategory_edges(
+                depth=self.max_depth + 1):
+            self.subcats[parent].append(child)
+            nodes.setdefault(child)
+        nodes = list(nodes)
+        for i in range(0, len(nodes), self.site.maxlimit):
+            self.cat_db.preload_supercats(nodes[i:i + self.site.maxlimit])
+
     def run(self) -> None:
         """Handle the multi-line string generated by treeview.
 
@@ -1392,6 +1510,8 @@ class CategoryTreeRobot:
         console or saved it to a file.
         """
         cat = pywikibot.Category(self.site, self.cat_title)
+        pywikibot.info('Loading categories...')
+        self.load(cat)
         pywikibot.info('Generating tree...', newline=False)
         tree = self.treeview(cat)
         pywikibot.info()
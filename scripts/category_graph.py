@@ -42,7 +42,7 @@ fillcolor=green] edge[style=dashed penwidth=3]'
 # Distributed under the terms of the MIT license.
 #
 import argparse
-from collections import defaultdict
+from collections import defaultdict, deque
 
 import pywikibot
 from pywikibot import config
@@ -93,67 +93,81 @@ class CategoryGraphBot(SingleSiteBot):
         self.dot = pydot.graph_from_dot_data(f'digraph {{{style}}}')[0]
         self.dot.set_name(f'"{cat_title}"')
 
-    def scan_level(self, cat, level, hue=None) -> str:
-        """Recursive function to fill dot graph.
+    def scan_level(self, cat, level, hue=None) -> None:
+        """Fill the dot graph with the category tree of cat.
 
-        :param cat: the Category of the node we're currently opening.
-        :param level: the current decreasing from depth to zero level in
-            the tree (for recursion), opposite of depth.
+        The tree is loaded level by level with
+        :meth:`Category.subcategory_edges()
+        <pywikibot.page.Category.subcategory_edges>`. Every category is
+        added only once.
+
+        .. versionchanged:: 8.6
+           the tree is scanned breadth first and no longer recursively.
+
+        :param cat: the Category of the root node.
+        :param level: the depth of the tree to show.
+        :param hue: the hue of all edges; a different hue for each root
+            branch if None.
         """
-        title = cat.title(with_ns=False)
-        size = float(args.downsize) ** level
-        subcats = sorted(cat.subcategories())
+        subcats = defaultdict(list)
+        # load one more level to show the number of subcategories of leaves
+        for _, parent, child in cat.subcategory_edges(depth=level + 1):
+            subcats[parent].append(child)
+
+        levels = {cat: level}
+        hues = {cat: hue}
+        queue = deque([cat])
+        while queue:
+            cat = queue.popleft()
+            level = levels[cat]
+            title = cat.title(with_ns=False)
+            size = float(self.args.downsize) ** level
+            children = sorted(subcats[cat])
+
+            if config.verbose_output:
+                pywikibot.info('Adding ' + title)
 
-        def node():
             subs = ', '.join([c.title(with_ns=False).replace(' ', '&nbsp;')
-                              for c in subcats])
-            n = pydot.Node(title,
-                           label=rf'"{title}\n{len(subcats)} C"',
-                           tooltip=title + '\n\n' + subs,
-                           URL=cat.full_url(),
-                           fontsize=int(10 * size))
-            return n
-
-        def edge(n, h):
-            minlen = n % columns + 1 if level != self.args.depth else 1
-            e = pydot.Edge(title,
-                           subcat.title(with_ns=False),
-                           tooltip=title + '  ⟶  '
-                           + subcat.title(with_ns=False),
-                           headlabel=title,
-                           # distribute the graph to depth
-                           minlen=minlen,
-                           penwidth=round(size / 2, 2),
-                           arrowsize=round(size / 4, 2),
-                           color=str(round(h, 2)) + ' 1 0.7',
-                           labelfontsize=int(3 * size),
-                           labelfontcolor=str(round(h, 2)) + ' 1 0.5')
-            return e
-
-        if config.verbose_output:
-            pywikibot.info('Adding ' + cat.title(with_ns=False))
-
-        node = node()
-        self.dot.add_node(node)
-        self.counter += 1
-        if not level or self.counter >= 1e4:
-            # because graphviz crashes on huge graphs
-            if self.counter == 1e4:
-                pywikibot.warning('Number of nodes reached limit')
-            self.leaves.add(node.get_name())
-            return
-
-        columns = len(subcats) // 5 + 1
-        for n, subcat in enumerate(subcats):
-            # generating different hue for color per each root branch
-            h = hue if hue is not None else (11 / 18 * n) % 1
-            e = edge(n, h)
-            self.dot.add_edge(e)
-            # repeat recursively
-            self.scan_level(subcat, level - 1, h)
-            # track graph's structure to reduse too big graph
-            self.rev[e.get_destination()].append(e.get_source())
-            self.fw[e.get_source()].append(e.get_destination())
+                              for c in children])
+            node = pydot.Node(title,
+                              label=rf'"{title}\n{len(children)} C"',
+                              tooltip=title + '\n\n' + subs,
+                              URL=cat.full_url(),
+                              fontsize=int(10 * size))
+            self.dot.add_node(node)
+            self.counter += 1
+            if not level or self.counter >= 1e4:
+                # because graphviz crashes on huge graphs
+                if self.counter == 1e4:
+                    pywikibot.warning('Number of nodes reached limit')
+                self.leaves.add(node.get_name())
+                continue
+
+            columns = len(children) // 5 + 1
+            for n, subcat in enumerate(children):
+                # generating different hue for color per each root branch
+                h = hues[cat] if hues[cat] is not None else (11 / 18 * n) % 1
+                minlen = n % columns + 1 if level != self.args.depth else 1
+                e = pydot.Edge(title,
+                               subcat.title(with_ns=False),
+                               tooltip=title + '  ⟶  '
+                               + subcat.title(with_ns=False),
+                               headlabel=title,
+                               # distribute the graph to depth
+                               minlen=minlen,
+                               penwidth=round(size / 2, 2),
+                               arrowsize=round(size / 4, 2),
+                               color=str(round(h, 2)) + ' 1 0.7',
+                               labelfontsize=int(3 * size),
+                               labelfontcolor=str(round(h, 2)) + ' 1 0.5')
+                self.dot.add_edge(e)
+                if subcat not in levels:
+                    levels[subcat] = level - 1
+                    hues[subcat] = h
+                    queue.append(subcat)
+                # track graph's structure to reduse too big graph
+                self.rev[e.get_destination()].append(e.get_source())
+                self.fw[e.get_source()].append(e.get_destination())
 
     def run(self) -> None:
         """Main function of CategoryGraphBot."""
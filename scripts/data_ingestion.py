@@ -91,7 +91,7 @@ Example
 
 """  # noqa: E501
 #
-# (C) Pywikibot team, 2012-2022
+# (C) Pywikibot team, 2012-2024
 #
 # Distributed under the terms of the MIT license.
 #
@@ -99,9 +99,10 @@ import base64
 import codecs
 import csv
 import hashlib
-import io
 import os
 import posixpath
+import tempfile
+from contextlib import suppress
 from typing import Any, BinaryIO, Optional
 from urllib.parse import urlparse
 
@@ -135,6 +136,7 @@ class Photo(pywikibot.FilePage):
         ext = filename.split('.')[-1]
         self.metadata['_ext'] = None if ext == filename else ext
         self.contents = None
+        self._sha1 = None
 
         if not site:
             site = pywikibot.Site('commons')
@@ -144,15 +146,40 @@ class Photo(pywikibot.FilePage):
 
     def download_photo(self) -> BinaryIO:
         """
-        Download the photo and store it in an io.BytesIO object.
+        Download the photo and store it in a temporary file.
+
+        The photo is streamed in chunks and its SHA1 is computed in the
+        same pass.
+
+        .. versionchanged:: 8.6
+           the photo is stored in a temporary file instead of an
+           io.BytesIO object; use :meth:`discard_photo` to remove it.
 
         TODO: Add exception handling
         """
         if not self.contents:
-            image_file = fetch(self.URL).content
-            self.contents = io.BytesIO(image_file)
+            digest = hashlib.sha1()
+            response = fetch(self.URL, stream=True)
+            self.contents = tempfile.NamedTemporaryFile(delete=False)
+            for chunk in response.iter_content(1024 * 1024):
+                digest.update(chunk)
+                self.contents.write(chunk)
+            self.contents.flush()
+            self._sha1 = digest.digest()
+        self.contents.seek(0)
         return self.contents
 
+    def discard_photo(self) -> None:
+        """Remove the downloaded photo.
+
+        .. versionadded:: 8.6
+        """
+        if self.contents:
+            self.contents.close()
+            with suppress(OSError):
+                os.remove(self.contents.name)
+            self.contents = None
+
     def find_duplicate_images(self) -> List[str]:
         """
         Find duplicates of the photo.
@@ -162,11 +189,10 @@ class Photo(pywikibot.FilePage):
 
         TODO: Add exception handling, fix site thing
         """
-        hash_object = hashlib.sha1()
-        hash_object.update(self.download_photo().getvalue())
+        self.download_photo()
         return [page.title(with_ns=False)
                 for page in self.site.allimages(
-                    sha1=base64.b16encode(hash_object.digest()))]
+                    sha1=base64.b16encode(self._sha1))]
 
     def get_title(self, fmt: str) -> str:
         """
@@ -230,24 +256,31 @@ class DataIngestionBot(pywikibot.Bot):
         1. Check for existing duplicates on the wiki specified in self.site.
         2. If duplicates are found, then skip uploading.
         3. Download the file from photo.URL and upload the file to self.site.
+
+        .. versionchanged:: 8.6
+           the downloaded file is uploaded instead of downloading it
+           again and removed afterwards. Files larger than 16 MiB are
+           uploaded in chunks.
         """
-        duplicates = page.find_duplicate_images()
-        if duplicates:
-            pywikibot.info(f'Skipping duplicate of {duplicates!r}')
-            return
-
-        title = page.get_title(self.titlefmt)
-        description = page.get_description(self.pagefmt)
-
-        bot = UploadRobot(url=page.URL,
-                          description=description,
-                          use_filename=title,
-                          keep_filename=True,
-                          verify_description=False,
-                          target_site=self.site)
-        bot._contents = page.download_photo().getvalue()
-        bot._retrieved = True
-        bot.run()
+        try:
+            duplicates = page.find_duplicate_images()
+            if duplicates:
+                pywikibot.info(f'Skipping duplicate of {duplicates!r}')
+                return
+
+            title = page.get_title(self.titlefmt)
+            description = page.get_description(self.pagefmt)
+
+            bot = UploadRobot(url=page.download_photo().name,
+                              description=description,
+                              use_filename=title,
+                              keep_filename=True,
+                              verify_description=False,
+                              target_site=self.site,
+                              chunk_size=16 * 1024 * 1024)
+            bot.run()
+        finally:
+            page.discard_photo()
 
     @classmethod
     def parse_configuration_page(cls, configuration_page) -> Dict[str, str]:
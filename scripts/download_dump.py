@@ -11,23 +11,54 @@ This script supports the following command line parameters:
     -dumpdate:#     The dumpdate date of the dump (default to `latest`)
                     formatted as YYYYMMDD.
 
+    -segments:#     Download the file in the given number of parallel
+                    segments if the server supports range requests
+                    (default to 1).
+
+    -multistream    Download the multistream variant of the given file
+                    together with its index file.
+
+    -noverify       Do not verify the downloaded file against the
+                    published sha1 or md5 checksums.
+
+An interrupted download is resumed with the next run.
+
 .. note:: This script is a
    :py:obj:`ConfigParserBot <bot.ConfigParserBot>`. All options
    can be set within a settings file which is scripts.ini by default.
 """
 #
-# (C) Pywikibot team, 2017-2022
+# (C) Pywikibot team, 2017-2024
 #
 # Distributed under the terms of the MIT license.
 #
-import binascii
+import json
 import os.path
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from http import HTTPStatus
-from os import remove, replace, symlink, urandom
+from os import remove, replace, symlink
+from typing import Any, Optional
+
+import requests
 
 import pywikibot
+from pywikibot.backports import Dict, List, Tuple
 from pywikibot.bot import Bot, ConfigParserBot
 from pywikibot.comms.http import fetch
+from pywikibot.exceptions import ServerError
+from pywikibot.tools import compute_file_hash
+
+
+#: errors which interrupt a download which may be resumed later
+NETWORK_ERRORS = (ConnectionError, ServerError,
+                  requests.exceptions.RequestException)
+
+#: size of the chunks written to the dump file
+CHUNK_SIZE = 100 * 1024
 
 
 class DownloadDumpBot(Bot, ConfigParserBot):
@@ -36,6 +67,10 @@ class DownloadDumpBot(Bot, ConfigParserBot):
 
     .. versionchanged:: 7.0
        DownloadDumpBot is a ConfigParserBot
+    .. versionchanged:: 8.6
+       interrupted downloads are resumed, files may be downloaded in
+       parallel segments and are verified against published checksums;
+       *segments*, *multistream* and *verify* options were added.
     """
 
     available_options = {
@@ -43,8 +78,19 @@ class DownloadDumpBot(Bot, ConfigParserBot):
         'filename': '',
         'storepath': './',
         'dumpdate': 'latest',
+        'segments': 1,
+        'multistream': False,
+        'verify': True,
     }
 
+    base_url = 'https://dumps.wikimedia.org'
+
+    def __init__(self, **kwargs) -> None:
+        """Initializer."""
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+        self._display_string = ''
+
     @staticmethod
     def get_dump_name(db_name, typ, dumpdate):
         """Check if dump file exists locally in a Toolforge server."""
@@ -70,21 +116,355 @@ class DownloadDumpBot(Bot, ConfigParserBot):
                         return dump_filepath
         return None
 
-    def run(self) -> None:
-        """Run bot."""
-        def convert_from_bytes(total_bytes):
-            for unit in ['B', 'K', 'M', 'G', 'T']:
-                if abs(total_bytes) < 1024:
-                    return str(total_bytes) + unit
-                total_bytes = float(format(total_bytes / 1024.0, '.2f'))
-            return str(total_bytes) + 'P'
+    @staticmethod
+    def multistream_names(filename: str) -> Tuple[str, str]:
+        """Return the multistream file name and its index file name.
 
-        pywikibot.info('Downloading dump from ' + self.opt.wikiname)
+        >>> DownloadDumpBot.multistream_names('pages-articles.xml.bz2')
+        ('pages-articles-multistream.xml.bz2', \
+'pages-articles-multistream-index.txt.bz2')
+
+        .. versionadded:: 8.6
+        """
+        name, _, ext = filename.partition('.')
+        if not name.endswith('-multistream'):
+            name += '-multistream'
+        return f'{name}.{ext}', f'{name}-index.txt.bz2'
+
+    @staticmethod
+    def convert_from_bytes(total_bytes) -> str:
+        """Return a human readable size."""
+        for unit in ['B', 'K', 'M', 'G', 'T']:
+            if abs(total_bytes) < 1024:
+                return str(total_bytes) + unit
+            total_bytes = float(format(total_bytes / 1024.0, '.2f'))
+        return str(total_bytes) + 'P'
+
+    def show_progress(self, downloaded: int, total: int) -> None:
+        """Show a progress bar of the download."""
+        if total <= 0:
+            return
+
+        parts = 50
+        done = int(parts * downloaded / total)
+        display = map(self.convert_from_bytes, (downloaded, total))
+        prior_display = self._display_string
+        display_string = '\r|{}{}|{}{}/{}'.format(
+            '=' * done, '-' * (parts - done), ' ' * 5, *display)
+        # Add whitespace to cover up prior bar
+        display_string += ' ' * (len(prior_display.rstrip())
+                                 - len(display_string.rstrip()))
+        self._display_string = display_string
+        pywikibot.info(display_string, newline=False)
+
+    def report_status(self, response, url: str, filename: str) -> None:
+        """Report an unexpected HTTP status of a dump file request."""
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            pywikibot.info(
+                'File with name {filename!r}, from dumpdate {dumpdate!r}, '
+                "and wiki {wikiname!r} ({url}) isn't available in the "
+                'Wikimedia Dumps'
+                .format(url=url, filename=filename,
+                        dumpdate=self.opt.dumpdate,
+                        wikiname=self.opt.wikiname))
+        else:
+            pywikibot.info(HTTPStatus(response.status_code).description)
+
+    @staticmethod
+    def load_state(path: str, total: int,
+                   validator: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Load the state of a partial download.
+
+        The state is kept in a ``.state`` file next to the partial file.
+        A partial file without a state or whose state belongs to another
+        version of the dump file is removed.
+
+        .. versionadded:: 8.6
+
+        :param path: the path of the partial file
+        :param total: the size of the dump file
+        :param validator: the ETag or Last-Modified header of the dump
+            file
+        :return: the state or None if the download has to be started
+        """
+        state = None
+        with suppress(OSError, ValueError), open(path + '.state') as f:
+            state = json.load(f)
+
+        if state is not None and os.path.exists(path) \
+           and state.get('size') == total \
+           and state.get('validator') == validator:
+            return state
+
+        if os.path.exists(path):
+            pywikibot.info('Partial file belongs to another version of the '
+                           'dump, restarting the download')
+        DownloadDumpBot.remove_state(path, partial=True)
+        return None
 
-        download_filename = '{wikiname}-{dumpdate}-{filename}'.format_map(
-            self.opt)
-        temp_filename = download_filename + '-' \
-            + binascii.b2a_hex(urandom(8)).decode('ascii') + '.part'
+    @staticmethod
+    def save_state(path: str, state: Dict[str, Any]) -> None:
+        """Save the state of a partial download.
+
+        .. versionadded:: 8.6
+        """
+        with open(path + '.state', 'w') as f:
+            json.dump(state, f)
+
+    @staticmethod
+    def remove_state(path: str, partial: bool = False) -> None:
+        """Remove the state of a download and the partial file.
+
+        .. versionadded:: 8.6
+
+        :param partial: remove the partial file too
+        """
+        for filepath in (path + '.state', path) if partial else [
+                path + '.state']:
+            with suppress(FileNotFoundError):
+                remove(filepath)
+
+    def download(self, url: str, path: str, filename: str) -> bool:
+        """Download a file or resume a partial download.
+
+        The file is downloaded in parallel segments given by *segments*
+        option if the server accepts range requests. A partial download
+        is resumed the way it was started.
+
+        .. versionadded:: 8.6
+
+        :param url: the url of the file
+        :param path: the path where the file is stored
+        :param filename: the dump file name used for messages
+        :return: whether the download is complete
+        """
+        try:
+            response = fetch(url, method='HEAD')
+            if response.status_code != HTTPStatus.OK:
+                self.report_status(response, url, filename)
+                return False
+
+            total = int(response.headers.get('content-length', -1))
+            if total == -1:
+                pywikibot.warning(
+                    "'content-length' missing in response headers")
+            ranges = (total > 0
+                      and response.headers.get('accept-ranges') == 'bytes')
+            validator = (response.headers.get('etag')
+                         or response.headers.get('last-modified'))
+            state = self.load_state(path, total, validator)
+            if state is None:
+                segmented = self.opt.segments > 1
+                state = {'size': total, 'validator': validator}
+            else:
+                segmented = 'segments' in state
+
+            pywikibot.info()
+            if ranges and segmented:
+                self.download_segments(url, path, state)
+            elif not self.download_stream(url, path, state, ranges):
+                self.report_status(response, url, filename)
+                return False
+        except NETWORK_ERRORS as e:
+            pywikibot.info()
+            pywikibot.error(e)
+            pywikibot.info('Download interrupted; run the script again to '
+                           'resume it.')
+            return False
+        pywikibot.info()
+        return True
+
+    def download_stream(self, url: str, path: str, state: Dict[str, Any],
+                        ranges: bool) -> bool:
+        """Download a file in a single stream.
+
+        A partial file is continued with a range request if *ranges* is
+        True. The request is conditional on the validator of the partial
+        file; the whole file is downloaded again if it has changed.
+
+        .. versionadded:: 8.6
+
+        :param state: the state of the download as returned by
+            :meth:`load_state` or a new state
+        :return: False if the server refused the request
+        """
+        total = state['size']
+        downloaded = 0
+        if ranges and os.path.exists(path):
+            downloaded = os.path.getsize(path)
+            if downloaded > total:
+                downloaded = 0
+            elif downloaded == total:
+                return True
+
+        headers = None
+        if downloaded:
+            headers = {'Range': f'bytes={downloaded}-'}
+            if state['validator']:
+                headers['If-Range'] = state['validator']
+        response = fetch(url, stream=True, headers=headers)
+        if response.status_code == HTTPStatus.PARTIAL_CONTENT:
+            pywikibot.info(f'Resuming download at '
+                           f'{self.convert_from_bytes(downloaded)}')
+            mode = 'ab'
+        elif response.status_code == HTTPStatus.OK:
+            downloaded = 0
+            mode = 'wb'
+            # a previous segmented download is not continued
+            self.save_state(path, {'size': total,
+                                   'validator': state['validator']})
+        else:
+            return False
+
+        with open(path, mode) as result_file:
+            for data in response.iter_content(CHUNK_SIZE):
+                result_file.write(data)
+                downloaded += len(data)
+                self.show_progress(downloaded, total)
+        return True
+
+    def download_segments(self, url: str, path: str,
+                          state: Dict[str, Any]) -> None:
+        """Download a file in parallel segments.
+
+        The progress of every segment is kept in the state file next to
+        the partial file so that an interrupted download is continued
+        where each segment stopped.
+
+        .. versionadded:: 8.6
+
+        :param state: the state of the download as returned by
+            :meth:`load_state` or a new state
+        :raises ServerError: the server does not answer a range request
+            with partial content
+        """
+        total = state['size']
+        last_saved = 0.0
+
+        def save_state(force: bool = False) -> None:
+            nonlocal last_saved
+            if force or time.monotonic() - last_saved > 1:
+                self.save_state(path, state)
+                last_saved = time.monotonic()
+
+        segments = state.get('segments')
+        if segments is None:
+            count = self.opt.segments
+            size = -(-total // count)
+            segments = state['segments'] = [
+                [start, start, min(start + size, total)]
+                for start in range(0, total, size)]
+            with open(path, 'wb') as f:
+                f.truncate(total)
+            save_state(force=True)
+        else:
+            pywikibot.info('Resuming segmented download')
+
+        def download_segment(segment: List[int]) -> None:
+            _, pos, end = segment
+            if pos >= end:
+                return
+            headers = {'Range': f'bytes={pos}-{end - 1}'}
+            if state['validator']:
+                headers['If-Range'] = state['validator']
+            response = fetch(url, stream=True, headers=headers)
+            if response.status_code != HTTPStatus.PARTIAL_CONTENT:
+                raise ServerError(f'Range request failed with status '
+                                  f'{response.status_code}')
+            # unbuffered, the state never exceeds the written data
+            with open(path, 'r+b', buffering=0) as f:
+                f.seek(pos)
+                for data in response.iter_content(CHUNK_SIZE):
+                    data = data[:end - pos]
+                    f.write(data)
+                    pos += len(data)
+                    with self._lock:
+                        segment[1] = pos
+                        save_state()
+                        self.show_progress(
+                            sum(pos - start for start, pos, _ in segments),
+                            total)
+            if pos < end:
+                raise ServerError(f'Segment ended at byte {pos} of {end}')
+
+        try:
+            with ThreadPoolExecutor(len(segments)) as executor:
+                for future in [executor.submit(download_segment, segment)
+                               for segment in segments]:
+                    future.result()
+        finally:
+            with self._lock:
+                save_state(force=True)
+
+    def get_checksum(self, filename: str) -> Tuple[str, str]:
+        """Return the published checksum of a dump file.
+
+        The ``sha1sums.txt`` file is tried first, then ``md5sums.txt``.
+
+        .. versionadded:: 8.6
+
+        :return: the hash algorithm and the hexdigest or empty strings
+            if no checksum was found
+        """
+        name = re.compile(r'{}-(?:{}|\d{{8}})-{}'.format(
+            re.escape(self.opt.wikiname), re.escape(self.opt.dumpdate),
+            re.escape(filename)))
+        for algorithm in ('sha1', 'md5'):
+            url = '{}/{wikiname}/{dumpdate}/{wikiname}-{dumpdate}-{}sums.txt' \
+                  .format(self.base_url, algorithm, **self.opt)
+            response = fetch(url)
+            if response.status_code != HTTPStatus.OK:
+                continue
+            for line in response.text.splitlines():
+                digest, _, sumname = line.strip().partition(' ')
+                if name.fullmatch(sumname.lstrip(' *')):
+                    return algorithm, digest.lower()
+        return '', ''
+
+    def verify(self, path: str, filename: str) -> bool:
+        """Verify a downloaded file against its published checksum.
+
+        A file which does not match the checksum is removed.
+
+        .. versionadded:: 8.6
+
+        :return: False if the file does not match or the checksum could
+            not be retrieved
+        """
+        try:
+            algorithm, expected = self.get_checksum(filename)
+        except NETWORK_ERRORS as e:
+            pywikibot.error(e)
+            pywikibot.info('Cannot retrieve the checksum; run the script '
+                           'again to verify the download.')
+            return False
+
+        if not expected:
+            pywikibot.warning(f'No checksum found for {filename}')
+            return True
+
+        pywikibot.info(f'Verifying {algorithm} checksum...')
+        if compute_file_hash(path, algorithm) == expected:
+            return True
+
+        pywikibot.error(f'{algorithm} checksum of {filename} does not match, '
+                        'removing the downloaded file')
+        self.remove_state(path, partial=True)
+        return False
+
+    def download_file(self, filename: str) -> bool:
+        """Download a single dump file.
+
+        .. versionadded:: 8.6
+           moved from :meth:`run`
+
+        :param filename: the name of the dump file without wiki name and
+            dump date
+        :return: whether the file was stored
+        """
+        download_filename = '{}-{}-{}'.format(
+            self.opt.wikiname, self.opt.dumpdate, filename)
+        temp_filename = download_filename + '.part'
 
         file_final_storepath = os.path.join(
             self.opt.storepath, download_filename)
@@ -93,7 +473,7 @@ class DownloadDumpBot(Bot, ConfigParserBot):
 
         # https://wikitech.wikimedia.org/wiki/Help:Toolforge/Dumps
         toolforge_dump_filepath = self.get_dump_name(
-            self.opt.wikiname, self.opt.filename, self.opt.dumpdate)
+            self.opt.wikiname, filename, self.opt.dumpdate)
 
         # First iteration for atomic download with temporary file
         # Second iteration for fallback non-atomic download
@@ -104,59 +484,22 @@ class DownloadDumpBot(Bot, ConfigParserBot):
                                    + toolforge_dump_filepath)
                     if non_atomic and os.path.exists(file_final_storepath):
                         remove(file_final_storepath)
+                    if os.path.lexists(file_current_storepath):
+                        remove(file_current_storepath)
                     symlink(toolforge_dump_filepath, file_current_storepath)
                 else:
-                    url = 'https://dumps.wikimedia.org/{}/{}/{}'.format(
-                        self.opt.wikiname, self.opt.dumpdate,
+                    url = '{}/{}/{}/{}'.format(
+                        self.base_url, self.opt.wikiname, self.opt.dumpdate,
                         download_filename)
                     pywikibot.info('Downloading file from ' + url)
-                    response = fetch(url, stream=True)
-
-                    if response.status_code != HTTPStatus.OK:
-                        if response.status_code == HTTPStatus.NOT_FOUND:
-                            pywikibot.info(
-                                'File with name {filename!r}, from dumpdate '
-                                '{dumpdate!r}, and wiki {wikiname!r} ({url}) '
-                                "isn't available in the Wikimedia Dumps"
-                                .format(url=url, **self.opt))
-                        else:
-                            pywikibot.info(
-                                HTTPStatus(response.status_code).description)
-                        return
-
-                    with open(file_current_storepath, 'wb') as result_file:
-                        total = int(response.headers['content-length'])
-                        if total == -1:
-                            pywikibot.warning("'content-length' missing in "
-                                              'response headers')
-                        downloaded = 0
-                        parts = 50
-                        display_string = ''
-
-                        pywikibot.info()
-                        for data in response.iter_content(100 * 1024):
-                            result_file.write(data)
-
-                            if total <= 0:
-                                continue
-
-                            downloaded += len(data)
-                            done = int(parts * downloaded / total)
-                            display = map(convert_from_bytes,
-                                          (downloaded, total))
-                            prior_display = display_string
-                            display_string = '\r|{}{}|{}{}/{}'.format(
-                                '=' * done,
-                                '-' * (parts - done),
-                                ' ' * 5,
-                                *display)
-                            # Add whitespace to cover up prior bar
-                            display_string += ' ' * (
-                                len(prior_display.rstrip())
-                                - len(display_string.rstrip()))
-
-                            pywikibot.info(display_string, newline=False)
-                        pywikibot.info()
+                    if not self.download(url, file_current_storepath,
+                                         filename):
+                        return False
+
+                    if self.opt.verify and not self.verify(
+                            file_current_storepath, filename):
+                        return False
+                    self.remove_state(file_current_storepath)
 
                 # Rename the temporary file to the target file
                 # if the download completes successfully
@@ -164,6 +507,10 @@ class DownloadDumpBot(Bot, ConfigParserBot):
                     replace(file_current_storepath, file_final_storepath)
                     break
 
+            except NETWORK_ERRORS:
+                # keep the partial file to resume the download later
+                raise
+
             except OSError as e:
                 pywikibot.error(e)
 
@@ -171,17 +518,35 @@ class DownloadDumpBot(Bot, ConfigParserBot):
                     remove(file_current_storepath)
                 except OSError as e:
                     pywikibot.error(e)
+                self.remove_state(file_current_storepath)
 
                 # If the atomic download fails, try without a temporary file
                 # If the non-atomic download also fails, exit the script
                 if non_atomic:
-                    return
+                    return False
 
                 pywikibot.info('Cannot make temporary file, '
                                'falling back to non-atomic download')
                 file_current_storepath = file_final_storepath
 
         pywikibot.info('Done! File stored as ' + file_final_storepath)
+        return True
+
+    def run(self) -> None:
+        """Run bot.
+
+        .. versionchanged:: 8.6
+           the multistream file and its index may be downloaded
+        """
+        pywikibot.info('Downloading dump from ' + self.opt.wikiname)
+        if self.opt.multistream:
+            filenames = self.multistream_names(self.opt.filename)
+        else:
+            filenames = [self.opt.filename]
+
+        for filename in filenames:
+            if not self.download_file(filename):
+                return
 
 
 def main(*args: str) -> None:
@@ -215,6 +580,19 @@ def main(*args: str) -> None:
                     'Enter the dumpdate of the dump: ')
                 continue
 
+            if option == 'segments':
+                opts[option] = int(value or pywikibot.input(
+                    'Enter the number of segments: '))
+                continue
+
+            if option == 'multistream':
+                opts[option] = True
+                continue
+
+            if option == 'noverify':
+                opts['verify'] = False
+                continue
+
         unknown_args.append(arg)
 
     missing = []
@@ -24,7 +24,9 @@ The following parameters are supported:
 
   -asynchronous     Upload to stash.
 
-  -chunk_size:n     Upload in chunks of n bytes.
+  -chunk_size:n     Upload in chunks of n bytes. Default is 16 MiB; use 0 to
+                    upload files as a whole unless config.upload_chunk_size
+                    is set.
 
   -file:z           Upload many files from textfile: [[Image:x]]
                                                      [[Image:y]]
@@ -163,7 +165,7 @@ class ImageTransferBot(SingleSiteBot, ExistingPageBot):
         'target': None,
         'force_if_shared': False,
         'asynchronous': False,
-        'chunk_size': 0,
+        'chunk_size': 16 * 1024 * 1024,
     }
 
     def __init__(self, **kwargs) -> None:
@@ -184,8 +186,12 @@ class ImageTransferBot(SingleSiteBot, ExistingPageBot):
         :type force_if_shared: boolean
         :keyword asynchronous: Upload to stash.
         :type asynchronous: boolean
-        :keyword chunk_size: Upload in chunks of this size bytes.
+        :keyword chunk_size: Upload in chunks of this size bytes,
+            default is 16 MiB.
         :type chunk_size: integer
+
+        .. versionchanged:: 8.6
+           files are uploaded in chunks of 16 MiB by default.
         """
         super().__init__(**kwargs)
         if self.opt.target is None:
@@ -379,7 +385,7 @@ def main(*args: str) -> None:
         elif opt == '-tosite':
             options['target'] = value
         elif opt == '-chunk_size':
-            options['chunk_size'] = value
+            options['chunk_size'] = int(value)
         else:
             generator_factory.handle_arg(arg)
 
@@ -300,11 +300,18 @@ The following arguments influence how many pages the bot works on at once:
     -query:        The maximum number of pages that the bot will load at once.
                    Default value is 50.
 
+    -querysites:   The maximum number of sites that the bot will load pages
+                   from at the same time. The default is 4, but can be changed
+                   in the config variable interwiki_query_sites
+
 Some configuration option can be used to change the working of this bot:
 
  interwiki_min_subjects: the minimum amount of subjects that should be
                      processed at the same time.
 
+ interwiki_query_sites: the maximum number of sites which are queried at
+                     the same time.
+
  interwiki_backlink: if set to True, all problems in foreign wikis will
                      be reported
 
@@ -337,6 +344,7 @@ import os
 import re
 import sys
 from collections import Counter, defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from contextlib import suppress
 from textwrap import fill
 from typing import Optional
@@ -447,6 +455,7 @@ class InterwikiBotConfig:
     rememberno = False
     followinterwiki = True
     minsubjects = config.interwiki_min_subjects
+    querysites = config.interwiki_query_sites
     nobackonly = False
     askhints = False
     hintnobracket = False
@@ -537,6 +546,8 @@ class InterwikiBotConfig:
             self.minsubjects = int(value)
         elif arg == 'query' and value.isdigit():
             self.maxquerysize = int(value)
+        elif arg == 'querysites' and value.isdigit():
+            self.querysites = int(value)
         elif arg == 'back':
             self.nobackonly = True
         elif arg == 'async':
@@ -756,12 +767,15 @@ class Subject(interwiki_graph.Subject):
         preload all the 'site' Pages that are in the todo list.
 
         This routine will return a list of pages that can be treated.
+
+        .. versionchanged:: 8.6
+           batches of different sites may be pending at the same time.
         """
-        # Bug-check: Isn't there any work still in progress? We can't work on
-        # different sites at a time!
-        if self.pending:
+        # Bug-check: Isn't there any work still in progress? We can't work
+        # twice on the same site at a time!
+        if site in self.pending:
             raise RuntimeError(f"BUG: Can't start to work on {site}; still "
-                               f'working on {self.pending}')
+                               f'working on {self.pending[site]}')
         # Prepare a list of suitable pages
         result = []
         for page in self.todo.filter(site):
@@ -1236,7 +1250,7 @@ class Subject(interwiki_graph.Subject):
             if self.forcedStop:
                 break
 
-    def batchLoaded(self, counter) -> None:
+    def batchLoaded(self, counter, site=None) -> None:
         """
         Notify that the promised batch of pages was loaded.
 
@@ -1245,12 +1259,20 @@ class Subject(interwiki_graph.Subject):
         In other words, all the pages in self.pending have already
         been preloaded.
 
-        The only argument is an instance of a counter class, that has methods
+        The first argument is an instance of a counter class, that has methods
         minus() and plus() to keep counts of the total work todo.
 
+        .. versionchanged:: 8.6
+           *site* parameter was added.
+
+        :param site: the site of the loaded batch; all pending pages
+            were loaded if None
         """
+        pending = list(self.pending if site is None
+                       else self.pending.filter(site))
+
         # Loop over all the pages that should have been taken care of
-        for page in self.pending:
+        for page in pending:
             # Mark the page as done
             self.done.append(page)
 
@@ -1277,7 +1299,10 @@ class Subject(interwiki_graph.Subject):
             self.check_page(page, counter)
 
         # These pages are no longer 'in progress'
-        self.pending.clear()
+        if site is None:
+            self.pending.clear()
+        else:
+            self.pending.remove_key(site)
         # Check whether we need hints and the user offered to give them
         if self.untranslated and not self.hintsAsked:
             self.reportInterwikilessPage(page)
@@ -1285,7 +1310,7 @@ class Subject(interwiki_graph.Subject):
 
     def isDone(self):
         """Return True if all the work for this subject has completed."""
-        return not self.todo
+        return not self.todo and not self.pending
 
     def problem(self, txt: str, createneed: bool = True) -> None:
         """Report a problem with the resolution of this subject."""
@@ -1806,6 +1831,10 @@ class InterwikiBot:
         self.generated = 0
         self.conf = conf
         self.site = pywikibot.Site()
+        # batches which are preloaded in background, futures are keys,
+        # (site, subjects) tuples are values
+        self.queries = {}
+        self.executor = None
 
     def add(self, page, hints=None) -> None:
         """Add a single subject to the list."""
@@ -1896,12 +1925,18 @@ class InterwikiBot:
         """Return the first subject that is still being worked on."""
         return self.subjects[0] if self.subjects else None
 
-    def maxOpenSite(self):
+    def maxOpenSite(self, exclude=()):
         """
         Return the site that has the most open queries plus the number.
 
         If there is nothing left, return None.
-        Only languages that are TODO for the first Subject are returned.
+        Only languages that are TODO for the first Subject are returned
+        unless all of them are excluded.
+
+        .. versionchanged:: 8.6
+           *exclude* parameter was added.
+
+        :param exclude: sites which are already queried
         """
         if not self.firstSubject():
             return None
@@ -1913,16 +1948,29 @@ class InterwikiBot:
             # go live. Select any language from counts.
             oc = self.counts
 
-        if self.site in oc:
+        if self.site in oc and self.site not in exclude:
             return self.site
 
         for site, _ in self.counts.most_common():
-            if site in oc:
+            if site in oc and site not in exclude:
                 return site
+
+        if exclude:
+            # the sites of the first subject are busy, use any other site
+            for site, _ in self.counts.most_common():
+                if site not in exclude and any(
+                        site in subject.todo for subject in self.subjects):
+                    return site
         return None
 
-    def selectQuerySite(self):
-        """Select the site the next query should go out for."""
+    def selectQuerySite(self, exclude=()):
+        """Select the site the next query should go out for.
+
+        .. versionchanged:: 8.6
+           *exclude* parameter was added.
+
+        :param exclude: sites which are already queried
+        """
         # How many home-language queries we still have?
         mycount = self.counts[self.site]
         # Do we still have enough subjects to work on for which the
@@ -1945,53 +1993,94 @@ class InterwikiBot:
                     else:
                         break
             # If we have a few, getting the home language is a good thing.
-            if not self.conf.restore_all and self.counts[self.site] > 4:
+            if not self.conf.restore_all and self.counts[self.site] > 4 \
+               and self.site not in exclude:
                 return self.site
         # If getting the home language doesn't make sense, see how many
         # foreign page queries we can find.
-        return self.maxOpenSite()
+        return self.maxOpenSite(exclude)
 
-    def oneQuery(self) -> bool:
-        """
-        Perform one step in the solution process.
+    def dispatch(self) -> bool:
+        """Start preloading page batches of further sites.
 
-        Returns True if pages could be preloaded, or false
-        otherwise.
+        Up to ``conf.querysites`` sites are queried at the same time but
+        only one batch per site; each site uses its own throttle.
+
+        .. versionadded:: 8.6
+
+        :return: True if any batch is being preloaded
         """
-        # First find the best language to work on
-        site = self.selectQuerySite()
-        if site is None:
-            pywikibot.info('NOTE: Nothing left to do')
-            return False
-        # Now assemble a reasonable list of pages to get
-        subjectGroup = []
-        pageGroup = []
-        for subject in self.subjects:
-            # Promise the subject that we will work on the site.
-            # We will get a list of pages we can do.
-            pages = subject.whatsNextPageBatch(site)
-            if pages:
-                pageGroup.extend(pages)
-                subjectGroup.append(subject)
-                if len(pageGroup) >= self.conf.maxquerysize:
-                    # We have found enough pages to fill the bandwidth.
-                    break
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=max(1, self.conf.querysites))
+
+        while len(self.queries) < max(1, self.conf.querysites):
+            busy = {site for site, _ in self.queries.values()}
+            # First find the best language to work on
+            site = self.selectQuerySite(busy)
+            if site is None:
+                if not self.queries:
+                    pywikibot.info('NOTE: Nothing left to do')
+                break
 
-        if not pageGroup:
-            pywikibot.info('NOTE: Nothing left to do 2')
-            return False
+            # Now assemble a reasonable list of pages to get
+            subjectGroup = []
+            pageGroup = []
+            for subject in self.subjects:
+                # Promise the subject that we will work on the site.
+                # We will get a list of pages we can do.
+                pages = subject.whatsNextPageBatch(site)
+                if pages:
+                    pageGroup.extend(pages)
+                    subjectGroup.append(subject)
+                    if len(pageGroup) >= self.conf.maxquerysize:
+                        # We have found enough pages to fill the bandwidth.
+                        break
+
+            if not pageGroup:
+                if not self.queries:
+                    pywikibot.info('NOTE: Nothing left to do 2')
+                break
 
-        # Get the content of the assembled list in one blow
-        gen = site.preloadpages(pageGroup, templates=True, langlinks=True,
+            future = self.executor.submit(self.preload, site, pageGroup)
+            self.queries[future] = (site, subjectGroup)
+
+        return bool(self.queries)
+
+    @staticmethod
+    def preload(site, pages) -> None:
+        """Get the content of the assembled list in one blow.
+
+        .. versionadded:: 8.6
+        """
+        gen = site.preloadpages(pages, templates=True, langlinks=True,
                                 pageprops=True, quiet=False)
         for _ in gen:
             # we don't want to do anything with them now. The
             # page contents will be read via the Subject class.
             pass
 
-        # Tell all of the subjects that the promised work is done
-        for subject in subjectGroup:
-            subject.batchLoaded(self)
+    def oneQuery(self) -> bool:
+        """
+        Perform one step in the solution process.
+
+        Returns True if pages could be preloaded, or false
+        otherwise.
+
+        .. versionchanged:: 8.6
+           batches of several sites are preloaded concurrently; every
+           loaded batch is passed to its subjects as soon as it arrives.
+        """
+        if not self.dispatch():
+            return False
+
+        done, _ = wait(self.queries, return_when=FIRST_COMPLETED)
+        for future in done:
+            site, subjectGroup = self.queries.pop(future)
+            future.result()
+            # Tell all of the subjects that the promised work is done
+            for subject in subjectGroup:
+                subject.batchLoaded(self, site)
         return True
 
     def queryStep(self) -> None:
@@ -2018,8 +2107,13 @@ class InterwikiBot:
 
     def run(self) -> None:
         """Start the process until finished."""
-        while not self.isDone():
-            self.queryStep()
+        try:
+            while not self.isDone():
+                self.queryStep()
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False)
+                self.executor = None
 
 
 def compareLanguages(old, new, insite, summary):
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Compile all i18n message bundles into a single indexed file.
+
+The compiled file is used by :func:`pywikibot.i18n.twtranslate` instead
+of reading a JSON file per message bundle and language. Run this script
+again whenever the i18n messages are updated; an outdated file is
+ignored.
+
+Syntax:
+
+    python pwb.py compile_i18n [-package:<name>] [-file:<filename>]
+
+The following parameters are supported:
+
+-package:   The messages package to be compiled. Default is
+            ``scripts.i18n``.
+
+-file:      The target file. Default is ``bundles.bin`` inside the
+            messages package.
+
+.. versionadded:: 8.6
+"""
+#
+# (C) Pywikibot team, 2023
+#
+# Distributed under the terms of the MIT license.
+#
+import pywikibot
+from pywikibot.bot import suggest_help
+from pywikibot import i18n
+
+
+def main(*args: str) -> None:
+    """Process command line arguments and compile the message bundles.
+
+    :param args: command line arguments
+    """
+    filename = None
+    for arg in pywikibot.handle_args(args):
+        opt, _, value = arg.partition(':')
+        if opt == '-package':
+            i18n.set_messages_package(value)
+        elif opt == '-file':
+            filename = value
+        else:
+            suggest_help(unknown_parameters=[arg])
+            return
+
+    if not i18n.messages_available():
+        pywikibot.error(
+            f'No messages found in package {i18n._messages_package_name}')
+        return
+
+    path = i18n.compile_bundles(filename)
+    pywikibot.info(f'<<lightgreen>>{path} compiled')
+
+
+if __name__ == '__main__':
+    main()
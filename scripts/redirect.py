@@ -39,6 +39,12 @@ and arguments can be:
                If neither of -xml -fullscan -moves is given, info will be
                loaded from a special page of the live wiki.
 
+-bulk          Load the whole redirect table at once, either from the live
+               wiki or together with -xml from the dump, and resolve all
+               redirect chains, loops and broken targets in one pass. Only
+               the redirects which need a fix are loaded and treated.
+               Cannot be used with -moves.
+
 -offset:n      With -moves, the number of hours ago to start scanning moved
                pages. With -xml, the number of the redirect to restart with
                (see progress). Otherwise, ignored.
@@ -105,11 +111,63 @@ def space_to_underscore(link) -> str:
     return link.canonical_title().replace(' ', '_')
 
 
+def resolve_redirect_chains(
+    redirects: Dict[str, str],
+    static: Set[str] = frozenset()
+) -> Dict[str, Tuple[Optional[int], str]]:
+    """Resolve all redirect chains in a single pass.
+
+    Every redirect is followed until a page is reached which is not a
+    redirect or is a static redirect. Results are shared between chains
+    and every redirect is visited once.
+
+    >>> chains = resolve_redirect_chains({'A': 'B', 'B': 'C', 'D': 'E',
+    ...                                   'E': 'D', 'F': 'E'})
+    >>> chains['A'], chains['B'], chains['F']
+    ((2, 'C'), (1, 'C'), (None, 'D'))
+
+    .. versionadded:: 8.6
+
+    :param redirects: a dict which maps redirect titles to their target
+        titles
+    :param static: titles of static redirects which are not followed
+    :return: a dict which maps each redirect title to a tuple of the
+        chain length and the final target title. The length is None if
+        the redirect leads into a loop; the final title is the title
+        where the loop was detected then.
+    """
+    chains = {}
+    for start in redirects:
+        path = []
+        seen = set()
+        title = start
+        while title not in chains:
+            path.append(title)
+            seen.add(title)
+            target = redirects[title]
+            if target not in redirects or target in static:
+                length, final = 0, target
+                break
+            if target in seen:
+                length, final = None, target
+                break
+            title = target
+        else:
+            length, final = chains[title]
+
+        for title in reversed(path):
+            if length is not None:
+                length += 1
+            chains[title] = length, final
+    return chains
+
+
 class RedirectGenerator(OptionHandler):
 
     """Redirect generator."""
 
     available_options = {
+        'bulk': False,
         'fullscan': False,
         'moves': False,
         'namespaces': {0},
@@ -127,7 +185,9 @@ class RedirectGenerator(OptionHandler):
 
         # connect the generator selected by 'action' parameter
         cls = self.__class__
-        if action == 'double':
+        if self.opt.bulk:
+            cls.__iter__ = lambda slf: slf.retrieve_redirects_in_bulk(action)
+        elif action == 'double':
             cls.__iter__ = lambda slf: slf.retrieve_double_redirects()
         elif action == 'broken':
             cls.__iter__ = lambda slf: slf.retrieve_broken_redirects()
@@ -226,6 +286,19 @@ class RedirectGenerator(OptionHandler):
         if chunk:
             yield chunk
 
+    def _query_redirects(self, pageids: List[str]) -> Dict[str, Any]:
+        """Resolve the given redirect page ids with a single API request."""
+        gen = pywikibot.data.api.Request(
+            site=self.site, parameters={'action': 'query',
+                                        'redirects': True,
+                                        'pageids': pageids})
+        data = gen.submit()
+        if 'error' in data:
+            raise RuntimeError(f'API query error: {data}')
+        if data == [] or 'query' not in data:
+            raise RuntimeError('No results given.')
+        return data
+
     def get_redirects_via_api(
         self,
         maxlen: int = 8
@@ -259,15 +332,7 @@ class RedirectGenerator(OptionHandler):
               where chain or loop detecton was halted, or None if unknown
         """
         for apiQ in self._next_redirect_group():
-            gen = pywikibot.data.api.Request(
-                site=self.site, parameters={'action': 'query',
-                                            'redirects': True,
-                                            'pageids': apiQ})
-            data = gen.submit()
-            if 'error' in data:
-                raise RuntimeError(f'API query error: {data}')
-            if data == [] or 'query' not in data:
-                raise RuntimeError('No results given.')
+            data = self._query_redirects(apiQ)
             pages = {}
             redirects = {x['from']: x['to']
                          for x in data['query']['redirects']}
@@ -292,6 +357,89 @@ class RedirectGenerator(OptionHandler):
                 if result != 1:
                     yield redirect, result, target, final
 
+    def get_redirect_map(self) -> Tuple[Dict[str, str], Set[str],
+                                        Set[str]]:
+        """Load the whole redirect table at once.
+
+        The redirects are read from the XML dump if the *xml* option is
+        given, otherwise they are resolved via API in batches of
+        :attr:`maxlimit<pywikibot.site._apisite.APISite.maxlimit>` pages.
+        Redirects to other sites are ignored.
+
+        .. versionadded:: 8.6
+
+        :return: a dict which maps redirect titles to their target
+            titles, a set of titles of existing pages and a set of
+            titles of static redirects
+        """
+        if 'staticredirect' in self.site.get_property_names():
+            static = self.site.pages_with_property('staticredirect')
+        else:
+            static = []
+
+        if self.opt.xml:
+            redirects, titles = self.get_redirects_from_dump(
+                alsoGetPageTitles=True)
+            return redirects, titles, {page.title(underscore=True)
+                                       for page in static}
+
+        redirects = {}
+        titles = set()
+        for pageids in self._next_redirect_group():
+            query = self._query_redirects(pageids)['query']
+            redirects.update((redirect['from'], redirect['to'])
+                             for redirect in query.get('redirects', [])
+                             if 'tointerwiki' not in redirect)
+            titles.update(page['title'] for page in query['pages'].values()
+                          if 'pageid' in page)
+        pywikibot.info()
+        return redirects, titles, {page.title() for page in static}
+
+    def retrieve_redirects_in_bulk(self, action: str) -> Generator[
+            pywikibot.Page, None, None]:
+        """Retrieve broken and double redirects from the redirect table.
+
+        The redirect table is loaded once by :meth:`get_redirect_map`
+        and resolved by :func:`resolve_redirect_chains`. Only the
+        redirects which need a fix for the given *action* are preloaded
+        and yielded. Their ``_redirect_type``, ``_redirect_target`` and
+        ``_redirect_final`` attributes are set as described in
+        :meth:`get_redirects_via_api`.
+
+        .. versionadded:: 8.6
+
+        :param action: ``'double'``, ``'broken'`` or ``'both'``
+        """
+        pywikibot.info('Loading the redirect table...')
+        redirects, titles, static = self.get_redirect_map()
+        chains = resolve_redirect_chains(redirects, static)
+        pywikibot.info(f'{len(redirects)} redirects loaded.')
+
+        def candidates():
+            count = 0
+            for title, (length, final) in chains.items():
+                if length is None:
+                    pywikibot.warning(f'{title} is part of a redirect loop '
+                                      f'at {final}, skipping.')
+                    continue
+                if final not in titles and final not in redirects:
+                    if length > 1 or action == 'double':
+                        continue  # fix the end of the chain first
+                    length = 0
+                elif length == 1 or action == 'broken':
+                    continue
+
+                page = pywikibot.Page(self.site, title)
+                page._redirect_type = length
+                page._redirect_target = redirects[title]
+                page._redirect_final = final
+                yield page
+                count += 1
+                if self.opt.limit and count >= self.opt.limit:
+                    break
+
+        yield from self.site.preloadpages(candidates())
+
     def retrieve_broken_redirects(self) -> Generator[
             Union[str, pywikibot.Page], None, None]:
         """Retrieve broken redirects."""
@@ -602,7 +750,15 @@ class RedirectRobot(ExistingPageBot):
         return True
 
     def fix_1_double_redirect(self) -> None:
-        """Treat one double redirect."""
+        """Treat one double redirect.
+
+        .. versionchanged:: 8.6
+           chains resolved from the redirect table are fixed directly
+        """
+        if hasattr(self.current_page, '_redirect_final') \
+           and self.fix_resolved_double_redirect():
+            return
+
         newRedir = redir = self.current_page
         redirList = []  # bookkeeping to detect loops
         while True:
@@ -619,13 +775,7 @@ class RedirectRobot(ExistingPageBot):
                     break
 
                 pywikibot.info(f'   Links to: {targetPage}.')
-                mw_msg = None
-                with suppress(KeyError):
-                    mw_msg = targetPage.site.mediawiki_message(
-                        'wikieditor-toolbar-tool-redirect-example')
-                if mw_msg and targetPage.title() == mw_msg:
-                    pywikibot.info('Skipping toolbar example: Redirect source '
-                                   'is potentially vandalized.')
+                if self.is_toolbar_example(targetPage):
                     break
 
                 # watch out for redirect loops
@@ -652,24 +802,76 @@ class RedirectRobot(ExistingPageBot):
                     newRedir = targetPage
                     continue
 
-            oldText = redir.get(get_redirect=True)
-            if self.is_repo and redir.namespace() == self.repo.item_namespace:
-                redir = pywikibot.ItemPage(self.repo, redir.title())
-                targetPage = pywikibot.ItemPage(self.repo, targetPage.title())
-                pywikibot.info('Fixing double item redirect')
-                redir.set_redirect_target(targetPage)
-                break
-            redir.set_redirect_target(targetPage, keep_section=True,
-                                      save=False)
-            summary = i18n.twtranslate(
-                redir.site, 'redirect-fix-double',
-                {'to': targetPage.title(as_link=True, allow_interwiki=False)},
-                bot_prefix=True)
-            self.userPut(redir, oldText, redir.text, summary=summary,
-                         ignore_save_related_errors=True,
-                         ignore_server_errors=True)
+            self.set_double_redirect_target(redir, targetPage)
             break
 
+    def fix_resolved_double_redirect(self) -> bool:
+        """Treat one double redirect with an already resolved chain.
+
+        The chain was resolved by
+        :meth:`RedirectGenerator.retrieve_redirects_in_bulk`. The
+        redirect is retargeted to the final target without loading the
+        pages in between.
+
+        .. versionadded:: 8.6
+
+        :return: False if the redirect was changed since the redirect
+            table was loaded and must be resolved step by step
+        """
+        redir = self.current_page
+        try:
+            target = redir.getRedirectTarget()
+        except (CircularRedirectError, InterwikiRedirectPageError,
+                InvalidTitleError, IsNotRedirectPageError, NoPageError):
+            return False
+
+        expected = pywikibot.Page(redir.site, redir._redirect_target)
+        if target.title(with_section=False) != expected.title():
+            return False
+
+        target = pywikibot.Page(redir.site, redir._redirect_final)
+        pywikibot.info(f'   Links to: {target}.')
+        if not self.is_toolbar_example(target):
+            self.set_double_redirect_target(redir, target)
+        return True
+
+    @staticmethod
+    def is_toolbar_example(page) -> bool:
+        """Check whether the page is the redirect toolbar example.
+
+        .. versionadded:: 8.6
+        """
+        mw_msg = None
+        with suppress(KeyError):
+            mw_msg = page.site.mediawiki_message(
+                'wikieditor-toolbar-tool-redirect-example')
+        if mw_msg and page.title() == mw_msg:
+            pywikibot.info('Skipping toolbar example: Redirect source '
+                           'is potentially vandalized.')
+            return True
+        return False
+
+    def set_double_redirect_target(self, redir, target) -> None:
+        """Retarget a double redirect and save it.
+
+        .. versionadded:: 8.6
+        """
+        oldText = redir.get(get_redirect=True)
+        if self.is_repo and redir.namespace() == self.repo.item_namespace:
+            redir = pywikibot.ItemPage(self.repo, redir.title())
+            target = pywikibot.ItemPage(self.repo, target.title())
+            pywikibot.info('Fixing double item redirect')
+            redir.set_redirect_target(target)
+            return
+        redir.set_redirect_target(target, keep_section=True, save=False)
+        summary = i18n.twtranslate(
+            redir.site, 'redirect-fix-double',
+            {'to': target.title(as_link=True, allow_interwiki=False)},
+            bot_prefix=True)
+        self.userPut(redir, oldText, redir.text, summary=summary,
+                     ignore_save_related_errors=True,
+                     ignore_server_errors=True)
+
     def fix_double_or_delete_broken_redirect(self) -> None:
         """Treat one broken or double redirect."""
         if self.current_page._redirect_type == 0:
@@ -723,6 +925,8 @@ def main(*args: str) -> None:
             options['sdtemplate'] = value or pywikibot.input(
                 'Which speedy deletion template to use?')
         # generator options
+        elif option == 'bulk':
+            gen_options[option] = True
         elif option in ('fullscan', 'moves'):
             gen_options[option] = True
             source.add(arg)
@@ -744,6 +948,9 @@ def main(*args: str) -> None:
     problem = 'You can only use one of {} options.'.format(
         ' or '.join(source)) if len(source) > 1 else ''
 
+    if gen_options.get('bulk') and '-moves' in source:
+        problem += ' You cannot use -bulk together with -moves.'
+
     if action == 'both' and '-fullscan' in source:
         problem += (' You can only use either -fullscan together with '
                     "broken/double action or 'both' action")
@@ -38,6 +38,16 @@ by default::
 -summary          Use a custom edit summary. Otherwise it uses the
                   default one from translatewiki
 
+-workers:n        Number of links fetched at the same time. Default is 8.
+                  Not more than two links of the same host are fetched
+                  simultaneously.
+
+-lookahead:n      Number of upcoming pages whose links are fetched in
+                  advance. Default is 10.
+
+-cachedays:n      Keep fetched titles for n days in a cache file. Default is
+                  30; 0 disables the cache.
+
 The following generators and filters are supported:
 
 &params;
@@ -48,20 +58,27 @@ The following generators and filters are supported:
 #
 import http.client as httplib
 import itertools
+import json
 import os
 import re
+import sqlite3
 import subprocess
 import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from enum import IntEnum
 from functools import partial
 from http import HTTPStatus
 from pathlib import Path
 from textwrap import shorten
+from typing import Any, Optional
 
 import pywikibot
 from pywikibot import comms, config, i18n, pagegenerators, textlib
-from pywikibot.backports import removeprefix
+from pywikibot.backports import Dict, removeprefix
 from pywikibot.bot import ConfigParserBot, ExistingPageBot, SingleSiteBot
 from pywikibot.comms.http import get_charset_from_content_type
 from pywikibot.exceptions import ServerError
@@ -412,20 +429,77 @@ class DuplicateReferences:
         return text
 
 
+class TitleCache:
+
+    """Persistent cache of link information fetched by ReferencesRobot.
+
+    The information of a link is stored as JSON in a SQLite database
+    and expires after *ttl* seconds.
+
+    .. versionadded:: 8.6
+    """
+
+    def __init__(self, filename: str, ttl: float) -> None:
+        """Initializer.
+
+        :param filename: the database file
+        :param ttl: time to live of an entry in seconds
+        """
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(filename, check_same_thread=False)
+        with self.db:
+            self.db.execute('CREATE TABLE IF NOT EXISTS links ('
+                            'url TEXT PRIMARY KEY, '
+                            'fetched REAL NOT NULL, '
+                            'info TEXT NOT NULL)')
+            self.db.execute('DELETE FROM links WHERE fetched < ?',
+                            (time.time() - ttl,))
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the cached information of url if not expired."""
+        with self.lock:
+            row = self.db.execute(
+                'SELECT info FROM links WHERE url = ? AND fetched >= ?',
+                (url, time.time() - self.ttl)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def set(self, url: str, info: Dict[str, Any]) -> None:
+        """Store the information of url."""
+        with self.lock, self.db:
+            self.db.execute(
+                'INSERT OR REPLACE INTO links (url, fetched, info) '
+                'VALUES (?, ?, ?)', (url, time.time(), json.dumps(info)))
+
+    def close(self) -> None:
+        """Close the database."""
+        with self.lock:
+            self.db.close()
+
+
 class ReferencesRobot(SingleSiteBot, ConfigParserBot, ExistingPageBot):
 
     """References bot.
 
     .. versionchanged:: 7.0
        ReferencesRobot is a ConfigParserBot
+    .. versionchanged:: 8.6
+       links are fetched concurrently in advance and their titles are
+       cached; *workers*, *lookahead* and *cachedays* options were added
     """
 
     use_redirects = False
 
+    #: number of links of the same host which are fetched simultaneously
+    host_connections = 2
+
     update_options = {
+        'cachedays': 30,
         'ignorepdf': False,
         'limit': 0,  # stop after n modified pages
+        'lookahead': 10,
         'summary': '',
+        'workers': 8,
     }
 
     def __init__(self, **kwargs) -> None:
@@ -481,6 +555,11 @@ class ReferencesRobot(SingleSiteBot, ConfigParserBot, ExistingPageBot):
         self.MIME = re.compile(
             r'application/(?:xhtml\+xml|xml)|text/(?:ht|x)ml')
 
+        self.cache = None
+        self._executor = None
+        self._futures = {}
+        self._host_locks = {}
+
     @staticmethod
     def httpError(err_num, link, pagetitleaslink) -> None:
         """Log HTTP Error."""
@@ -525,7 +604,11 @@ class ReferencesRobot(SingleSiteBot, ConfigParserBot, ExistingPageBot):
                 os.unlink(infile)
 
     def setup(self):
-        """Read dead links from file."""
+        """Read dead links from file and start fetching links.
+
+        .. versionchanged:: 8.6
+           open the title cache and start the fetch workers
+        """
         try:
             path = Path(listof404pages)
             self.dead_links = path.read_text(encoding='latin_1')
@@ -536,6 +619,181 @@ class ReferencesRobot(SingleSiteBot, ConfigParserBot, ExistingPageBot):
                 'http://www.twoevils.org/files/wikipedia/404-links.txt.gz\n'
                 'and to unzip it in the same directory')
 
+        if int(self.opt.cachedays):
+            self.cache = TitleCache(
+                config.datafilepath('reflinks', 'cache-{}-{}.sqlite'.format(
+                    self.site.family.name, self.site.code)),
+                int(self.opt.cachedays) * 24 * 60 * 60)
+        self._executor = ThreadPoolExecutor(max_workers=int(self.opt.workers))
+        self.generator = self.lookahead(self.generator)
+
+    def teardown(self) -> None:
+        """Stop the fetch workers and close the title cache.
+
+        .. versionadded:: 8.6
+        """
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        if self._executor:
+            self._executor.shutdown(wait=True)
+        if self.cache:
+            self.cache.close()
+        super().teardown()
+
+    def lookahead(self, generator):
+        """Yield pages from generator after their links are prefetched.
+
+        The links of the next *lookahead* pages are fetched in the
+        background while the current page is processed.
+
+        .. versionadded:: 8.6
+        """
+        pages = deque()
+        try:
+            for page in generator:
+                self.prefetch(page)
+                pages.append(page)
+                if len(pages) > int(self.opt.lookahead):
+                    yield pages.popleft()
+            while pages:
+                yield pages.popleft()
+        finally:
+            with suppress(AttributeError):
+                generator.close()
+
+    def prefetch(self, page) -> None:
+        """Start fetching all bare reference links of page.
+
+        .. versionadded:: 8.6
+        """
+        try:
+            text = textlib.removeDisabledParts(page.text)
+        except Exception as e:
+            pywikibot.log(f'Cannot prefetch links of {page}: {e}')
+            return
+
+        for match in linksInRef.finditer(text):
+            url = re.sub('#.*', '', match['url'])
+            if 'jstor.org' in url or url in self._futures \
+               or self.cache and self.cache.get(url) is not None:
+                continue
+            self._futures[url] = self._executor.submit(self.fetch_link,
+                                                       match['url'])
+
+    def get_link_info(self, link: str) -> Dict[str, Any]:
+        """Return the information of a link.
+
+        The information is taken from a prefetched result, the cache or
+        fetched now. Only successfully retrieved links are cached.
+
+        .. versionadded:: 8.6
+        """
+        url = re.sub('#.*', '', link)
+        future = self._futures.pop(url, None)
+        if future is not None:
+            info = future.result()
+        else:
+            info = self.cache.get(url) if self.cache else None
+            if info is not None:
+                return info
+            info = self.fetch_link(link)
+
+        # errors and error statuses may be temporary
+        if self.cache and not info['error'] \
+           and info['status'] == HTTPStatus.OK:
+            self.cache.set(url, info)
+        return info
+
+    def fetch_link(self, link: str) -> Dict[str, Any]:
+        """Fetch a link and extract the information to create a title.
+
+        Not more than :attr:`host_connections` requests to the same
+        host are made simultaneously.
+
+        .. versionadded:: 8.6
+
+        :return: a dict with the keys *url* (the real url after
+            redirects), *status*, *content_type*, *media* (whether it
+            is not a HTML page), *title* (PDF title), *titles* (content
+            of the HTML title tags) and *error* (a message if the link
+            cannot be retrieved or ``'unicode'`` for a bad link)
+        """
+        ref = RefLink(link, None, site=self.site)
+        info = {'url': ref.url, 'status': None, 'content_type': None,
+                'media': False, 'title': None, 'titles': [], 'error': None}
+        host = domain.findall(ref.url)
+        lock = self._host_locks.setdefault(
+            host[0][1] if host else '',
+            threading.BoundedSemaphore(self.host_connections))
+        try:
+            with lock:
+                r = comms.http.fetch(
+                    ref.url, use_fake_user_agent=self._use_fake_user_agent)
+        except UnicodeError:
+            # example:
+            # http://www.adminet.com/jo/20010615¦/ECOC0100037D.html
+            # in [[fr:Cyanure]]
+            info['error'] = 'unicode'
+            return info
+        except (ValueError,  # urllib3.LocationParseError derives from it
+                OSError,
+                httplib.error,
+                ServerError) as err:
+            info['error'] = (f"{err.__class__.__name__}: Can't retrieve url "
+                             f'{ref.url}: {err}')
+            return info
+
+        # Get the real url where we end (http redirects !)
+        info['url'] = r.url
+        info['status'] = r.status_code
+
+        # Try to get Content-Type from server
+        content_type = r.headers.get('content-type')
+        if content_type and not self.MIME.search(content_type):
+            info['media'] = True
+            if ref.link.lower().endswith('.pdf') and not self.opt.ignorepdf:
+                # If file has a PDF suffix
+                self.getPDFTitle(ref, r)
+                info['title'] = ref.title
+            return info
+
+        if r.status_code != HTTPStatus.OK:
+            return info
+
+        linkedpagetext = r.content
+        # remove <script>/<style>/comments/CDATA tags
+        linkedpagetext = self.NON_HTML.sub(b'', linkedpagetext)
+
+        meta_content = self.META_CONTENT.search(linkedpagetext)
+        encoding = None
+        if content_type:
+            encoding = get_charset_from_content_type(content_type)
+
+        if meta_content:
+            tag = None
+            encodings = [encoding] if encoding else []
+            encodings += list(self.site.encodings())
+            for enc in encodings:
+                with suppress(UnicodeDecodeError):
+                    tag = meta_content.group().decode(enc)
+                    break
+
+            # Prefer the content-type from the HTTP header
+            if not content_type and tag:
+                content_type = tag
+            if not encoding:
+                encoding = get_charset_from_content_type(tag)
+
+        info['content_type'] = content_type
+        if not content_type or not self.MIME.search(content_type):
+            return info
+
+        if encoding:
+            r.encoding = encoding
+        info['titles'] = [t for t in self.TITLE.findall(r.text) if t]
+        return info
+
     def skip_page(self, page):
         """Skip unwanted pages."""
         if super().skip_page(page):
@@ -561,113 +819,67 @@ class ReferencesRobot(SingleSiteBot, ConfigParserBot, ExistingPageBot):
                 continue
 
             ref = RefLink(link, match['name'], site=self.site)
+            info = self.get_link_info(link)
 
-            try:
-                r = comms.http.fetch(
-                    ref.url, use_fake_user_agent=self._use_fake_user_agent)
-
-                # Try to get Content-Type from server
-                content_type = r.headers.get('content-type')
-                if content_type and not self.MIME.search(content_type):
-                    if ref.link.lower().endswith('.pdf') \
-                       and not self.opt.ignorepdf:
-                        # If file has a PDF suffix
-                        self.getPDFTitle(ref, r)
-                    else:
-                        pywikibot.info(f'<<lightyellow>>WARNING<<default>> : '
-                                       f'media : {ref.link} ')
-
-                    if not ref.title:
-                        repl = ref.refLink()
-                    elif not re.match('(?i) *microsoft (word|excel|visio)',
-                                      ref.title):
-                        ref.transform(ispdf=True)
-                        repl = ref.refTitle()
-                    else:
-                        pywikibot.info(f'<<lightyellow>>WARNING<<default>> : '
-                                       f'PDF title blacklisted : {ref.title} ')
-                        repl = ref.refLink()
-
-                    new_text = new_text.replace(match.group(), repl)
-                    continue
-
-                # Get the real url where we end (http redirects !)
-                redir = r.url
-                if redir != ref.link \
-                   and domain.findall(redir) == domain.findall(link):
-                    if soft404.search(redir) \
-                       and not soft404.search(ref.link):
-                        pywikibot.info(f'<<lightyellow>>WARNING<<default>> : '
-                                       f'Redirect 404 : {ref.link} ')
-                        continue
-
-                    if dirIndex.fullmatch(redir) \
-                       and not dirIndex.fullmatch(ref.link):
-                        pywikibot.info(f'<<lightyellow>>WARNING<<default>> : '
-                                       f'Redirect to root : {ref.link} ')
-                        continue
-
-                if r.status_code != HTTPStatus.OK:
-                    pywikibot.stdout('HTTP error ({}) for {} on {}'
-                                     .format(r.status_code, ref.url,
-                                             page.title(as_link=True)))
-                    # 410 Gone, indicates that the resource has been
-                    # purposely removed
-                    if r.status_code == HTTPStatus.GONE \
-                       or (r.status_code == HTTPStatus.NOT_FOUND
-                           and f'\t{ref.url}\t' in self.dead_links):
-                        repl = ref.refDead()
-                        new_text = new_text.replace(match.group(), repl)
-                    continue
-
-            except UnicodeError:
-                # example:
-                # http://www.adminet.com/jo/20010615¦/ECOC0100037D.html
-                # in [[fr:Cyanure]]
+            if info['error'] == 'unicode':
                 pywikibot.info(
                     f'<<lightred>>Bad link<<default>> : {ref.url} in {page}')
                 continue
 
-            except (ValueError,  # urllib3.LocationParseError derives from it
-                    OSError,
-                    httplib.error,
-                    ServerError) as err:
-                pywikibot.info(f"{err.__class__.__name__}: Can't retrieve url "
-                               f'{ref.url}: {err}')
+            if info['error']:
+                pywikibot.info(info['error'])
                 continue
 
-            linkedpagetext = r.content
-            # remove <script>/<style>/comments/CDATA tags
-            linkedpagetext = self.NON_HTML.sub(b'', linkedpagetext)
-
-            meta_content = self.META_CONTENT.search(linkedpagetext)
-            encoding = None
-            if content_type:
-                encoding = get_charset_from_content_type(content_type)
-
-            if meta_content:
-                tag = None
-                encodings = [encoding] if encoding else []
-                encodings += list(page.site.encodings())
-                for enc in encodings:
-                    with suppress(UnicodeDecodeError):
-                        tag = meta_content.group().decode(enc)
-                        break
+            if info['media']:
+                ref.title = info['title']
+                if not ref.title:
+                    repl = ref.refLink()
+                elif not re.match('(?i) *microsoft (word|excel|visio)',
+                                  ref.title):
+                    ref.transform(ispdf=True)
+                    repl = ref.refTitle()
+                else:
+                    pywikibot.info(f'<<lightyellow>>WARNING<<default>> : '
+                                   f'PDF title blacklisted : {ref.title} ')
+                    repl = ref.refLink()
 
-                # Prefer the content-type from the HTTP header
-                if not content_type and tag:
-                    content_type = tag
-                if not encoding:
-                    encoding = get_charset_from_content_type(tag)
+                new_text = new_text.replace(match.group(), repl)
+                continue
 
-            if encoding:
-                r.encoding = encoding
+            redir = info['url']
+            if redir != ref.link \
+               and domain.findall(redir) == domain.findall(link):
+                if soft404.search(redir) \
+                   and not soft404.search(ref.link):
+                    pywikibot.info(f'<<lightyellow>>WARNING<<default>> : '
+                                   f'Redirect 404 : {ref.link} ')
+                    continue
 
-            if not content_type:
+                if dirIndex.fullmatch(redir) \
+                   and not dirIndex.fullmatch(ref.link):
+                    pywikibot.info(f'<<lightyellow>>WARNING<<default>> : '
+                                   f'Redirect to root : {ref.link} ')
+                    continue
+
+            status = info['status']
+            if status != HTTPStatus.OK:
+                pywikibot.stdout('HTTP error ({}) for {} on {}'
+                                 .format(status, ref.url,
+                                         page.title(as_link=True)))
+                # 410 Gone, indicates that the resource has been
+                # purposely removed
+                if status == HTTPStatus.GONE \
+                   or (status == HTTPStatus.NOT_FOUND
+                       and f'\t{ref.url}\t' in self.dead_links):
+                    repl = ref.refDead()
+                    new_text = new_text.replace(match.group(), repl)
+                continue
+
+            if not info['content_type']:
                 pywikibot.info('No content-type found for ' + ref.link)
                 continue
 
-            if not self.MIME.search(content_type):
+            if not self.MIME.search(info['content_type']):
                 pywikibot.info(f'<<lightyellow>>WARNING<<default>> : media : '
                                f'{ref.link} ')
                 repl = ref.refLink()
@@ -675,13 +887,11 @@ class ReferencesRobot(SingleSiteBot, ConfigParserBot, ExistingPageBot):
                 continue
 
             # Retrieves the first non empty string inside <title> tags
-            for m in self.TITLE.finditer(r.text):
-                t = m.group()
-                if t:
-                    ref.title = t
-                    ref.transform()
-                    if ref.title:
-                        break
+            for t in info['titles']:
+                ref.title = t
+                ref.transform()
+                if ref.title:
+                    break
 
             if not ref.title:
                 repl = ref.refLink()
@@ -755,6 +965,8 @@ def main(*args: str) -> None:
         opt, _, value = arg.partition(':')
         if opt in ('-summary', '-limit'):
             options[opt[1:]] = value
+        elif opt in ('-workers', '-lookahead', '-cachedays'):
+            options[opt[1:]] = int(value)
         elif opt in ('-always', '-ignorepdf'):
             options[opt[1:]] = True
         elif opt == '-xmlstart':
@@ -36,18 +36,28 @@ The following parameters are supported:
 -dns, --dest-namespace  destination namespace (if different)
 
  destination_wiki       destination wiki(s)
+
+The destination wikis are processed concurrently. Only pages whose
+latest revision hash differs from the hash of the original text are
+downloaded and compared; see :func:`replicate_pages`.
+
+.. versionchanged:: 8.6
+   destination pages are compared by their sha1 hash first.
 """
 #
 # (C) Pywikibot team, 2012-2023
 #
 # Distributed under the terms of the MIT license.
 #
+import hashlib
 import sys
 from argparse import ArgumentParser
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 import pywikibot
 from pywikibot import Page, config
+from pywikibot.backports import Callable, Dict, Iterable, List
 from pywikibot.exceptions import IsRedirectPageError, NoPageError
 from pywikibot.i18n import twtranslate
 
@@ -59,6 +69,81 @@ def multiple_replace(text, word_dict):
     return text
 
 
+def text_sha1(text: str) -> str:
+    """Return the sha1 hash of a page text like MediaWiki computes it.
+
+    >>> text_sha1('')
+    'da39a3ee5e6b4b0d3255bfef95601890afd80709'
+
+    .. versionadded:: 8.6
+    """
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def replicate_pages(site, texts: Dict[str, str], summary: str, *,
+                    replace: bool = True, **kwargs) -> List[str]:
+    """Replicate texts to pages of a single site.
+
+    The latest revision hashes of all target pages are retrieved with
+    batched queries. Only pages whose hash differs from the hash of the
+    new text are downloaded, compared and saved.
+
+    .. versionadded:: 8.6
+
+    :param site: the target site
+    :param texts: mapping of target page titles to their new texts
+    :param summary: the edit summary
+    :param replace: save the differing pages; otherwise only show the
+        differences
+    :param kwargs: additional parameters for :meth:`Page.save()
+        <pywikibot.page.BasePage.save>`
+    :return: titles of the differing pages
+    """
+    pages = [(Page(site, title), text) for title, text in texts.items()]
+    for _ in site.preloadpages((page for page, _ in pages), content=False):
+        pass  # pages are updated in place
+
+    differences = []
+    for page, text in pages:
+        if page.exists() and page.latest_revision.sha1 == text_sha1(text):
+            continue
+
+        differences.append(page.title())
+        pywikibot.info(f'\n{site}: {page.title()} DIFFERS')
+        if page.exists():
+            pywikibot.showDiff(page.text, text)
+        if replace:
+            page.text = text
+            page.save(summary, **kwargs)
+    return differences
+
+
+def replicate_to_sites(sites: Iterable,
+                       texts_for: Callable[..., Dict[str, str]],
+                       summary_for: Callable[..., str], *,
+                       workers: int = 4,
+                       **kwargs) -> Dict['pywikibot.site.BaseSite', List[str]]:
+    """Replicate texts to several sites concurrently.
+
+    .. versionadded:: 8.6
+
+    :param sites: the target sites
+    :param texts_for: callable which returns the :func:`replicate_pages`
+        *texts* mapping for a given site
+    :param summary_for: callable which returns the edit summary for a
+        given site
+    :param workers: the number of sites processed at the same time
+    :param kwargs: additional parameters for :func:`replicate_pages`
+    :return: titles of the differing pages for each site
+    """
+    with ThreadPoolExecutor(workers) as executor:
+        futures = {site: executor.submit(replicate_pages, site,
+                                         texts_for(site), summary_for(site),
+                                         **kwargs)
+                   for site in sites}
+    return {site: future.result() for site, future in futures.items()}
+
+
 class SyncSites:
 
     """Work is done in here."""
@@ -134,18 +219,13 @@ class SyncSites:
     def check_namespace(self, namespace) -> None:
         """Check an entire namespace."""
         pywikibot.info(f'\nCHECKING NAMESPACE {namespace}')
-        pages = (p.title() for p in self.original.allpages(
-            '!', namespace=namespace))
-        for p in pages:
-            if p not in ['MediaWiki:Sidebar', 'MediaWiki:Mainpage',
-                         'MediaWiki:Sitenotice', 'MediaWiki:MenuSidebar']:
-                try:
-                    self.check_page(p)
-                except NoPageError:
-                    pywikibot.info(
-                        'Bizarre NoPageError that we are just going to ignore')
-                except IsRedirectPageError:
-                    pywikibot.error('Redirectpage - todo: handle gracefully')
+        pages = [p for p in self.original.allpages('!', namespace=namespace,
+                                                   content=True)
+                 if p.title() not in ['MediaWiki:Sidebar',
+                                      'MediaWiki:Mainpage',
+                                      'MediaWiki:Sitenotice',
+                                      'MediaWiki:MenuSidebar']]
+        self.check_pages(pages)
         pywikibot.info()
 
     def generate_overviews(self) -> None:
@@ -181,42 +261,48 @@ class SyncSites:
     def check_page(self, pagename) -> None:
         """Check one page."""
         pywikibot.info('\nChecking ' + pagename)
-        page1 = Page(self.original, pagename)
-        txt1 = page1.text
+        self.check_pages([Page(self.original, pagename)])
+
+    def check_pages(self, pages: List[Page]) -> None:
+        """Check original pages on all destination sites concurrently.
 
+        .. versionadded:: 8.6
+        """
         if self.options.dest_namespace:
             dest_ns = int(self.options.dest_namespace)
         else:
             dest_ns = None
 
-        for site in self.sites:
-            if dest_ns is not None:
-                page2 = Page(site, page1.title(with_ns=False), dest_ns)
-                pywikibot.info('\nCross namespace, new title: '
-                               + page2.title())
-            else:
-                page2 = Page(site, pagename)
-
-            txt2 = page2.text
-
-            if str(site) in config.replicate_replace:
-                txt_new = multiple_replace(txt1,
-                                           config.replicate_replace[str(site)])
-                if txt1 != txt_new:
-                    pywikibot.info(
-                        'NOTE: text replaced using config.sync_replace')
-                    pywikibot.info(f'{txt1} {txt_new} {txt2}')
-                    txt1 = txt_new
-
-            if txt1 != txt2:
-                pywikibot.info(f'\n {site} DIFFERS')
-                self.differences[site].append(pagename)
-
-            if self.options.replace:
-                page2.text = txt1
-                page2.save(self.put_message(site))
-            else:
-                pywikibot.stdout('.', newline=False)
+        originals = {}
+        for page in pages:
+            try:
+                originals[page] = page.text
+            except NoPageError:
+                pywikibot.info(
+                    'Bizarre NoPageError that we are just going to ignore')
+            except IsRedirectPageError:
+                pywikibot.error('Redirectpage - todo: handle gracefully')
+
+        def texts_for(site) -> Dict[str, str]:
+            texts = {}
+            for page, text in originals.items():
+                if dest_ns is not None:
+                    title = Page(site, page.title(with_ns=False),
+                                 dest_ns).title()
+                else:
+                    title = page.title()
+
+                if str(site) in config.replicate_replace:
+                    text = multiple_replace(
+                        text, config.replicate_replace[str(site)])
+                texts[title] = text
+            return texts
+
+        differences = replicate_to_sites(self.sites, texts_for,
+                                         self.put_message,
+                                         replace=self.options.replace)
+        for site, titles in differences.items():
+            self.differences[site] += titles
 
 
 def main(*args: str) -> None:
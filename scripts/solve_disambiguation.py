@@ -69,19 +69,25 @@ Command line options:
    -min:XX     (XX being a number) only work on disambiguation pages for which
                at least XX are to be worked on.
 
+   -batch:XX   collect the references of XX disambiguation pages at once
+               (default 50). Every referring page is loaded once and all
+               its links to these disambiguation pages are fixed in a
+               single edit.
+
 To complete a move of a page, one can use:
 
     python pwb.py solve_disambiguation -just -pos:New_Name Old_Name
 
 """
 #
-# (C) Pywikibot team, 2003-2023
+# (C) Pywikibot team, 2003-2024
 #
 # Distributed under the terms of the MIT license.
 #
 import codecs
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from itertools import chain
 from typing import Generator, Optional
@@ -90,7 +96,7 @@ import pywikibot
 from pywikibot import config
 from pywikibot import editor as editarticle
 from pywikibot import i18n, pagegenerators
-from pywikibot.backports import List
+from pywikibot.backports import Dict, List, batched
 from pywikibot.bot import (
     HighlightContextOption,
     ListOption,
@@ -618,8 +624,13 @@ class DisambiguationRobot(SingleSiteBot):
         'main': False,  # only use main namespace
         'first': False,  # use first link only
         'min': 0,  # minimum number of pages on a disambig
+        'batch': 0,  # number of disambigs to collect references for at once
     }
 
+    #: number of disambiguation pages whose references are collected
+    #: concurrently in batch mode
+    backlink_workers = 4
+
     # needed for argument cleanup
     available_options = disambig_options
 
@@ -631,6 +642,14 @@ class DisambiguationRobot(SingleSiteBot):
         self.summary = None
         self.dn_template_str = i18n.translate(self.site, dn_template)
 
+        # batch mode: data of the current batch of disambiguation pages
+        self.disamb_alternatives: Dict[pywikibot.Page, List[str]] = {}
+        self.disamb_ignores: Dict[pywikibot.Page, PrimaryIgnoreManager] = {}
+        self.disamb_redirects: Dict[pywikibot.Page,
+                                    List[pywikibot.Page]] = {}
+        self.referring: Dict[str, List[pywikibot.Page]] = {}
+        self.summaries: List[str] = []
+
     def _clean_args(self, args, kwargs) -> None:
         """Cleanup positional and keyword arguments.
 
@@ -747,6 +766,9 @@ DisambiguationRobot""".format(options=added_keys,
                (\|(?P<label>     [^\]]*))?  \]\]
             (?P<linktrail>{})""".format(linktrail), flags=re.X)
 
+        if self.opt.batch:
+            self.generator = self.batch_generator(self.generator)
+
     @staticmethod
     def firstlinks(page) -> Generator[str, None, None]:
         """Return a list of first links of every line beginning with `*`.
@@ -791,9 +813,11 @@ DisambiguationRobot""".format(options=added_keys,
         """
         nochange = True
 
-        for page in chain(
-            (disamb_page,), disamb_page.getReferences(filter_redirects=True)
-        ):
+        redirects = self.disamb_redirects.get(disamb_page)
+        if redirects is None:
+            redirects = disamb_page.getReferences(filter_redirects=True)
+
+        for page in chain((disamb_page,), redirects):
             treat_result = self.treat_disamb_only(ref_page, page)
             if treat_result == 'nextpage':
                 return True
@@ -826,6 +850,9 @@ DisambiguationRobot""".format(options=added_keys,
         new_targets = []
         try:
             text = ref_page.get()
+            if self.opt.batch:
+                # continue with the changes for other disambiguations
+                text = ref_page.text
         except IsRedirectPageError:
             pywikibot.info('{} is a redirect to {}'
                            .format(ref_page.title(), disamb_page.title()))
@@ -852,11 +879,16 @@ DisambiguationRobot""".format(options=added_keys,
                         ref_page, self.opt.primary, main_only=self.opt.main
                     )
                     gen = pagegenerators.PreloadingGenerator(gen)
+                    summaries, self.summaries = self.summaries, []
                     for ref_page2 in gen:
                         # run until the user selected 'quit'
                         self.treat_links(ref_page2, ref_page)
+                        self.save_batch(ref_page2)
+                    self.summaries = summaries
                 elif choice == 'c':
                     text = ref_page.get(get_redirect=True)
+                    if self.opt.batch:
+                        text = ref_page.text
                     include = 'redirect'
         except NoPageError:
             pywikibot.info(f'Page [[{ref_page.title()}]] does not seem to'
@@ -1084,15 +1116,28 @@ DisambiguationRobot""".format(options=added_keys,
                 # save the page
                 self.setSummaryMessage(disamb_page, new_targets,
                                        unlink_counter, dn)
-                try:
-                    ref_page.put(text, summary=self.summary, asynchronous=True)
-                except LockedPageError:
-                    pywikibot.info('Page not saved: page is locked')
-                except PageSaveRelatedError as error:
-                    pywikibot.info(f'Page not saved: {error.args}')
+                if self.opt.batch:
+                    # saved together with the other changes
+                    ref_page.text = text
+                    self.summaries.append(self.summary)
+                else:
+                    self.save(ref_page, text, self.summary)
 
         return 'done'
 
+    @staticmethod
+    def save(ref_page, text: str, summary: str) -> None:
+        """Save the referring page.
+
+        .. versionadded:: 8.6
+        """
+        try:
+            ref_page.put(text, summary=summary, asynchronous=True)
+        except LockedPageError:
+            pywikibot.info('Page not saved: page is locked')
+        except PageSaveRelatedError as error:
+            pywikibot.info(f'Page not saved: {error.args}')
+
     def findAlternatives(self, page) -> bool:  # noqa: N802
         """Extend self.opt.pos using correctcap of disambPage.linkedPages.
 
@@ -1259,13 +1304,20 @@ or press enter to quit:""")
         """Write ignoring pages to a file."""
         self.primaryIgnoreManager.ignore(self.ignores)
 
-    def treat(self, page) -> None:
-        """Work on a single disambiguation page."""
+    def load_alternatives(self, page) -> bool:
+        """Set up the ignore manager and the alternatives for a page.
+
+        .. versionadded:: 8.6
+
+        :param page: the disambiguation page
+        :type page: pywikibot.Page
+        :return: False if the page is to be skipped
+        """
         self.primaryIgnoreManager = PrimaryIgnoreManager(
             page, enabled=self.opt.primary)
 
         if not self.findAlternatives(page):
-            return
+            return False
 
         pywikibot.info(f'\nAlternatives for {page}')
         self.makeAlternativesUnique()
@@ -1275,6 +1327,116 @@ or press enter to quit:""")
         else:
             self.opt.pos.sort()
         SequenceOutputter(self.opt.pos).output()
+        return True
+
+    def collect_references(self, pages) -> None:
+        """Collect the references of a batch of disambiguation pages.
+
+        The alternatives of every disambiguation page are determined
+        first. Then the referring pages and the redirects of all pages
+        are retrieved concurrently and :attr:`referring` maps the title
+        of every referring page to the disambiguation pages it refers
+        to.
+
+        .. versionadded:: 8.6
+
+        :param pages: disambiguation pages
+        :type pages: Iterable[pywikibot.Page]
+        """
+        self.disamb_alternatives.clear()
+        self.disamb_ignores.clear()
+        self.disamb_redirects.clear()
+        self.referring.clear()
+
+        for page in pages:
+            if self.load_alternatives(page):
+                self.disamb_alternatives[page] = self.opt.pos
+                self.disamb_ignores[page] = self.primaryIgnoreManager
+            # clear alternatives before working on next disambiguation page
+            self.opt.pos = []
+
+        def references(page):
+            refs = list(ReferringPageGeneratorWithIgnore(
+                page, self.opt.primary, minimum=self.opt.min,
+                main_only=self.opt.main))
+            return refs, list(page.getReferences(filter_redirects=True))
+
+        with ThreadPoolExecutor(self.backlink_workers) as executor:
+            pages = list(self.disamb_alternatives)
+            for page, (refs, redirects) in zip(
+                    pages, executor.map(references, pages)):
+                self.disamb_redirects[page] = redirects
+                for ref_page in refs:
+                    if not self.disamb_ignores[page].isIgnored(ref_page):
+                        self.referring.setdefault(ref_page.title(),
+                                                  []).append(page)
+
+    def batch_generator(
+        self,
+        generator
+    ) -> Generator[pywikibot.Page, None, None]:
+        """Yield the pages referring to batches of disambiguation pages.
+
+        Every referring page of a batch is yielded and preloaded once.
+
+        .. versionadded:: 8.6
+
+        :param generator: generator of disambiguation pages
+        """
+        for pages in batched(generator, self.opt.batch):
+            self.collect_references(pages)
+            pywikibot.info(
+                f'\n{len(self.referring)} pages refer to '
+                f'{len(self.disamb_alternatives)} disambiguation pages.')
+            yield from self.site.preloadpages(
+                pywikibot.Page(self.site, title) for title in self.referring)
+
+    def treat_referring_page(self, ref_page) -> None:
+        """Resolve the links to all disambiguation pages in one edit.
+
+        Choosing "next disambig" skips the disambiguation page for the
+        rest of the batch.
+
+        .. versionadded:: 8.6
+
+        :param ref_page: a page referring to disambiguation pages of
+            the current batch
+        :type ref_page: pywikibot.Page
+        """
+        self.summaries = []
+        for disamb_page in self.referring.get(ref_page.title(), []):
+            if disamb_page not in self.disamb_alternatives:
+                continue  # next disambig was chosen
+            self.opt.pos = self.disamb_alternatives[disamb_page]
+            self.primaryIgnoreManager = self.disamb_ignores[disamb_page]
+            if not self.treat_links(ref_page, disamb_page):
+                del self.disamb_alternatives[disamb_page]
+
+        self.save_batch(ref_page)
+
+    def save_batch(self, ref_page) -> None:
+        """Save all changes of a referring page made in batch mode.
+
+        .. versionadded:: 8.6
+        """
+        if self.summaries:
+            separator = self.site.mediawiki_message('semicolon-separator')
+            summary = separator.join(dict.fromkeys(self.summaries))
+            self.summaries = []
+            self.save(ref_page, ref_page.text, summary)
+
+    def treat(self, page) -> None:
+        """Work on a single disambiguation page.
+
+        .. versionchanged:: 8.6
+           work on a referring page in batch mode
+        """
+        if self.opt.batch:
+            self.treat_referring_page(page)
+            return
+
+        if not self.load_alternatives(page):
+            return
 
         gen = ReferringPageGeneratorWithIgnore(
             page,
@@ -1337,6 +1499,8 @@ def main(*args: str) -> None:
             options[arg[1:]] = True
         elif arg == '-min':
             options['min'] = int(value or 0)
+        elif arg == '-batch':
+            options['batch'] = int(value or 50)
         elif arg == '-start':
             try:
                 generator = pagegenerators.CategorizedPageGenerator(
@@ -14,6 +14,16 @@ These command line parameters can be used to specify how to work:
 -project        'nothing': de.wikipedia
                 commons, wikidata, species, dewikisource, {de,en}wiktionary: and other projects...
 
+-projects       Works on several projects in one process, e.g. -projects:dewikipedia,cswikipedia
+                or -projects:all for all projects known by LocalBotFactory.
+                The projects are processed concurrently, each with its own site and throttle.
+
+-workers        Number of projects processed at the same time with -projects (default: 4)
+
+-skipunchanged  Skip pages which were not edited since the last run and which have no section
+                that crossed its archiving threshold since then. The last revision id and the next
+                due time of each page are kept in a state file per project.
+
 authors:
     until Nov. 2007: Rhododendronbusch
     after Nov. 2007: Euku
@@ -23,8 +33,13 @@ assert sys.version_info >= (3,5)
 import re               # Used for regular expressions
 import os               # used for os.getcwd()
 import traceback
+import json
+import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pywikibot        # Wikipedia-pybot-framework
 from pywikibot import pagegenerators, textlib
+from pywikibot.tools import open_archive
 from time import localtime, sleep, strftime, mktime    # strftime-Function and related
 from datetime import datetime
 from archive_resolved_localization.local_bot import LocalBot
@@ -64,6 +79,7 @@ class Discussion:
         self.lastContributionAge = 0.0     # How old is the last timestamp? in days
         self.timestampClearedFlag= None    # The timestamp found in the clead template
         self.ageByResolvedTemplate = 0     # How long this discussion has a resolved flag in days. 0 if not resolved
+        self.hasResolvedTemplate = False   # Whether a resolved flag with a timestamp was found
         self.numberOfContributions = 0     # How many contributions were made to this discussion
         self.firstContribution   = None    # Date of the first contribution
         self.headlineLevel       = 0       # depth of headline-level
@@ -118,24 +134,25 @@ class Discussion:
     def getHeadlineLevel(self):
         return self.headlineLevel
 
-    def examine(self, bot):
-        # Extract dates from content
-        clearedContent = WikiDocument.removeCommentsAndOther(self.content)
-        self._examineAllTimestamps(bot, clearedContent)
-        self._examineAllResolvedTemplate(bot, clearedContent)
+    def examine(self, bot, clearedText: str, start: int, end: int, today: float):
+        """
+            Examines the discussion in clearedText[start:end]; the page is only cleaned once.
+            today: the current local time in seconds since 1970-01-01
+        """
+        patterns = bot.localBot.getPatterns()
+        self._examineAllTimestamps(bot, clearedText, start, end, today)
+        self._examineAllResolvedTemplate(bot, clearedText, start, end, today)
 
-        doNotArchivePattern = re.compile(bot.localBot.templDoNotArchive, re.IGNORECASE)
-        self.hasDoNotArchiveTmpl = doNotArchivePattern.search(clearedContent) != None
+        self.hasDoNotArchiveTmpl = patterns.doNotArchive.search(clearedText, start, end) != None
 
-    def _extractTimeStampsAndAges(self, regex: str, clearedContent: str):
+    def _extractTimeStampsAndAges(self, bot, pattern, clearedText: str, start: int, end: int, today: float):
         """
             agesList: a float value for each signature. Unit: day
             timestampList: a float value for each signature. Unit: microseconds since 1970-01-01
         """
         agesList = []
         timestampList = []
-        today = mktime((datetime.now() + bot.localBot.getUtcDiff()).timetuple())
-        matches = re.compile(regex, re.IGNORECASE | re.DOTALL).finditer(clearedContent)
+        matches = pattern.finditer(clearedText, start, end)
         for m in matches:
             hh, mm, dd, MM, YY = m.group('hh'), m.group('mm'), m.group('dd'), m.group('MM'), m.group('yyyy')
             try:
@@ -153,15 +170,17 @@ class Discussion:
                raise
         return agesList, timestampList
 
-    def _examineAllResolvedTemplate(self, bot, clearedContent: str):
+    def _examineAllResolvedTemplate(self, bot, clearedText: str, start: int, end: int, today: float):
         # Now examine if discussion has a "cleared" flag and
-        sectResolvedPattern = "\{\{\s{0,50}" + bot.localBot.sectResolvedRegEx + "\s{0,50}\|.*?" + bot.localBot.timeStampRegEx + ".*?\}\}"
-        agesList, timestampList = self._extractTimeStampsAndAges(sectResolvedPattern, clearedContent)
+        sectResolvedPattern = bot.localBot.getPatterns().sectResolved
+        agesList, timestampList = self._extractTimeStampsAndAges(bot, sectResolvedPattern, clearedText, start, end, today)
         if agesList != []:
             self.ageByResolvedTemplate = min(agesList)
+            self.hasResolvedTemplate = True
 
-    def _examineAllTimestamps(self, bot, clearedContent: str):
-        agesList, timestampList = self._extractTimeStampsAndAges(bot.localBot.timeStampRegEx, clearedContent)
+    def _examineAllTimestamps(self, bot, clearedText: str, start: int, end: int, today: float):
+        timeStampPattern = bot.localBot.getPatterns().timeStamp
+        agesList, timestampList = self._extractTimeStampsAndAges(bot, timeStampPattern, clearedText, start, end, today)
         if agesList != [] and timestampList != []:
             self.firstContribution = timestampList[0]
             self.firstContributionAge = agesList[0]
@@ -174,6 +193,20 @@ class Discussion:
                     or (thresholdAgeByTimeout > 0 and self.lastContributionAge >= thresholdAgeByTimeout) \
                 )
 
+    def getDaysUntilArchiving(self, thresholdAgeResolvedTemplate: float, thresholdAgeByTimeout: float):
+        """
+            Number of days until this discussion crosses one of its thresholds.
+            None if it will never be archived without an edit to the page.
+        """
+        if self.hasDoNotArchiveTmpl:
+            return None
+        days = []
+        if self.hasResolvedTemplate:
+            days.append(thresholdAgeResolvedTemplate - self.ageByResolvedTemplate)
+        if thresholdAgeByTimeout > 0 and self.numberOfContributions > 0:
+            days.append(thresholdAgeByTimeout - self.lastContributionAge)
+        return min(days) if days else None
+
     def getAgeByResolvedTemplate(self) -> float:
         return self.ageByResolvedTemplate
 
@@ -220,6 +253,8 @@ class WikiDocument:
     def __init__(self, page, bot):
         self.numberDiscussions   = 0                  # Number of Discussions on page
         self.originalText        = page.get()         # The original Text of the wikipage
+        # The original text without comments, nowiki, code and pre; cleaned once for all sections
+        self.clearedText, self.removedSpans = WikiDocument.removeCommentsAndOtherWithSpans(self.originalText)
         self.modifiedText        = self.originalText  # The text that should be saved to the original talk page (after modification/archiving)
         self.sliceOffset         = 0                  # When a slice gets extracted the offset changes
         self.reportText          = ""                 # Text to save into report file
@@ -245,8 +280,7 @@ class WikiDocument:
         """
             Divide the Original text by headlines ...
         """
-        regex = "(?P<title>^(?P<hls>[=]{1,%d})(?P<title_clear>[^=]{1}.*?)(?P=hls))([\s]{0,5})$" % self.headlineLevel
-        p = re.compile(regex, re.IGNORECASE|re.M)
+        p = self.bot.localBot.getPatterns().headline(self.headlineLevel)
         # ... and iterate through it
         headlineIterator = p.finditer(self.originalText)
         
@@ -273,8 +307,24 @@ class WikiDocument:
                 self.numberDiscussions += 1
 
     def examineDiscussions(self):
+        today = mktime((datetime.now() + self.bot.localBot.getUtcDiff()).timetuple())
         for singleDiscussion in self.listDiscussions:
-            singleDiscussion.examine(self.bot)
+            start = self._mapToClearedText(singleDiscussion.getTitleOffsetStart())
+            end = self._mapToClearedText(singleDiscussion.getContentOffsetEnd())
+            singleDiscussion.examine(self.bot, self.clearedText, start, end, today)
+
+    def _mapToClearedText(self, offset: int) -> int:
+        """
+            Maps an offset of the original text to the cleared text.
+            An offset inside a removed span is mapped to its start.
+        """
+        starts, ends, removedBefore = self.removedSpans
+        i = bisect_right(starts, offset) - 1
+        if i < 0:
+            return offset
+        if offset < ends[i]:
+            return starts[i] - removedBefore[i]
+        return offset - removedBefore[i] - (ends[i] - starts[i])
 
     def generateErrorReport(self):
         logText = (f"== [[{self.originPageName}]] ==\n")
@@ -323,13 +373,17 @@ class WikiDocument:
         self.reportText = logText
 
     def saveReport(self, saveLocalLogs: bool, localLogFilePath: str):
+        """
+            Appends the report to the local log file, compressed if config.logfilecompression is set
+        """
         if saveLocalLogs:
             pywikibot.output("Save local file ... ")
-            fd = open(localLogFilePath, 'a')
-            writeMe = self.reportText + "\n" 
-            writeMe = writeMe.encode('utf-8')
-            fd.write(writeMe)
-            fd.close()
+            if pywikibot.config.logfilecompression:
+                fd = open_archive(localLogFilePath + '.' + pywikibot.config.logfilecompression, 'ab')
+            else:
+                fd = open(localLogFilePath, 'ab')
+            with fd:
+                fd.write((self.reportText + "\n").encode('utf-8'))
             pywikibot.output("Done.\n")
 
     def prepareArchiving(self):
@@ -342,11 +396,9 @@ class WikiDocument:
             Substitutes the templates
         """
         # subst erledigt
-        old = re.compile("\{\{\ {0,5}" + self.bot.localBot.sectResolvedRegEx + "\ {0,5}\|(?:1=)?([^}]*?" + self.bot.localBot.timeStampRegEx + ")\ *?\|(?:2=.*?)?([^}]*?)\ *\}\}", re.UNICODE | re.DOTALL)
-        originalText = textlib.replaceExcept(originalText, old, self.bot.localBot.sectResolved2P, ["comment", "nowiki"])
-        
-        old = re.compile("\{\{\ {0,5}" + self.bot.localBot.sectResolvedRegEx + "\ {0,5}\|(?:1=)?([^}]*?[^}|*]?" + self.bot.localBot.timeStampRegEx + ")\ *?\}\}", re.UNICODE | re.DOTALL)
-        return textlib.replaceExcept(originalText, old, self.bot.localBot.sectResolved1P, ["comment", "nowiki"])
+        patterns = self.bot.localBot.getPatterns()
+        originalText = textlib.replaceExcept(originalText, patterns.sectResolvedSubst2P, self.bot.localBot.sectResolved2P, ["comment", "nowiki"])
+        return textlib.replaceExcept(originalText, patterns.sectResolvedSubst1P, self.bot.localBot.sectResolved1P, ["comment", "nowiki"])
 
     def _showDiffs(self, pageName: str, originalText: str, modifiedText: str):
         if originalText != modifiedText:
@@ -355,13 +407,26 @@ class WikiDocument:
             pywikibot.showDiff(originalText, modifiedText)
             pywikibot.output("#"*80)
 
+    def _preloadPages(self):
+        """
+            Loads the origin and all target pages with their content, templates and protection in one request.
+            Returns the origin page and a dict of the target pages by name.
+        """
+        originPage = pywikibot.Page(self.bot.site, self.originPageName)
+        targetPages = {targetPageName: pywikibot.Page(self.bot.site, targetPageName)
+                       for targetPageName in self.archiveJobTextByTarget}
+        for _ in self.bot.site.preloadpages([originPage, *targetPages.values()], templates=True, protection=True):
+            pass
+        return originPage, targetPages
+
     def executeArchiving(self):
-        # first, check if we can edit all the pages
-        if not pywikibot.Page(self.bot.site, self.originPageName).botMayEdit():
+        originPage, targetPages = self._preloadPages()
+        # first, check if we can edit all the pages; botMayEdit and has_permission use the preloaded data
+        if not (originPage.botMayEdit() and originPage.has_permission()):
             pywikibot.output(f'<<lightpurple>>Skipping {self.originPageName} because it is protected.<<default>>')
             return
-        for targetPageName, discussionsAsText in self.archiveJobTextByTarget.items():
-            if not pywikibot.Page(self.bot.site, targetPageName).botMayEdit():
+        for targetPageName, targetPage in targetPages.items():
+            if not (targetPage.botMayEdit() and targetPage.has_permission()):
                 pywikibot.output(f'<<lightpurple>>Skipping {targetPageName} because it is protected.<<default>>')
                 return
 
@@ -386,7 +451,7 @@ class WikiDocument:
                 
                 try:
                     pywikibot.output(f"Opening page [[{targetPageName}]]")
-                    targetPage = pywikibot.Page(self.bot.site, targetPageName)
+                    targetPage = targetPages[targetPageName]
                     if self.bot.localBot.mustNotArchiveToMainNamespace() and targetPage.namespace() == 0:
                         pywikibot.output("Archiving into the (Main) namespace 0!")
                         skipThisPage = True
@@ -427,10 +492,10 @@ class WikiDocument:
             if skipThisPage:
                 pywikibot.output(f'Skipping {self.originPageName} because "skipThisPage" is True')
             else:
-                self._performArchivingOnOriginPage(firstRemovedSectionFromSourceLink)
+                self._performArchivingOnOriginPage(originPage, firstRemovedSectionFromSourceLink)
                 sleep(2)
 
-    def _performArchivingOnOriginPage(self, firstRemovedSectionFromSourceLink: str):
+    def _performArchivingOnOriginPage(self, originPage, firstRemovedSectionFromSourceLink: str):
         distributionComment = ''
         numberOfSectionsRemovedFromOrigin = 0
         for targetPageName, discussionsAsText in self.archiveJobTextByTarget.items():
@@ -457,9 +522,8 @@ class WikiDocument:
         archiveOverallSummary = self.bot.localBot.archiveOverallSummary.format(numberOfSectionsRemovedFromOriginStr=numberOfSectionsRemovedFromOriginStr,
                     distributionComment=distributionComment, firstNewSectionInArchiveSummary=firstNewSectionInArchiveSummary, lastEditComment=lastEditComment)
         
-        self.modifiedText = bot.localBot.applyLocalModifications(self.modifiedText)
+        self.modifiedText = self.bot.localBot.applyLocalModifications(self.modifiedText)
         try:
-            originPage = pywikibot.Page(self.bot.site, self.originPageName)
             self._showDiffs(self.originPageName, originPage.text, self.modifiedText)
 
             if self.bot.dryRun:
@@ -506,18 +570,35 @@ class WikiDocument:
                     .replace('<sub>', '').replace('</sub>', '').replace('<sup>', '').replace('</sup>', '')
             self.archiveJobFirstTitleByTarget[target] = headline
     
+    # comments, nowiki, code and pre are removed in a single pass
+    removePattern = re.compile(r"(?s)<!\-\-.*?\-\->|<nowiki>.*?</nowiki>|<code>.*?</code>|<pre>.*?</pre>")
+
     def removeCommentsAndOther(originalText: str) -> str:
-        clearedContent = textlib.replaceExcept(originalText, r"(?s)<!\-\-.*?\-\->", "", [])
-        clearedContent = textlib.replaceExcept(clearedContent, r"(?s)<nowiki>.*?</nowiki>", "", [])
-        clearedContent = textlib.replaceExcept(clearedContent, r"(?s)<code>.*?</code>", "", [])
-        return textlib.replaceExcept(clearedContent, r"(?s)<pre>.*?</pre>", "", [])
+        return WikiDocument.removePattern.sub("", originalText)
+
+    def removeCommentsAndOtherWithSpans(originalText: str) -> tuple:
+        """
+            Like removeCommentsAndOther, but also returns the removed spans of the original text
+            as lists of starts, ends and the number of characters removed before each span.
+        """
+        parts, starts, ends, removedBefore = [], [], [], []
+        last = removed = 0
+        for m in WikiDocument.removePattern.finditer(originalText):
+            parts.append(originalText[last:m.start()])
+            starts.append(m.start())
+            ends.append(m.end())
+            removedBefore.append(removed)
+            removed += m.end() - m.start()
+            last = m.end()
+        parts.append(originalText[last:])
+        return "".join(parts), (starts, ends, removedBefore)
 
     def findOptions(self):
         """
         Looks for the template {{Autoarchiv-Erledigt}}
         """
-        p = re.compile(self.bot.localBot.optionsRegEx, re.DOTALL)
-        match = p.search(WikiDocument.removeCommentsAndOther(self.originalText))
+        p = self.bot.localBot.getPatterns().options
+        match = p.search(self.clearedText)
         if match:
             allOptions = match.group('options')
             optionsDict = {}
@@ -555,6 +636,15 @@ class WikiDocument:
         else:
             raise NoOptions(f"<<lightpurple>>Main template not found.<<default>>")
     
+    def getNextDueTime(self):
+        """
+        The earliest time (seconds since epoch) at which any discussion crosses its threshold.
+        None if no discussion will be archived without an edit to the page.
+        """
+        days = [d for d in (disc.getDaysUntilArchiving(self.thresholdAgeResolvedTemplate, self.thresholdAgeByTimeout)
+                            for disc in self.listDiscussions) if d is not None]
+        return time.time() + min(days) * 60 * 60 * 24 if days else None
+
     def hasWorkToDo(self):
         """
         Whether there is something to archive or not
@@ -565,36 +655,20 @@ class ArchiveRobot:
     """
         A bot that can archive.
     """
-    def __init__(self):
-        self.dryRun = False # Weather to save pages to wikipedia or not.... False means to save
-        self.saveLocalLogFile = False
+    def __init__(self, localBot: LocalBot, pageToWorkOn: str = None, dryRun: bool = False, saveLocalLogFile: bool = False,
+                 skipUnchanged: bool = False):
+        self.dryRun = dryRun # Weather to save pages to wikipedia or not.... False means to save
+        self.saveLocalLogFile = saveLocalLogFile
+        self.skipUnchanged = skipUnchanged # Skip pages without edits and without due sections since the last run
         self.generator = None
-        self.localBot = None
-        currentProject = None
-        pageToWorkOn = None
-
-        # read arguments
-        for arg in pywikibot.handle_args():
-            if arg == '-dryrun':
-                self.dryRun = True
-            elif arg.startswith('-project'):
-                if len(arg) == 8: # no project set
-                    currentProject = pywikibot.input('Which project to work on? [dewikipedia, dewiktionary, dewikiversity, enwikisource, dewikisource, commons, wikidata, wikimania, species]')
-                else:
-                    currentProject = arg[9:]
-            elif arg.startswith('-page'):
-                if len(arg) == 5:
-                    raise ArchivingError("'-page' used but no page given")
-                else:
-                    pageToWorkOn = arg[6:]
-            elif arg == '-nolocallog':
-                self.saveLocalLogFile = False
-            else:
-                pywikibot.output(arg + " was ignored")
-        
-        if currentProject is None:
-            currentProject = "dewikipedia"
-        self.localBot = LocalBotFactory().createLocalBot(currentProject)
+        self.localBot = localBot
+        # statistics for the summary of a run
+        self.numberOfPagesChecked = 0
+        self.numberOfPagesToArchive = 0
+        self.numberOfSectionsToArchive = 0
+        self.numberOfErrors = 0
+        self.numberOfPagesSkipped = 0
+
         self.site = pywikibot.Site(code=self.localBot.projectCode, fam=self.localBot.projectFamily)
         pywikibot.output(f'Created localbot with code={self.localBot.projectCode}, fam={self.localBot.projectFamily}')
 
@@ -604,7 +678,45 @@ class ArchiveRobot:
             mainTemplatePage = pywikibot.Page(self.site, self.localBot.archiveTemplateName)
             self.generator = mainTemplatePage.getReferences(False, True, True, False)
         
-        self.localLogFile = os.getcwd() + strftime(f"/logs/archiv-{currentProject}-%Y-%m-%d.log", localtime())
+        self.localLogFile = os.getcwd() + strftime(f"/logs/archiv-{self.localBot.projectId}-%Y-%m-%d.log", localtime())
+        # page title -> {'revid': last revision id, 'due': next due time or None}
+        self.stateFile = pywikibot.config.datafilepath('archive-resolved', f'state-{self.localBot.projectId}.json')
+        self.state = self._loadState() if self.skipUnchanged else {}
+
+    def _loadState(self) -> dict:
+        try:
+            with open(self.stateFile, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            pywikibot.output(f"<<lightpurple>>State file {self.stateFile} is broken, ignoring it<<default>>")
+            return {}
+
+    def _saveState(self):
+        tmpFile = self.stateFile + '.tmp'
+        with open(tmpFile, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f)
+        os.replace(tmpFile, self.stateFile)
+
+    def _isUnchanged(self, page) -> bool:
+        """
+            Whether the page was not edited since the last run and no discussion is due.
+            The revision id is already known from the generator, so this does not need a request per page.
+        """
+        pageState = self.state.get(page.title())
+        if pageState is None or pageState['revid'] != page.latest_revision_id:
+            return False
+        return pageState['due'] is None or pageState['due'] > time.time()
+
+    def _filterUnchanged(self, generator):
+        for page in generator:
+            if self._isUnchanged(page):
+                self.numberOfPagesSkipped += 1
+                continue
+            # will be added again if the page has nothing to archive
+            self.state.pop(page.title(), None)
+            yield page
 
     def _runOnPage(self, page):
         try:
@@ -612,6 +724,7 @@ class ArchiveRobot:
                 pywikibot.output("Skipping page: " + page.title())
                 return
             pywikibot.output("Check page: " + page.title())
+            self.numberOfPagesChecked += 1
             wdoc = WikiDocument(page, self)
             wdoc.findOptions()
             wdoc.divideIntoSlices()
@@ -620,10 +733,15 @@ class ArchiveRobot:
             wdoc.generateReport()
             wdoc.saveReport(self.saveLocalLogFile, self.localLogFile)
             if wdoc.hasWorkToDo():
+                self.numberOfPagesToArchive += 1
+                self.numberOfSectionsToArchive += wdoc.numberOfDiscussionsToArchive
                 wdoc.executeArchiving()
+            elif self.skipUnchanged:
+                self.state[page.title()] = {'revid': page.latest_revision_id, 'due': wdoc.getNextDueTime()}
 
         except NoOptions as no:
             # Write error report to the same page
+                self.numberOfErrors += 1
                 pywikibot.output("\t<<lightpurple>>Report error for %s<<default>>\n" % page.title())
                 hintMsg = no.getMsg() if no.getMsg() != None else ''
                 pywikibot.output("Reason was: " + hintMsg)
@@ -634,6 +752,7 @@ class ArchiveRobot:
                 wdoc.generateErrorReport()
                 wdoc.saveReport(self.saveLocalLogFile, self.localLogFile)
         except:
+            self.numberOfErrors += 1
             pywikibot.output("\n<<lightpurple>>Error at %s<<default>> skip page\n" % page.title())
             pywikibot.output("Unexpected error: " + str(traceback.format_exc()))
             wdoc.generateErrorReport()
@@ -643,6 +762,8 @@ class ArchiveRobot:
         """
              Begin archiving
         """
+        if self.skipUnchanged:
+            self.generator = self._filterUnchanged(self.generator)
         self.generator = pagegenerators.PreloadingGenerator(self.generator, groupsize = 5)
         for page in self.generator:
             try:
@@ -650,14 +771,118 @@ class ArchiveRobot:
             except:
                 # Catch everything and don't let the bot stop.
                 # This can happen when an exception was raised inside the exception handling.
+                self.numberOfErrors += 1
                 pywikibot.output(f"\n<<lightpurple>>Unexpected error: {str(sys.exc_info())}<<default>>\n")
+
+        if self.skipUnchanged:
+            self._saveState()
         
         # Everything is done, so stop it
-        pywikibot.output("# Bot finished #")
+        pywikibot.output(f"# Bot finished # {self.getSummary()}")
+
+    def getSummary(self) -> str:
+        """
+            A one line summary of this run
+        """
+        return (f"{self.localBot.projectId}: {self.numberOfPagesChecked} pages checked, "
+                f"{self.numberOfPagesSkipped} unchanged pages skipped, "
+                f"{self.numberOfSectionsToArchive} sections on {self.numberOfPagesToArchive} pages to archive, "
+                f"{self.numberOfErrors} errors")
+
+class MultiProjectArchiveRobot:
+    """
+        Runs an ArchiveRobot for each project in one process.
+        The projects are interleaved on a worker pool, each one with its own site and throttle.
+    """
+    def __init__(self, localBots: list, dryRun: bool = False, saveLocalLogFile: bool = False, workers: int = 4,
+                 skipUnchanged: bool = False):
+        self.workers = workers
+        self.robots = []
+        # create all sites in the main thread before the workers start
+        for localBot in localBots:
+            try:
+                self.robots.append(ArchiveRobot(localBot, dryRun=dryRun, saveLocalLogFile=saveLocalLogFile,
+                                                skipUnchanged=skipUnchanged))
+            except Exception:
+                pywikibot.output(f"\n<<lightpurple>>Cannot start {localBot.projectId}<<default>>\n")
+                pywikibot.output("Unexpected error: " + str(traceback.format_exc()))
+
+    def _runRobot(self, robot: ArchiveRobot) -> float:
+        start = datetime.now()
+        robot.run()
+        return (datetime.now() - start).total_seconds()
+
+    def run(self):
+        """
+             Begin archiving on all projects
+        """
+        summary = []
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self._runRobot, robot): robot for robot in self.robots}
+            for future in as_completed(futures):
+                robot = futures[future]
+                try:
+                    summary.append(f"{robot.getSummary()} ({future.result():.0f} s)")
+                except Exception:
+                    summary.append(f"{robot.getSummary()} (aborted)")
+                    pywikibot.output(f"\n<<lightpurple>>Error at {robot.localBot.projectId}<<default>>\n")
+                    pywikibot.output("Unexpected error: " + str(traceback.format_exc()))
+
+        pywikibot.output("# All projects finished #")
+        for line in sorted(summary):
+            pywikibot.output("* " + line)
+
+def main():
+    dryRun = False
+    saveLocalLogFile = False
+    currentProject = None
+    projects = None
+    pageToWorkOn = None
+    workers = 4
+    skipUnchanged = False
+
+    # read arguments
+    for arg in pywikibot.handle_args():
+        if arg == '-dryrun':
+            dryRun = True
+        elif arg.startswith('-projects'):
+            if len(arg) == 9: # no projects set
+                projects = pywikibot.input('Which projects to work on? [all or a comma separated list]')
+            else:
+                projects = arg[10:]
+        elif arg.startswith('-project'):
+            if len(arg) == 8: # no project set
+                currentProject = pywikibot.input('Which project to work on? [dewikipedia, dewiktionary, dewikiversity, enwikisource, dewikisource, commons, wikidata, wikimania, species]')
+            else:
+                currentProject = arg[9:]
+        elif arg.startswith('-workers:'):
+            workers = int(arg[9:])
+        elif arg.startswith('-page'):
+            if len(arg) == 5:
+                raise ArchivingError("'-page' used but no page given")
+            else:
+                pageToWorkOn = arg[6:]
+        elif arg == '-nolocallog':
+            saveLocalLogFile = False
+        elif arg == '-skipunchanged':
+            skipUnchanged = True
+        else:
+            pywikibot.output(arg + " was ignored")
+
+    if projects is not None:
+        if currentProject is not None or pageToWorkOn is not None:
+            raise ArchivingError("'-projects' cannot be combined with '-project' or '-page'")
+        localBots = LocalBotFactory().createLocalBots(projects)
+        MultiProjectArchiveRobot(localBots, dryRun, saveLocalLogFile, workers, skipUnchanged).run()
+        return
+
+    if currentProject is None:
+        currentProject = "dewikipedia"
+    localBot = LocalBotFactory().createLocalBot(currentProject)
+    ArchiveRobot(localBot, pageToWorkOn, dryRun, saveLocalLogFile, skipUnchanged).run()
 
 if __name__ == "__main__":
     try:
-        bot = ArchiveRobot()
-        bot.run()
+        main()
     finally:
         pywikibot.stopme()
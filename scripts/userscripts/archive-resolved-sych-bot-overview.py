@@ -6,8 +6,8 @@ This script will sychronize a commons page to all existing bot pages there the a
 import sys
 assert sys.version_info >= (3,5)
 import pywikibot        # Wikipedia-pybot-framework
-from time import sleep
 from archive_resolved_localization.local_bot import LocalBot
+from scripts.replicate_wiki import replicate_to_sites
 
 basePageToCopy = ('commons', 'User:SpBot/Archivebot')
 targetProjects = ['dewikipedia', 'cswikipedia', 'jawikipedia', 'kowikipedia', 'viwikipedia',
@@ -17,36 +17,25 @@ targetProjects = ['dewikipedia', 'cswikipedia', 'jawikipedia', 'kowikipedia', 'v
                   'dewikiversity',
                   'meta', 'wikidata', 'wikimania', 'species', 'wikifunctions']
 
-def getSourcePage():
-    projectCode, projectFamily = LocalBot.splitInCodeAndFamily(basePageToCopy[0])
-    site = pywikibot.Site(code=projectCode, fam=projectFamily)
-    return pywikibot.Page(site, basePageToCopy[1]).text
-
-def updatePageInLocalWiki(targetProjectId: str, newPageText: str):
-    projectCode, projectFamily = LocalBot.splitInCodeAndFamily(targetProjectId)
-    site = pywikibot.Site(code=projectCode, fam=projectFamily)
-    pywikibot.output(f'Looking at {site}')
-
-    pageName = basePageToCopy[1]
-    page = pywikibot.Page(site, pageName)
-    originalText = page.text
-    page.text = newPageText
+def getSite(projectId: str):
+    projectCode, projectFamily = LocalBot.splitInCodeAndFamily(projectId)
+    return pywikibot.Site(code=projectCode, fam=projectFamily)
 
-    pywikibot.output(f"Diff of {targetProjectId}:[[{pageName}]]:")
-    pywikibot.output("#"*80)
-    pywikibot.showDiff(originalText, newPageText)
-    pywikibot.output("#"*80)
-
-    if originalText != newPageText:
-        page.save('Updating the page', minor=True, force=True)
+def getSourcePage():
+    return pywikibot.Page(getSite(basePageToCopy[0]), basePageToCopy[1]).text
 
 if __name__ == "__main__":
     try:
         baseText = getSourcePage()
         # pywikibot.output(f'got base text:\n{baseText}')
 
-        for targetProjectId in targetProjects:
-            updatePageInLocalWiki(targetProjectId, baseText)
-        
+        # the sites are processed concurrently, only changed pages are downloaded and saved
+        sites = [getSite(targetProjectId) for targetProjectId in targetProjects]
+        differences = replicate_to_sites(sites, lambda site: {basePageToCopy[1]: baseText},
+                                         lambda site: 'Updating the page', workers=len(sites),
+                                         minor=True, force=True)
+        for site, titles in differences.items():
+            pywikibot.output(f"{site}: {'updated' if titles else 'unchanged'}")
+
     finally:
         pywikibot.stopme()
@@ -4,9 +4,38 @@
     This file extracts all the project and translation related stuff from the main bot code
 """
 from datetime import datetime
+import re
 import time
 from pytz import timezone
 
+class PatternBundle():
+    """
+        All regular expressions of a project, compiled once.
+        Use LocalBot.getPatterns() to get the bundle of a project.
+    """
+    def __init__(self, localBot) -> None:
+        self.timeStamp = re.compile(localBot.timeStampRegEx, re.IGNORECASE | re.DOTALL)
+        self.sectResolved = re.compile(r"\{\{\s{0,50}" + localBot.sectResolvedRegEx + r"\s{0,50}\|.*?"
+                                       + localBot.timeStampRegEx + r".*?\}\}", re.IGNORECASE | re.DOTALL)
+        self.doNotArchive = re.compile(localBot.templDoNotArchive, re.IGNORECASE)
+        self.options = re.compile(localBot.optionsRegEx, re.DOTALL)
+        # {{resolved|1=signature|2=text}} and {{resolved|1=signature}}
+        self.sectResolvedSubst2P = re.compile(r"\{\{\ {0,5}" + localBot.sectResolvedRegEx + r"\ {0,5}\|(?:1=)?([^}]*?"
+                                              + localBot.timeStampRegEx + r")\ *?\|(?:2=.*?)?([^}]*?)\ *\}\}",
+                                              re.UNICODE | re.DOTALL)
+        self.sectResolvedSubst1P = re.compile(r"\{\{\ {0,5}" + localBot.sectResolvedRegEx + r"\ {0,5}\|(?:1=)?([^}]*?[^}|*]?"
+                                              + localBot.timeStampRegEx + r")\ *?\}\}", re.UNICODE | re.DOTALL)
+        self._headlines = {}
+
+    def headline(self, headlineLevel: int):
+        """
+            Headlines up to the given level
+        """
+        if headlineLevel not in self._headlines:
+            regex = r"(?P<title>^(?P<hls>[=]{1,%d})(?P<title_clear>[^=]{1}.*?)(?P=hls))([\s]{0,5})$" % headlineLevel
+            self._headlines[headlineLevel] = re.compile(regex, re.IGNORECASE | re.M)
+        return self._headlines[headlineLevel]
+
 class LocalBot():
     multi_lang_projects = ['meta', 'commons', 'wikidata', 'wikimania', 'wikifunctions', 'species']
 
@@ -16,6 +45,16 @@ class LocalBot():
         """
         self.projectId = projectId
         self.projectCode, self.projectFamily = LocalBot.splitInCodeAndFamily(projectId)
+        self._patterns = None
+
+    def getPatterns(self) -> PatternBundle:
+        """
+            The compiled regular expressions of this project. They are built on first use
+            because the subclasses set the expressions after this initializer.
+        """
+        if self._patterns is None:
+            self._patterns = PatternBundle(self)
+        return self._patterns
     
     def splitInCodeAndFamily(projectId: str) -> tuple:
         if projectId in LocalBot.multi_lang_projects:
@@ -14,6 +14,19 @@ from archive_resolved_localization.meta import LocalBotMeta
     This file extracts all the project and translation related stuff from the main bot code
 """
 class LocalBotFactory():
+    # all projects that can be processed with -projects:all
+    allProjects = ('dewikipedia', 'cswikipedia', 'dewiktionary', 'dewikisource', 'enwikisource', 'dewikiversity',
+                   'commons', 'meta', 'wikidata', 'wikimania', 'species', 'wikifunctions',
+                   'jawikipedia', 'kowikipedia', 'viwikipedia')
+
+    def createLocalBots(self, projectIds: str) -> list:
+        """
+            projectIds: 'all' or a comma separated list of project ids
+        """
+        if projectIds == 'all':
+            return [self.createLocalBot(projectId) for projectId in LocalBotFactory.allProjects]
+        return [self.createLocalBot(projectId.strip()) for projectId in projectIds.split(',') if projectId.strip()]
+
     def createLocalBot(self, projectId: str) -> LocalBot:
         self.projectId = projectId
         projectCode, projectFamily = LocalBot.splitInCodeAndFamily(projectId)
@@ -6,6 +6,9 @@ The following parameters are supported:
 -always           The bot won't ask for confirmation when putting a page
 
 -summary:         Set the action summary message for the edit.
+
+-workers:         Number of concurrent requests for the contributions of
+                  the bots (default: 8)
 """
 #
 # (C) Euku, 2008-2024
@@ -13,6 +16,7 @@ The following parameters are supported:
 #
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
 from operator import methodcaller
 
@@ -36,7 +40,10 @@ class BotStatsUpdater(SingleSiteBot, CurrentPageBot):
 
     """A bot which updates bot statistics."""
 
-    update_options = {'summary': 'Bot: Aktualisiere Bot-Statistik'}
+    update_options = {
+        'summary': 'Bot: Aktualisiere Bot-Statistik',
+        'workers': 8,
+    }
 
     def former_botnames(self) -> Generator[str, None, None]:
         """Collect former botnames.
@@ -114,11 +121,29 @@ class BotStatsUpdater(SingleSiteBot, CurrentPageBot):
                      for name in ignore_users}
         yield from filter_unique(bots, container=container)
 
+    def collect_contributions(self, botlist) -> dict:
+        """Retrieve last and first contributions concurrently.
+
+        The first contribution is only needed if the registration date
+        is unknown.
+
+        :return: a mapping of bot user to a tuple of its last and first
+            contribution
+        """
+        def contributions(bot):
+            first = None if bot.registration() else bot.first_edit
+            return bot, (bot.last_edit, first)
+
+        pywikibot.info('\nretrieve contributions...')
+        with ThreadPoolExecutor(int(self.opt.workers)) as executor:
+            return dict(executor.map(contributions, botlist))
+
     def create_table(self) -> str:
         """Create page content."""
-        botlist = sorted(self.collect_data(),
+        botlist = sorted(self.site.preloadusers(self.collect_data()),
                          key=methodcaller('editCount'),
                          reverse=True)
+        contribs = self.collect_contributions(botlist)
 
         pywikibot.info('\ncreating wiki table...', newline=False)
         pagetext = ''
@@ -131,7 +156,8 @@ class BotStatsUpdater(SingleSiteBot, CurrentPageBot):
 
             all_edits += bot.editCount()
 
-            last_edit = bot.last_edit[2] if bot.last_edit else None
+            last, first = contribs[bot]
+            last_edit = last[2] if last else None
             if not last_edit:
                 last_edit_str = '-' if not bot.editCount() else '?'
             else:
@@ -141,7 +167,7 @@ class BotStatsUpdater(SingleSiteBot, CurrentPageBot):
             if reg:
                 registration = str(reg.date())
             else:
-                reg = bot.first_edit[2]
+                reg = first[2] if first else None
                 registration = f'{reg.date()} *' if reg else '?'
 
             # for colors see https://meta.wikimedia.org/wiki/Brand/colours
@@ -16,6 +16,7 @@ from pywikibot import textlib
 from time import localtime, strftime    # strftime-Function and related
 import time
 import datetime
+from operator import itemgetter
 sys.path.append('/data/project/mp/mp/pyapi') # TODO make this a relative path
 import dewpmp
 
@@ -78,44 +79,6 @@ class Parser:
         return self.data
 
 ##### general support methods
-# mergesort for mentees (menteeName, menteeID, mentorID, menteeStatus, menteeEintrittDatumStr, menteeAustrittDatumStr = mentee)
-def mergesort(seq):
-    if len(seq) <= 1:
-        return seq
-    else:
-        linkeListe = seq[:int(len(seq)/2)]
-        rechteListe = seq[int(len(seq)/2):]
-        return merge(mergesort(linkeListe), mergesort(rechteListe))
-
-def merge(linkeListe, rechteListe):
-    comperator1 = 'mm_stop' # sort the mentees by 'mm_stop' (Austrittsdatum)
-    comperator2 = 'mentor_user_id' # sort the mentees by 'mentor_user_id' (UserId)
-    newList = []
-    while linkeListe != [] and rechteListe != []:
-        if linkeListe[0][comperator1] == rechteListe[0][comperator1]:
-            if linkeListe[0][comperator2] <= rechteListe[0][comperator2]:
-                newList.append(linkeListe[0])
-                del linkeListe[0]
-            else:
-                newList.append(rechteListe[0])
-                del rechteListe[0]
-        elif linkeListe[0][comperator1] <= rechteListe[0][comperator1]:
-            newList.append(linkeListe[0])
-            del linkeListe[0]
-        else:
-            newList.append(rechteListe[0])
-            del rechteListe[0]
-
-    while linkeListe != []:
-        newList.append(linkeListe[0])
-        del linkeListe[0]
-
-    while rechteListe != []:
-        newList.append(rechteListe[0])
-        del rechteListe[0]
-
-    return newList
-
 def dateToList(date):
 	return int(date[:4]), int(date[5:7]), int(date[8:10])
 
@@ -140,40 +103,52 @@ def menteeIstAktiv(db, user_id):
 	return db.get_mw_user_contribsum(user_id=user_id, latest_days=menteeStatusRotGrenze) > 0
 
 
-def checkForNewMentees(db, mentorenFromServer, menteesFromServer, userListWP):
+def reconcileMentees(menteesFromServer, userListWP):
+	"""
+	vergleiche die Mentees aus der DB mit den Benutzern aus der Kategorie
+	gibt (neue Menteenamen, zu archivierende DB-Einträge) zurück
 	"""
-	prüfe welche Benutzer in die DB neu eingetragen werden müssen
+	menteeNamesWP = dict.fromkeys(normalizeWpName(userWP['item']) for userWP in userListWP)
+	menteeNamesServ = {normalizeWpName(userServ['mentee_user_name']) for userServ in menteesFromServer}
+	newMentees = [name for name in menteeNamesWP if name not in menteeNamesServ]
+	menteesToBeArchived = [userServ for userServ in menteesFromServer
+		if normalizeWpName(userServ['mentee_user_name']) not in menteeNamesWP]
+	return newMentees, menteesToBeArchived
+
+def checkForNewMentees(db, newMentees):
+	"""
+	trage die neuen Benutzer in die DB ein
 	"""
 	logText = ""
-	
-	somethingChanged = False
-	for userWP in userListWP:
-		menteeNameWP = normalizeWpName(userWP['item'])
-		for userServ in menteesFromServer: # from our database
-			menteeNamedServ = normalizeWpName(userServ['mentee_user_name'])
-			if menteeNamedServ == menteeNameWP:
-				break # bereits eingetragen
-		else:
-			output("\nin DB nicht gefunden: " + menteeNameWP)
-			
-			# finde Mentor auf seiner Benutzerseite
-			userPage = pywikibot.Page(pywikibot.Site(), "Benutzer:" + menteeNameWP)
-			rawText = userPage.get()
-			mentorName = search(rawText, menteeTemplRegEx)
-			if (mentorName == ""):
-				# versuche was anderes
-				# finde Mentorenvorlage auf seiner Benutzerseite
-				mentorName = search(rawText, mentorTemplRegEx)
-			
-			mentorName = normalizeWpName(mentorName)
-			output("Mentor durch Mentorenvorlage gefunden: " + mentorName)
 
-			## alles gefunden, trage neuen mentee ein oder reaktiviere ihn
-			output("übertrage in DB: Mentor: " + mentorName + ", Mentee: " + menteeNameWP)
-			db.add_mentee(mentorName, menteeNameWP)
-			somethingChanged = True
-			logText += "+[[:User:%s|%s]] ([[:User:%s|%s]]) " % (menteeNameWP, menteeNameWP, mentorName, mentorName)
-	return (somethingChanged, logText)
+	# finde Mentor auf den Benutzerseiten, alle Seiten auf einmal laden
+	site = pywikibot.Site()
+	userPages = [pywikibot.Page(site, "Benutzer:" + menteeNameWP) for menteeNameWP in newMentees]
+	for _ in site.preloadpages(userPages):
+		pass # the pages are filled in place, in the order of the API
+	newEntries = []
+	for menteeNameWP, userPage in zip(newMentees, userPages):
+		output("\nin DB nicht gefunden: " + menteeNameWP)
+		if not userPage.exists():
+			output("Benutzerseite von %s existiert nicht, weiter..." % menteeNameWP)
+			continue
+		rawText = userPage.text
+		mentorName = search(rawText, menteeTemplRegEx)
+		if (mentorName == ""):
+			# versuche was anderes
+			# finde Mentorenvorlage auf seiner Benutzerseite
+			mentorName = search(rawText, mentorTemplRegEx)
+
+		mentorName = normalizeWpName(mentorName)
+		output("Mentor durch Mentorenvorlage gefunden: " + mentorName)
+		newEntries.append((mentorName, menteeNameWP))
+
+	## alles gefunden, trage neue mentees ein oder reaktiviere sie
+	for mentorName, menteeNameWP in newEntries:
+		output("übertrage in DB: Mentor: " + mentorName + ", Mentee: " + menteeNameWP)
+		db.add_mentee(mentorName, menteeNameWP)
+		logText += "+[[:User:%s|%s]] ([[:User:%s|%s]]) " % (menteeNameWP, menteeNameWP, mentorName, mentorName)
+	return (bool(newEntries), logText)
 
 def normalizeWpName(name):
 	"""
@@ -189,26 +164,19 @@ def normalizeWpName(name):
 	normalizedWpNameCache[name] = newName
 	return newName
 
-def checkForMenteesToBeArchived(mentorenFromServer, menteesFromServer, userListWP):
+def checkForMenteesToBeArchived(db, menteesToBeArchived):
 	"""
 	archiviere Benutzer, die nicht mehr in der Kat auftauchen
 	"""
 	logText = ""
-	somethingChanged = False
-	for userServ in menteesFromServer:
+	for userServ in menteesToBeArchived:
 		menteeNamedServ = normalizeWpName(userServ['mentee_user_name'])
-		for userWP in userListWP:
-			menteeNameWP = normalizeWpName(userWP['item'])
-			if (menteeNameWP == menteeNamedServ):
-				break
-		else:
-			allMentors = db.get_all_mentors_for_mentee(menteeNamedServ)
-			lastMentorName = allMentors[len(allMentors) -1]['mentor_user_name']
-			output("\nmuss archiviert werden: " + menteeNamedServ + "\tMentor war " + lastMentorName)
-			db.stop_all_current_mentoring(userServ['mentee_user_id'])
-			somethingChanged = True
-			logText += "-[[:User:%s|%s]] ([[:User:%s|%s]]) " % (menteeNamedServ, menteeNamedServ, lastMentorName, lastMentorName)
-	return (somethingChanged, logText)
+		# der aktuelle Mentor steht schon im DB-Eintrag
+		lastMentorName = userServ['mentor_user_name']
+		output("\nmuss archiviert werden: " + menteeNamedServ + "\tMentor war " + lastMentorName)
+		db.stop_all_current_mentoring(userServ['mentee_user_id'])
+		logText += "-[[:User:%s|%s]] ([[:User:%s|%s]]) " % (menteeNamedServ, menteeNamedServ, lastMentorName, lastMentorName)
+	return (bool(menteesToBeArchived), logText)
 
 #############################################
 #   Benutzerliste in die WP zurückschreiben
@@ -240,8 +208,8 @@ def writeMenteeArchive(db, mentorenFromServer):
 	for mentee in menteesFromServer:
 		if (mentee['mm_stop'] != None):
 			menteesForArchive.append(mentee)
-	# sort them
-	menteesForArchive = mergesort(menteesForArchive)
+	# sort them by 'mm_stop' (Austrittsdatum), then by 'mentor_user_id' (UserId)
+	menteesForArchive.sort(key=itemgetter('mm_stop', 'mentor_user_id'))
 
 	# if all months must be written, just loop through them all
 	currentYear, currentMonth = localtime()[0], localtime()[1]
@@ -384,8 +352,9 @@ if (len(userListWP) == 0):
 somethingWasChanged = False
 logText = ""
 
-somethingWasChanged, logText = checkForNewMentees(db, mentorenFromServer, menteesFromServer, userListWP)
-result = checkForMenteesToBeArchived(mentorenFromServer, menteesFromServer, userListWP) # gibt zwei Argumente zurück (wasGeändert?, logText)
+newMentees, menteesToBeArchived = reconcileMentees(menteesFromServer, userListWP)
+somethingWasChanged, logText = checkForNewMentees(db, newMentees)
+result = checkForMenteesToBeArchived(db, menteesToBeArchived) # gibt zwei Argumente zurück (wasGeändert?, logText)
 logText += result[1]
 somethingWasChanged = somethingWasChanged or result[0]
 if somethingWasChanged:
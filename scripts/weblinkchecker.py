@@ -2,13 +2,14 @@
 """
 This bot is used for checking external links found at the wiki.
 
-It checks several pages at once, with a limit set by the config variable
-max_external_links, which defaults to 50.
+It checks several links at once, with a limit set by the config variable
+max_external_links, which defaults to 50. Links to the same host are checked
+one after another with a delay between them.
 
 The bot won't change any wiki pages, it will only report dead links such that
 people can fix or remove the links themselves.
 
-The bot will store all links found dead in a .dat file in the deadlinks
+The bot will store all links found dead in a SQLite database in the deadlinks
 subdirectory. To avoid the removing of links which are only temporarily
 unavailable, the bot ONLY reports links which were reported dead at least
 two times, with a time lag of at least one week. Such links will be logged to a
@@ -27,7 +28,8 @@ use this feature, set report_dead_links_on_talk = True in your user
 config file, or specify "-talk" on the command line. Adding "-notalk"
 switches this off irrespective of the configuration variable.
 
-When a link is found alive, it will be removed from the .dat file.
+When a link is found alive, it will be removed from the database. A .dat
+history file of earlier releases is imported when the database is created.
 
 These command line parameters can be used to specify which pages to work on:
 
@@ -44,9 +46,16 @@ These command line parameters can be used to specify which pages to work on:
 
 -xmlstart    Page to start with when using an XML dump
 
--ignore      HTTP return codes to ignore. Can be provided several times :
+-ignore      HTTP return codes to ignore. Links with these codes are treated
+             as alive. Can be provided several times :
                 -ignore:401 -ignore:500
 
+-importdat   Import a .dat history file of earlier releases into the database
+             and exit. Default is the .dat file of the site.
+
+-exportdat   Export the database to a .dat history file readable by earlier
+             releases and exit. Default is the .dat file of the site.
+
 &params;
 
 Furthermore, the following command line parameters are supported:
@@ -70,6 +79,12 @@ The following config variables are supported:
                             is congested, and will then think that the page
                             is offline.
 
+ weblink_host_connections   The maximum number of links of the same host
+                            which are checked simultaneously (default: 1).
+
+ weblink_host_delay         The minimum number of seconds between two
+                            requests to the same host (default: 6).
+
  report_dead_links_on_talk  If set to true, causes the script to report dead
                             links on the article's talk page if (and ONLY if)
                             the linked page has been unavailable at least two
@@ -109,20 +124,23 @@ Loads all wiki pages where dead links were found during a prior run:
 # Distributed under the terms of the MIT license.
 #
 import codecs
+import os
 import pickle
 import re
+import sqlite3
 import threading
 import time
 import urllib.parse as urlparse
-from contextlib import suppress
+from collections import deque
 from functools import partial
 from http import HTTPStatus
+from typing import Optional
 
 import requests
 
 import pywikibot
 from pywikibot import comms, config, i18n, pagegenerators, textlib
-from pywikibot.backports import Dict, removeprefix
+from pywikibot.backports import Dict, List, removeprefix
 from pywikibot.bot import ExistingPageBot, SingleSiteBot, suggest_help
 from pywikibot.exceptions import (
     IsRedirectPageError,
@@ -132,7 +150,7 @@ from pywikibot.exceptions import (
 from pywikibot.pagegenerators import (
     XMLDumpPageGenerator as _XMLDumpPageGenerator,
 )
-from pywikibot.tools.threading import ThreadList
+from pywikibot.tools import issue_deprecation_warning
 
 
 try:
@@ -241,82 +259,266 @@ class NotAnURLError(BaseException):
     """The link is not an URL."""
 
 
+class LinkChecker:
+
+    """A pool of worker threads checking URLs.
+
+    URLs are queued per host. Every host is checked by at most
+    *host_connections* workers at the same time and two requests to the
+    same host start at least *host_delay* seconds apart. Connections are
+    reused through the shared :mod:`comms.http<pywikibot.comms.http>`
+    session. A HEAD request is made first; a GET request is only sent
+    if the server does not answer the HEAD request with success.
+
+    The results are passed to :meth:`History.update` in batches.
+
+    .. versionadded:: 8.6
+       replaces ``LinkCheckThread`` which started a thread per URL
+    """
+
+    header = {
+        'Accept': 'text/xml,application/xml,application/xhtml+xml,'
+                  'text/html;q=0.9,text/plain;q=0.8,image/png,*/*;q=0.5',
+        'Accept-Language': 'de-de,de;q=0.8,en-us;q=0.5,en;q=0.3',
+        'Accept-Charset': 'ISO-8859-1,utf-8;q=0.7,*;q=0.7',
+        'Keep-Alive': '30',
+        'Connection': 'keep-alive',
+    }
+
+    def __init__(self, history, http_ignores=None, *,
+                 workers: Optional[int] = None,
+                 host_connections: Optional[int] = None,
+                 host_delay: Optional[float] = None,
+                 batch_size: int = 50) -> None:
+        """Initializer.
+
+        :param history: the :class:`History` which receives the results
+        :param http_ignores: HTTP status codes which are not reported
+            as dead; such links are treated as alive
+        :param workers: number of worker threads; defaults to
+            ``config.max_external_links``
+        :param host_connections: number of simultaneous requests per
+            host; defaults to ``config.weblink_host_connections``
+        :param host_delay: minimum delay between two requests to the
+            same host; defaults to ``config.weblink_host_delay``
+        :param batch_size: number of results passed to the history at
+            once
+        """
+        self.history = history
+        self.http_ignores = http_ignores or []
+        self.workers = workers or config.max_external_links
+        self.host_connections = (host_connections
+                                 or config.weblink_host_connections)
+        self.host_delay = (config.weblink_host_delay if host_delay is None
+                           else host_delay)
+        self.batch_size = batch_size
+        self.maxsize = self.workers * 20
+        self._use_fake_user_agent = config.fake_user_agent_default.get(
+            'weblinkchecker', False)
+
+        self._cond = threading.Condition()
+        self._queues: Dict[str, deque] = {}
+        self._active: Dict[str, int] = {}
+        self._next_start: Dict[str, float] = {}
+        self._queued = 0
+        self._running = 0
+        self._finishing = False
+        self._results: List[tuple] = []
+        self._results_lock = threading.Lock()
+        self._threads = []
+
+    def __len__(self) -> int:
+        """Return the number of URLs which are queued or checked."""
+        return self._queued + self._running
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work,
+                                      name=f'LinkChecker-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def add(self, page, url: str) -> None:
+        """Queue an URL found on page.
+
+        Blocks while too many URLs are waiting to keep memory bounded.
+        """
+        host = removeprefix(urlparse.urlparse(url).hostname or '', 'www.')
+        with self._cond:
+            self._cond.wait_for(lambda: self._queued < self.maxsize)
+            self._queues.setdefault(host, deque()).append((page, url))
+            self._queued += 1
+            self._cond.notify_all()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued URLs are checked and stop the workers.
+
+        :return: whether all URLs were checked
+        """
+        with self._cond:
+            self._finishing = True
+            self._cond.notify_all()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(None if deadline is None
+                        else max(0, deadline - time.monotonic()))
+        self.flush()
+        return not len(self)
+
+    def flush(self) -> None:
+        """Pass the collected results to the history."""
+        with self._results_lock:
+            results, self._results = self._results, []
+        if results:
+            self.history.update(results)
+
+    def _next(self):
+        """Get the next URL which may be checked now.
+
+        :return: host, page and url or None if the pool is finished
+        """
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                wait = None
+                for host, queue in self._queues.items():
+                    if self._active.get(host, 0) >= self.host_connections:
+                        continue
+                    start = self._next_start.get(host, now)
+                    if start <= now:
+                        break
+                    wait = start - now if wait is None else min(wait,
+                                                                start - now)
+                else:
+                    if self._finishing and not self._queued:
+                        return None
+                    self._cond.wait(wait)
+                    continue
+
+                page, url = queue.popleft()
+                if not queue:
+                    del self._queues[host]
+                self._queued -= 1
+                self._running += 1
+                self._active[host] = self._active.get(host, 0) + 1
+                self._next_start[host] = now + self.host_delay
+                self._cond.notify_all()
+                return host, page, url
+
+    def _done(self, host: str) -> None:
+        """Release a host slot after a check."""
+        with self._cond:
+            self._running -= 1
+            self._active[host] -= 1
+            if not self._active[host]:
+                del self._active[host]
+                if host not in self._queues:
+                    # forget the host once its delay has expired
+                    now = time.monotonic()
+                    for name in [name for name, start
+                                 in self._next_start.items()
+                                 if start <= now and name not in self._queues
+                                 and name not in self._active]:
+                        del self._next_start[name]
+            self._cond.notify_all()
+
+    def _work(self) -> None:
+        """Check URLs until the pool is finished."""
+        while True:
+            job = self._next()
+            if job is None:
+                return
+            host, page, url = job
+            try:
+                error = self.check(url)
+            except requests.exceptions.InvalidURL:
+                error = i18n.twtranslate(page.site,
+                                         'weblinkchecker-badurl_msg',
+                                         {'URL': url})
+            except Exception as e:
+                # the link state is unknown, do not record a result
+                pywikibot.info(f'Exception while processing URL {url} in '
+                               f'page {page}')
+                pywikibot.error(e)
+                continue
+            finally:
+                self._done(host)
+
+            if error:
+                pywikibot.info(f'*{page} links to {url} - {error}.')
+
+            with self._results_lock:
+                self._results.append((url, page, error))
+                full = len(self._results) >= self.batch_size
+            if full:
+                self.flush()
+
+    def request(self, url: str, method: str):
+        """Send a request for url with the shared session.
+
+        The body of a GET response is not downloaded.
+        """
+        return comms.http.fetch(url, method=method, headers=self.header,
+                                use_fake_user_agent=self._use_fake_user_agent,
+                                default_error_handling=False,
+                                allow_redirects=True,
+                                stream=method == 'GET')
+
+    def check(self, url: str) -> Optional[str]:
+        """Check a single URL.
+
+        :return: the error message if the link is dead, otherwise None
+        :raises requests.exceptions.InvalidURL: url is not valid
+        """
+        for method in ('HEAD', 'GET'):
+            r = self.request(url, method)
+            if isinstance(r, requests.exceptions.InvalidURL):
+                raise r
+            if isinstance(r, Exception):
+                status, error = None, f'{type(r).__name__}: {r}'
+                continue
+
+            status = r.status_code
+            r.close()
+            if status == HTTPStatus.OK:
+                return None
+            try:
+                error = HTTPStatus(status).phrase
+            except ValueError:
+                error = f'HTTP {status}'
+
+        return None if status in self.http_ignores else error
+
+
 class LinkCheckThread(threading.Thread):
 
     """A thread responsible for checking one URL.
 
     After checking the page, it will die.
-    """
 
-    #: Collecting start time of a thread for any host
-    hosts: Dict[str, float] = {}
-    lock = threading.Lock()
+    .. deprecated:: 8.6
+       Use :class:`LinkChecker` instead which checks all URLs with a
+       pool of worker threads.
+    """
 
     def __init__(self, page, url, history, http_ignores, day) -> None:
         """Initializer."""
+        issue_deprecation_warning('LinkCheckThread', 'LinkChecker',
+                                  since='8.6.0')
+        super().__init__()
         self.page = page
         self.url = url
         self.history = history
-        self.header = {
-            'Accept': 'text/xml,application/xml,application/xhtml+xml,'
-                      'text/html;q=0.9,text/plain;q=0.8,image/png,*/*;q=0.5',
-            'Accept-Language': 'de-de,de;q=0.8,en-us;q=0.5,en;q=0.3',
-            'Accept-Charset': 'ISO-8859-1,utf-8;q=0.7,*;q=0.7',
-            'Keep-Alive': '30',
-            'Connection': 'keep-alive',
-        }
-        # identification for debugging purposes
         self.http_ignores = http_ignores
-        self._use_fake_user_agent = config.fake_user_agent_default.get(
-            'weblinkchecker', False)
         self.day = day
-        super().__init__()
-
-    @classmethod
-    def get_delay(cls, name: str) -> float:
-        """Determine delay from class attribute.
 
-        Store the last call for a given hostname with an offset of
-        6 seconds to ensure there are no more than 10 calls per minute
-        for the same host. Calculate the delay to start the run.
-
-        :param name: The key for the hosts class attribute
-        :return: The calulated delay to start the run
-        """
-        now = time.monotonic()
-        with cls.lock:
-            timestamp = cls.hosts.get(name, now)
-            cls.hosts[name] = max(now, timestamp) + 6
-        return max(0, timestamp - now)
-
-    def run(self):
-        """Run the bot."""
-        time.sleep(self.get_delay(self.name))
-        try:
-            header = self.header
-            r = comms.http.fetch(
-                self.url, headers=header,
-                use_fake_user_agent=self._use_fake_user_agent)
-        except requests.exceptions.InvalidURL:
-            message = i18n.twtranslate(self.page.site,
-                                       'weblinkchecker-badurl_msg',
-                                       {'URL': self.url})
-        except Exception:
-            pywikibot.info(f'Exception while processing URL {self.url} in '
-                           f'page {self.page}')
-            raise
-
-        if (
-            r.status_code != HTTPStatus.OK
-            or r.status_code in self.http_ignores
-        ):
-            message = HTTPStatus(r.status_code).phrase
-            pywikibot.info(f'*{self.page} links to {self.url} - {message}.')
-            self.history.set_dead_link(self.url, message, self.page,
-                                       config.weblink_dead_days)
-        elif self.history.set_link_alive(self.url):
-            pywikibot.info(
-                f'*Link to {self.url} in {self.page} is back alive.')
+    def run(self) -> None:
+        """Check the URL and record the result in the history."""
+        checker = LinkChecker(self.history, self.http_ignores, workers=1)
+        checker.start()
+        checker.add(self.page, self.url)
+        checker.join()
 
 
 class History:
@@ -324,16 +526,21 @@ class History:
     """
     Store previously found dead links.
 
-    The URLs are dictionary keys, and
-    values are lists of tuples where each tuple represents one time the URL was
-    found dead. Tuples have the form (title, date, error) where title is the
-    wiki page where the URL was found, date is an instance of time, and error
-    is a string with error code and message.
+    The dead links are stored in a SQLite database in the deadlinks
+    subdirectory. The ``urls`` table holds every URL found dead and the
+    ``sightings`` table holds one row for every time the URL was found
+    dead. A sighting has the form (title, date, error) where title is
+    the wiki page where the URL was found, date is a timestamp as
+    returned by :func:`time.time` and error is a string with error code
+    and message.
 
-    We assume that the first element in the list represents the first time we
-    found this dead link, and the last element represents the last time.
+    We assume that the first sighting represents the first time we
+    found this dead link, and the last sighting represents the last
+    time.
 
-    Example::
+    Changes are committed after each update. A history file from
+    earlier releases is imported when the database is created; it is a
+    pickled dict in the form::
 
      dict = {
          'https://www.example.org/page': [
@@ -341,6 +548,25 @@ class History:
              ('WikiPageName2', DATE, '404: File not found'),
          ]
      }
+
+    .. versionchanged:: 8.6
+       the history is stored in a SQLite database instead of a pickle
+       file; *history_dict* attribute was removed.
+    """
+
+    schema = """
+        CREATE TABLE IF NOT EXISTS urls (
+            id INTEGER PRIMARY KEY,
+            url TEXT NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS sightings (
+            url_id INTEGER NOT NULL REFERENCES urls (id) ON DELETE CASCADE,
+            title TEXT NOT NULL,
+            date REAL NOT NULL,
+            error TEXT
+        );
+        CREATE INDEX IF NOT EXISTS sightings_url ON sightings (url_id, date);
+        CREATE INDEX IF NOT EXISTS sightings_title ON sightings (title);
     """
 
     def __init__(self, report_thread, site=None) -> None:
@@ -351,18 +577,46 @@ class History:
         else:
             self.site = site
         self.semaphore = threading.Semaphore()
-        self.datfilename = pywikibot.config.datafilepath(
-            'deadlinks',
-            f'deadlinks-{self.site.family.name}-{self.site.code}.dat')
+        name = f'deadlinks-{self.site.family.name}-{self.site.code}'
+        self.datfilename = pywikibot.config.datafilepath('deadlinks',
+                                                         name + '.dat')
+        self.dbfilename = pywikibot.config.datafilepath('deadlinks',
+                                                        name + '.sqlite')
         # Count the number of logged links, so that we can insert captions
         # from time to time
         self.log_count = 0
-        try:
-            with open(self.datfilename, 'rb') as datfile:
-                self.history_dict = pickle.load(datfile)
-        except (OSError, EOFError):
-            # no saved history exists yet, or history dump broken
-            self.history_dict = {}
+
+        exists = os.path.exists(self.dbfilename)
+        self.db = sqlite3.connect(self.dbfilename, check_same_thread=False)
+        self.db.execute('PRAGMA foreign_keys = ON')
+        self.db.execute('PRAGMA journal_mode = WAL')
+        with self.db:
+            self.db.executescript(self.schema)
+        if not exists and os.path.exists(self.datfilename):
+            pywikibot.info(f'Importing history from {self.datfilename}...')
+            try:
+                self.import_pickle(self.datfilename)
+            except (pickle.UnpicklingError, EOFError) as e:
+                # history dump broken
+                pywikibot.warning(f'Cannot import {self.datfilename}: {e}')
+
+    def sightings(self, url: str) -> List[tuple]:
+        """Return the (title, date, error) tuples of a dead link."""
+        with self.semaphore:
+            return self.db.execute(
+                'SELECT title, date, error FROM sightings'
+                ' JOIN urls ON urls.id = url_id WHERE url = ?'
+                ' ORDER BY date', (url,)).fetchall()
+
+    def page_titles(self):
+        """Yield the titles of pages where dead links were found.
+
+        .. versionadded:: 8.6
+        """
+        cursor = self.db.execute(
+            'SELECT DISTINCT title FROM sightings ORDER BY title')
+        for title, in cursor:
+            yield title
 
     def log(self, url, error, containing_page, archive_url) -> None:
         """Log an error report to a text file in the deadlinks subdirectory."""
@@ -370,7 +624,7 @@ class History:
             error_report = f'* {url} ([{archive_url} archive])\n'
         else:
             error_report = f'* {url}\n'
-        for (page_title, date, error) in self.history_dict[url]:
+        for (page_title, date, error) in self.sightings(url):
             # ISO 8601 formulation
             iso_date = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(date))
             error_report += f'** In [[{page_title}]] on {iso_date}, {error}\n'
@@ -391,51 +645,151 @@ class History:
             self.report_thread.report(url, error_report, containing_page,
                                       archive_url)
 
+    def _add_sighting(self, url, error, page, weblink_dead_days) -> bool:
+        """Add a sighting of a dead link without committing.
+
+        The caller must hold the semaphore.
+
+        :return: whether the link should be logged for deletion
+        """
+        now = time.time()
+        row = self.db.execute('SELECT id FROM urls WHERE url = ?',
+                              (url,)).fetchone()
+        if row is None:
+            url_id = self.db.execute('INSERT INTO urls (url) VALUES (?)',
+                                     (url,)).lastrowid
+            first = last = None
+        else:
+            url_id = row[0]
+            first, last = self.db.execute(
+                'SELECT MIN(date), MAX(date) FROM sightings'
+                ' WHERE url_id = ?', (url_id,)).fetchone()
+
+        # if the last time we found this dead link is less than an hour
+        # ago, we won't save it in the history this time.
+        if last is None or now - last > 60 * 60:
+            self.db.execute(
+                'INSERT INTO sightings (url_id, title, date, error)'
+                ' VALUES (?, ?, ?, ?)', (url_id, page.title(), now, error))
+
+        # if the first time we found this link longer than x day ago
+        # (default is a week), it should probably be fixed or removed.
+        return first is not None \
+            and now - first > 60 * 60 * 24 * weblink_dead_days
+
+    def _report(self, url, error, page) -> None:
+        """Search for an archived page and log the dead link."""
+        try:
+            archive_url = get_archive_url(url)
+        except Exception as e:
+            pywikibot.warning(f'get_closest_memento_url({url}) failed: {e}')
+            archive_url = None
+        self.log(url, error, page, archive_url)
+
     def set_dead_link(self, url, error, page, weblink_dead_days) -> None:
-        """Add the fact that the link was found dead to the .dat file."""
-        with self.semaphore:
-            now = time.time()
-            if url in self.history_dict:
-                time_since_first_found = now - self.history_dict[url][0][1]
-                time_since_last_found = now - self.history_dict[url][-1][1]
-                # if the last time we found this dead link is less than an hour
-                # ago, we won't save it in the history this time.
-                if time_since_last_found > 60 * 60:
-                    self.history_dict[url].append((page.title(), now, error))
-                # if the first time we found this link longer than x day ago
-                # (default is a week), it should probably be fixed or removed.
-                # We'll list it in a file so that it can be removed manually.
-                if time_since_first_found > 60 * 60 * 24 * weblink_dead_days:
-                    # search for archived page
-                    try:
-                        archive_url = get_archive_url(url)
-                    except Exception as e:
-                        pywikibot.warning(
-                            f'get_closest_memento_url({url}) failed: {e}')
-                        archive_url = None
-                    self.log(url, error, page, archive_url)
-            else:
-                self.history_dict[url] = [(page.title(), now, error)]
+        """Add the fact that the link was found dead to the database."""
+        with self.semaphore, self.db:
+            report = self._add_sighting(url, error, page, weblink_dead_days)
+        # We'll list it in a file so that it can be removed manually.
+        if report:
+            self._report(url, error, page)
 
     def set_link_alive(self, url) -> bool:
         """
         Record that the link is now alive.
 
-        If link was previously found dead, remove it from the .dat file.
+        If link was previously found dead, remove it from the database.
 
         :return: True if previously found dead, else returns False.
         """
-        if url in self.history_dict:
-            with self.semaphore, suppress(KeyError):
-                del self.history_dict[url]
-            return True
+        with self.semaphore, self.db:
+            return self.db.execute('DELETE FROM urls WHERE url = ?',
+                                   (url,)).rowcount > 0
+
+    def update(self, results, weblink_dead_days: Optional[int] = None
+               ) -> None:
+        """Record a batch of link check results in one transaction.
+
+        .. versionadded:: 8.6
+
+        :param results: iterable of (url, page, error) tuples where
+            error is None if the link is alive
+        :param weblink_dead_days: days after which a dead link is
+            reported; defaults to ``config.weblink_dead_days``
+        """
+        if weblink_dead_days is None:
+            weblink_dead_days = config.weblink_dead_days
+        reports = []
+        with self.semaphore, self.db:
+            for url, page, error in results:
+                if error:
+                    if self._add_sighting(url, error, page,
+                                          weblink_dead_days):
+                        reports.append((url, error, page))
+                elif self.db.execute('DELETE FROM urls WHERE url = ?',
+                                     (url,)).rowcount:
+                    pywikibot.info(
+                        f'*Link to {url} in {page} is back alive.')
+        for report in reports:
+            self._report(*report)
 
-        return False
+    def import_pickle(self, filename: Optional[str] = None) -> int:
+        """Import a history file of earlier releases.
+
+        Sightings which are already known are skipped.
+
+        .. versionadded:: 8.6
+
+        :param filename: the pickle file; defaults to the ``.dat`` file
+            of the site
+        :return: number of imported URLs
+        """
+        with open(filename or self.datfilename, 'rb') as datfile:
+            history_dict = pickle.load(datfile)
+        with self.semaphore, self.db:
+            for url, sightings in history_dict.items():
+                self.db.execute('INSERT OR IGNORE INTO urls (url) VALUES (?)',
+                                (url,))
+                url_id, = self.db.execute('SELECT id FROM urls WHERE url = ?',
+                                          (url,)).fetchone()
+                self.db.executemany(
+                    'INSERT INTO sightings (url_id, title, date, error)'
+                    ' SELECT ?1, ?2, ?3, ?4 WHERE NOT EXISTS ('
+                    '  SELECT 1 FROM sightings WHERE url_id = ?1'
+                    '  AND date = ?3)',
+                    ((url_id, title, date, error)
+                     for title, date, error in sightings))
+        return len(history_dict)
+
+    def export_pickle(self, filename: Optional[str] = None) -> int:
+        """Export the history to a file readable by earlier releases.
+
+        .. versionadded:: 8.6
+
+        :param filename: the pickle file; defaults to the ``.dat`` file
+            of the site
+        :return: number of exported URLs
+        """
+        history_dict = {}
+        with self.semaphore:
+            for url, title, date, error in self.db.execute(
+                    'SELECT url, title, date, error FROM sightings'
+                    ' JOIN urls ON urls.id = url_id ORDER BY url_id, date'):
+                history_dict.setdefault(url, []).append((title, date, error))
+        with open(filename or self.datfilename, 'wb') as f:
+            pickle.dump(history_dict, f, protocol=config.pickle_protocol)
+        return len(history_dict)
 
     def save(self) -> None:
-        """Save the .dat file to disk."""
-        with open(self.datfilename, 'wb') as f:
-            pickle.dump(self.history_dict, f, protocol=config.pickle_protocol)
+        """Commit pending changes and close the database.
+
+        .. versionchanged:: 8.6
+           the history is committed incrementally; this method only
+           closes the database.
+        """
+        with self.semaphore:
+            self.db.commit()
+            self.db.close()
 
 
 class DeadLinkReportThread(threading.Thread):
@@ -444,7 +798,8 @@ class DeadLinkReportThread(threading.Thread):
     A Thread that is responsible for posting error reports on talk pages.
 
     There is only one DeadLinkReportThread, and it is using a semaphore to make
-    sure that two LinkCheckerThreads cannot access the queue at the same time.
+    sure that two link checker workers cannot access the queue at the same
+    time.
     """
 
     def __init__(self) -> None:
@@ -538,7 +893,11 @@ class WeblinkCheckerRobot(SingleSiteBot, ExistingPageBot):
     """
     Bot which will search for dead weblinks.
 
-    It uses several LinkCheckThreads at once to process pages from generator.
+    It uses a :class:`LinkChecker` pool to check the links of pages
+    from generator.
+
+    .. versionchanged:: 8.6
+       links are checked by :class:`LinkChecker`
     """
 
     use_redirects = False
@@ -556,10 +915,12 @@ class WeblinkCheckerRobot(SingleSiteBot, ExistingPageBot):
         self.history = History(report_thread, site=self.site)
         self.http_ignores = http_ignores or []
         self.day = day
+        self.checker = LinkChecker(self.history, self.http_ignores)
 
-        # Limit the number of threads started at the same time
-        self.threads = ThreadList(limit=config.max_external_links,
-                                  wait_time=config.retry_wait)
+    def setup(self) -> None:
+        """Start the link checker workers."""
+        super().setup()
+        self.checker.start()
 
     def treat_page(self) -> None:
         """Process one page."""
@@ -569,38 +930,31 @@ class WeblinkCheckerRobot(SingleSiteBot, ExistingPageBot):
                 if ignore_regex.match(url):
                     break
             else:
-                # Each thread will check one page, then die.
-                thread = LinkCheckThread(page, url, self.history,
-                                         self.http_ignores, self.day)
-                # thread dies when program terminates
-                thread.daemon = True
-                # use hostname as thread.name
-                thread.name = removeprefix(
-                    urlparse.urlparse(url).hostname, 'www.')
-                self.threads.append(thread)
+                self.checker.add(page, url)
 
     def teardown(self) -> None:
-        """Finish remaining threads and save history file."""
-        num = self.count_link_check_threads()
+        """Finish remaining link checks and save history file."""
+        num = len(self.checker)
         if num:
-            pywikibot.info('<<lightblue>>Waiting for remaining {} threads '
-                           'to finish, please wait...'.format(num))
+            pywikibot.info('<<lightblue>>Waiting for remaining {} links '
+                           'to be checked, please wait...'.format(num))
 
-        while self.count_link_check_threads():
+        while not self.checker.join(timeout=0.1):
             try:
                 time.sleep(0.1)
             except KeyboardInterrupt:
-                # Threads will die automatically because they are daemonic.
-                if pywikibot.input_yn('There are {} pages remaining in the '
+                # Workers will die automatically because they are daemonic.
+                if pywikibot.input_yn('There are {} links remaining in the '
                                       'queue. Really exit?'
-                                      .format(self.count_link_check_threads()),
+                                      .format(len(self.checker)),
                                       default=False, automatic_quit=False):
                     break
 
-        num = self.count_link_check_threads()
+        num = len(self.checker)
         if num:
             pywikibot.info(
-                f'<<yellow>>>Remaining {num} threads will be killed.')
+                f'<<yellow>>>Remaining {num} links will not be checked.')
+        self.checker.flush()
 
         if self.history.report_thread:
             self.history.report_thread.shutdown()
@@ -616,26 +970,20 @@ class WeblinkCheckerRobot(SingleSiteBot, ExistingPageBot):
         pywikibot.info('Saving history...')
         self.history.save()
 
-    @staticmethod
-    def count_link_check_threads() -> int:
-        """Count LinkCheckThread threads.
-
-        :return: number of LinkCheckThread threads
-        """
-        return sum(isinstance(thread, LinkCheckThread)
-                   for thread in threading.enumerate())
-
 
 def RepeatPageGenerator():  # noqa: N802
-    """Generator for pages in History."""
+    """Generator for pages in History.
+
+    .. versionchanged:: 8.6
+       page titles are read from an index of the history database
+       which is closed when the generator is exhausted or closed
+    """
     history = History(None)
-    page_titles = set()
-    for value in history.history_dict.values():
-        for entry in value:
-            page_titles.add(entry[0])
-    for page_title in sorted(page_titles):
-        page = pywikibot.Page(pywikibot.Site(), page_title)
-        yield page
+    try:
+        for page_title in history.page_titles():
+            yield pywikibot.Page(history.site, page_title)
+    finally:
+        history.save()
 
 
 def main(*args: str) -> None:
@@ -649,6 +997,7 @@ def main(*args: str) -> None:
     gen = None
     xml_filename = None
     http_ignores = []
+    import_file = export_file = None
 
     # Process global args and prepare generator args parser
     local_args = pywikibot.handle_args(args)
@@ -663,6 +1012,10 @@ def main(*args: str) -> None:
             gen = RepeatPageGenerator()
         elif arg.startswith('-ignore:'):
             http_ignores.append(int(arg[8:]))
+        elif arg.startswith('-importdat'):
+            import_file = arg[11:] or True
+        elif arg.startswith('-exportdat'):
+            export_file = arg[11:] or True
         elif arg.startswith('-day:'):
             config.weblink_dead_days = int(arg[5:])
         elif arg.startswith('-xmlstart'):
@@ -679,6 +1032,19 @@ def main(*args: str) -> None:
         else:
             gen_factory.handle_arg(arg)
 
+    if import_file or export_file:
+        history = History(None)
+        if import_file:
+            num = history.import_pickle(
+                None if import_file is True else import_file)
+            pywikibot.info(f'{num} links imported.')
+        if export_file:
+            num = history.export_pickle(
+                None if export_file is True else export_file)
+            pywikibot.info(f'{num} links exported.')
+        history.save()
+        return
+
     if xml_filename:
         try:
             xml_start
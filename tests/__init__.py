@@ -147,10 +147,12 @@ script_test_modules = {
     'checkimages',
     'data_ingestion',
     'deletionbot',
+    'download_dump',
     'fixing_redirects',
     'generate_family_file',
     'generate_user_files',
     'harvest_template',
+    'interwiki',
     'interwikidata',
     'l10n',
     'make_dist',
@@ -160,9 +162,14 @@ script_test_modules = {
     'redirect_bot',
     'reflinks',
     'replacebot',
+    'replicate_wiki',
+    'scheduler',
     'script',
+    'solve_disambiguation',
     'template_bot',
     'uploadscript',
+    'vm_auto_erl',
+    'weblinkchecker',
 }
 
 disabled_test_modules = {
@@ -5,13 +5,19 @@
 #
 # Distributed under the terms of the MIT license.
 #
+import os
+import tempfile
 import unittest
 from contextlib import suppress
 from unittest.mock import Mock, patch
 
 import pywikibot
 from pywikibot import BaseSite
-from scripts.category import CategoryMoveRobot, CategoryPreprocess
+from scripts.category import (
+    CategoryDatabase,
+    CategoryMoveRobot,
+    CategoryPreprocess,
+)
 from tests.aspects import DefaultSiteTestCase, TestCase
 
 
@@ -111,6 +117,76 @@ class TestPreprocessingCategory(TestCase):
         self.assertEqual(bot.includeonly, [])
 
 
+class TestCategoryDatabase(TestCase):
+
+    """Test the category graph store."""
+
+    family = 'wikipedia'
+    code = 'en'
+
+    dry = True
+
+    def setUp(self):
+        """Create a database in a temporary directory."""
+        super().setUp()
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tempdir.name, 'graph.sqlite')
+        self.info = {'size': 2, 'pages': 1, 'files': 0, 'subcats': 1}
+        self.calls = 0
+
+        def subcategories(cat):
+            self.calls += 1
+            return iter([pywikibot.Category(self.site, 'Category:Sub')])
+
+        def articles(cat):
+            return iter([pywikibot.Page(self.site, 'Article')])
+
+        for name, attr in (('subcategories', subcategories),
+                           ('articles', articles),
+                           ('categoryinfo', property(lambda cat: self.info))):
+            patcher = patch.object(pywikibot.Category, name, attr)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tempdir.cleanup()
+        super().tearDown()
+
+    def test_members(self):
+        """Test that members are stored and refreshed by counts."""
+        cat = pywikibot.Category(self.site, 'Category:Top')
+        db = CategoryDatabase(filename=self.filename, max_age=0)
+        self.assertEqual(db.get_subcats(cat),
+                         {pywikibot.Category(self.site, 'Category:Sub')})
+        db.dump()
+
+        db = CategoryDatabase(filename=self.filename, max_age=0)
+        self.assertEqual(db.get_articles(cat),
+                         {pywikibot.Page(self.site, 'Article')})
+        self.assertEqual(self.calls, 1)  # counts are unchanged
+
+        self.info = dict(self.info, pages=2)
+        db.get_articles(cat)
+        self.assertEqual(self.calls, 2)
+        db.rebuild()
+        db.get_subcats(cat)
+        self.assertEqual(self.calls, 3)
+        db.dump()
+
+    def test_supercats(self):
+        """Test that supercategories are stored."""
+        sub = pywikibot.Category(self.site, 'Category:Sub')
+        top = pywikibot.Category(self.site, 'Category:Top')
+        db = CategoryDatabase(filename=self.filename)
+        with patch.object(pywikibot.Category, 'categories',
+                          return_value=iter([top])) as categories:
+            self.assertEqual(db.get_supercats(sub), {top})
+            self.assertEqual(db.get_supercats(sub), {top})
+        categories.assert_called_once_with()
+        db.dump()
+
+
 if __name__ == '__main__':  # pragma: no cover
     with suppress(SystemExit):
         unittest.main()
@@ -7,6 +7,7 @@
 #
 import unittest
 from contextlib import suppress
+from unittest.mock import patch
 
 import pywikibot
 from pywikibot.exceptions import IsNotRedirectPageError
@@ -258,6 +259,35 @@ class TestCategoryDryObject(TestCase):
         self.assertEqual(cat.aslink(sort_key='Foo'),
                          '[[Category:Wikipedia categories|Foo]]')
 
+    def test_subcategory_edges(self):
+        """Test subcategory_edges with a category loop."""
+        site = self.get_site()
+        tree = {'A': 'BC', 'B': 'D', 'C': 'DA', 'D': ''}
+        cats = {}
+        for pageid, title in enumerate(tree, start=1):
+            cats[title] = pywikibot.Category(site, title)
+            cats[title]._pageid = pageid
+        cats['D']._catinfo = {'size': 0, 'pages': 0, 'files': 0,
+                              'subcats': 0}
+        queried = []
+
+        def categorymembers(cat, member_type):
+            self.assertEqual(member_type, 'subcat')
+            title = cat.title(with_ns=False)
+            queried.append(title)
+            return iter(cats[child] for child in tree[title])
+
+        with patch.object(site, 'categorymembers', categorymembers):
+            edges = [(level, parent.title(with_ns=False),
+                      child.title(with_ns=False))
+                     for level, parent, child
+                     in cats['A'].subcategory_edges()]
+            self.assertEqual(edges, [(1, 'A', 'B'), (1, 'A', 'C'),
+                                     (2, 'B', 'D'), (2, 'C', 'D'),
+                                     (2, 'C', 'A')])
+            self.assertCountEqual(queried, ['A', 'B', 'C'])
+            self.assertLength(list(cats['A'].subcategory_edges(depth=1)), 2)
+
 
 class CategoryNewestPages(TestCase):
 
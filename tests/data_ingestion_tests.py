@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Unit tests for data_ingestion.py script."""
 #
-# (C) Pywikibot team, 2012-2022
+# (C) Pywikibot team, 2012-2024
 #
 # Distributed under the terms of the MIT license.
 #
@@ -43,6 +43,7 @@ class TestPhoto(TestCase):
                       'set': 'Crystal SVG icon set',
                       'name': 'Sound icon'},
             site=self.get_site('commons'))
+        self.addCleanup(self.obj.discard_photo)
 
     def test_download_photo(self):
         """Test download from http://upload.wikimedia.org/."""
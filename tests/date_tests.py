@@ -93,6 +93,71 @@ class TestMonthName(TestCase):
         self.assertEqual(date.formats['MonthName']['hu'](5), 'május')
 
 
+class TestAutoFormat(TestCase):
+
+    """Test cases for getAutoFormat reverse lookup."""
+
+    net = False
+
+    def test_auto_format(self):
+        """Test getAutoFormat with titles of several formats."""
+        for lang, title, expected in (
+            ('en', '1980s', ('DecadeAD', 1980)),
+            ('en', '2000', ('YearAD', 2000)),
+            ('en', '2000 BC', ('YearBC', 2000)),
+            ('en', '21st century', ('CenturyAD', 21)),
+            ('en', 'January 15', ('Day_January', 15)),
+            ('en', 'January 1990', ('Year_January', 1990)),
+            ('en', 'January 32', (None, None)),
+            ('en', 'january 15', ('Day_January', 15)),
+            ('en', 'March', ('MonthName', 3)),
+            ('en', 'Foo Bar', (None, None)),
+            ('en', '', (None, None)),
+            ('ja', '2000年', ('YearAD', 2000)),
+            ('wa', '1î d\' djanvî', ('Day_January', 1)),
+        ):
+            with self.subTest(lang=lang, title=title):
+                self.assertEqual(date.getAutoFormat(lang, title), expected)
+
+    def test_first_letter_case(self):
+        """Test getAutoFormat with ignoreFirstLetterCase disabled."""
+        self.assertEqual(date.getAutoFormat('en', 'january 15'),
+                         ('Day_January', 15))
+        self.assertEqual(date.getAutoFormat('en', 'january 15',
+                                            ignoreFirstLetterCase=False),
+                         (None, None))
+
+    def test_index_parity(self):
+        """Test that the index gives the same result as trying all."""
+        def get_format(lang, title):
+            for dict_name, dictionary in date.formats.items():
+                if dict_name in skipped:
+                    continue
+                with suppress(ValueError):
+                    return dict_name, dictionary[lang](title)
+            return None, None
+
+        formats = ('YearAD', 'YearBC', 'DecadeAD', 'DecadeBC', 'CenturyAD',
+                   'CenturyBC', 'MillenniumAD', 'MillenniumBC',
+                   'Day_February', 'Day_April', 'Year_May')
+        for lang in ('en', 'fr', 'ja', 'ru', 'wa'):
+            # formats which need month names from the site are left out
+            _, entries = date._build_auto_format_index(lang)
+            skipped = date.formats.keys() - {entry[0] for entry in entries}
+            for dict_name in formats:
+                if dict_name in skipped:
+                    continue
+                _, start, stop = date.formatLimits[dict_name]
+                encode = date.formats[dict_name][lang]
+                for value in range(start, min(stop, start + 50)):
+                    title = encode(value)
+                    with self.subTest(lang=lang, title=title):
+                        self.assertEqual(
+                            date.getAutoFormat(lang, title,
+                                               ignoreFirstLetterCase=False),
+                            get_format(lang, title))
+
+
 class TestMonthDelta(TestCase):
 
     """Tests for adding months to a date and getting the months between two."""
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Tests for download_dump script."""
+#
+# (C) Pywikibot team, 2024
+#
+# Distributed under the terms of the MIT license.
+#
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import unittest
+from contextlib import suppress
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from unittest.mock import patch
+
+import pywikibot
+from scripts.download_dump import DownloadDumpBot
+from tests.aspects import TestCase
+
+
+CONTENT = bytes(range(256)) * 1000
+NAME = 'testwiki-20240101-pages-articles.xml.bz2'
+ETAG = '"v2"'
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+
+    """Local HTTP server which serves a dump directory."""
+
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    """Request handler which answers range requests."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _answer(self, body):
+        files = {
+            '/testwiki/20240101/' + NAME: CONTENT,
+            '/testwiki/20240101/testwiki-20240101-sha1sums.txt':
+                self.server.checksums.encode(),
+        }
+        content = files.get(self.path)
+        self.server.requests.append((self.command, self.path,
+                                     self.headers.get('Range'),
+                                     self.headers.get('If-Range')))
+        if content is None:
+            self.send_response(HTTPStatus.NOT_FOUND)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        match = re.fullmatch(r'bytes=(\d+)-(\d*)',
+                             self.headers.get('Range', ''))
+        if match and self.headers.get('If-Range', ETAG) == ETAG:
+            start = int(match[1])
+            end = int(match[2] or len(content) - 1) + 1
+            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_header('Content-Range', 'bytes {}-{}/{}'.format(
+                start, end - 1, len(content)))
+            content = content[start:end]
+        else:
+            self.send_response(HTTPStatus.OK)
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('ETag', ETAG)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        if body:
+            self.wfile.write(content)
+
+    def do_HEAD(self):  # noqa: N802
+        """Answer a HEAD request."""
+        self._answer(False)
+
+    def do_GET(self):  # noqa: N802
+        """Answer a GET request."""
+        self._answer(True)
+
+    def log_message(self, *args):
+        """Be quiet."""
+
+
+class TestDownloadDump(TestCase):
+
+    """Test DownloadDumpBot against a local HTTP server."""
+
+    net = False
+
+    def setUp(self):
+        """Start the local server."""
+        super().setUp()
+        self.server = _Server(('127.0.0.1', 0), _Handler)
+        self.server.requests = []
+        self.server.checksums = '{}  {}\n'.format(
+            hashlib.sha1(CONTENT).hexdigest(), NAME)
+        thread = threading.Thread(target=self.server.serve_forever,
+                                  daemon=True)
+        thread.start()
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, NAME)
+        patcher = patch.object(
+            DownloadDumpBot, 'base_url',
+            'http://127.0.0.1:{}'.format(self.server.server_port))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(pywikibot, 'info')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Stop the local server and remove the files."""
+        self.server.shutdown()
+        self.server.server_close()
+        self.tempdir.cleanup()
+        super().tearDown()
+
+    def download(self, **kwargs):
+        """Download the dump file and return the result."""
+        bot = DownloadDumpBot(wikiname='testwiki', dumpdate='20240101',
+                              filename='pages-articles.xml.bz2',
+                              storepath=self.tempdir.name, **kwargs)
+        with patch.object(bot, 'get_dump_name', return_value=None):
+            return bot.download_file('pages-articles.xml.bz2')
+
+    def ranges(self):
+        """Return the ranges of the GET requests of the dump file."""
+        return sorted(str(rng) for method, path, rng, _ in self.server.requests
+                      if method == 'GET' and path.endswith(NAME))
+
+    def write_partial(self, content, **state):
+        """Write a partial file and its download state."""
+        with open(self.path + '.part', 'wb') as f:
+            f.write(content)
+        state.setdefault('size', len(CONTENT))
+        state.setdefault('validator', ETAG)
+        with open(self.path + '.part.state', 'w') as f:
+            json.dump(state, f)
+
+    def test_download(self):
+        """Test a single stream download with verification."""
+        self.assertTrue(self.download())
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), CONTENT)
+        self.assertEqual(os.listdir(self.tempdir.name), [NAME])
+        self.assertEqual(self.ranges(), ['None'])
+
+    def test_resume(self):
+        """Test that a partial file is continued."""
+        self.write_partial(CONTENT[:1000])
+        self.assertTrue(self.download())
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), CONTENT)
+        self.assertEqual(os.listdir(self.tempdir.name), [NAME])
+        self.assertEqual(self.ranges(), ['bytes=1000-'])
+        self.assertIn(('GET', '/testwiki/20240101/' + NAME, 'bytes=1000-',
+                       ETAG), self.server.requests)
+
+    def test_resume_other_version(self):
+        """Test that a partial file of another dump is not continued."""
+        self.write_partial(b'x' * 1000, validator='"v1"')
+        self.assertTrue(self.download())
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), CONTENT)
+        self.assertEqual(self.ranges(), ['None'])
+
+        # a partial file without state is not continued either
+        os.remove(self.path)
+        with open(self.path + '.part', 'wb') as f:
+            f.write(b'x' * 1000)
+        self.server.requests.clear()
+        self.assertTrue(self.download())
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), CONTENT)
+        self.assertEqual(self.ranges(), ['None'])
+
+    def test_resume_segments(self):
+        """Test that a segmented download is continued in segments."""
+        self.write_partial(CONTENT[:1000] + bytes(len(CONTENT) - 1000),
+                           segments=[[0, 1000, 128000],
+                                     [128000, 128000, 256000]])
+        self.assertTrue(self.download(segments=1))
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), CONTENT)
+        self.assertEqual(os.listdir(self.tempdir.name), [NAME])
+        self.assertEqual(self.ranges(), ['bytes=1000-127999',
+                                         'bytes=128000-255999'])
+
+    def test_segments(self):
+        """Test a download in parallel segments."""
+        self.assertTrue(self.download(segments=4))
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), CONTENT)
+        self.assertEqual(os.listdir(self.tempdir.name), [NAME])
+        self.assertEqual(self.ranges(), ['bytes=0-63999',
+                                         'bytes=128000-191999',
+                                         'bytes=192000-255999',
+                                         'bytes=64000-127999'])
+
+    def test_checksum_mismatch(self):
+        """Test that a corrupt download is removed."""
+        self.server.checksums = '{}  {}\n'.format('0' * 40, NAME)
+        with patch.object(pywikibot, 'error') as error:
+            self.assertFalse(self.download())
+        error.assert_called_once()
+        self.assertEqual(os.listdir(self.tempdir.name), [])
+
+    def test_multistream_names(self):
+        """Test multistream_names method."""
+        self.assertEqual(
+            DownloadDumpBot.multistream_names(
+                'pages-articles-multistream.xml.bz2'),
+            ('pages-articles-multistream.xml.bz2',
+             'pages-articles-multistream-index.txt.bz2'))
+
+
+if __name__ == '__main__':
+    with suppress(SystemExit):
+        unittest.main()
@@ -5,7 +5,9 @@
 #
 # Distributed under the terms of the MIT license.
 #
+import os
 from contextlib import suppress
+from unittest.mock import patch
 
 import pywikibot
 from pywikibot import bot, config, i18n
@@ -287,6 +289,86 @@ class TestTWTranslate(TWNTestCaseBase):
             i18n.twtranslate('en', 'test-no-english')
 
 
+class TestCompiledBundles(TWNTestCaseBase):
+
+    """Test twtranslate with compiled message bundles."""
+
+    net = False
+    message_package = 'tests.i18n'
+
+    def setUp(self):
+        """Compile the test translations."""
+        super().setUp()
+        self.filename = i18n.compile_bundles()
+        self.addCleanup(i18n._get_store.cache_clear)
+        self.addCleanup(self.filename.unlink)
+
+    def test_store(self):
+        """Test that the compiled store has all messages."""
+        store = i18n._get_store()
+        self.assertIsInstance(store, i18n._BundleStore)
+        for lang in ('de', 'en', 'fr', 'fy', 'ja', 'nl'):
+            bundle = i18n._get_bundle(lang, 'test')
+            for key, value in bundle.items():
+                if key.startswith('test-'):
+                    with self.subTest(lang=lang, key=key):
+                        self.assertEqual(store.get(lang, key), value)
+        self.assertIsNone(store.get('en', 'test-no-english'))
+        self.assertIsNone(store.get('xx', 'test-localized'))
+
+    def test_twtranslate(self):
+        """Test twtranslate with fallback and plural."""
+        self.assertEqual(i18n.twtranslate('fy', 'test-localized'),
+                         'test-localized FY')
+        self.assertEqual(i18n.twtranslate('fy', 'test-semi-localized'),
+                         'test-semi-localized NL')
+        self.assertEqual(i18n.twtranslate('ru', 'test-non-localized'),
+                         'test-non-localized EN')
+        for num, result in ((1, 'Seite'), (2, 'Seiten'), (1, 'Seite')):
+            with self.subTest(num=num):
+                self.assertEqual(
+                    i18n.twtranslate('de', 'test-plural', {'num': num}),
+                    f'Bot: Ändere {num} {result}.')
+        with self.assertRaises(TranslationError):
+            i18n.twtranslate('en', 'test-no-english')
+
+    def test_outdated(self):
+        """Test that outdated bundle files are read from JSON."""
+        for name, stale in (('test', {'de', 'nl'}), ('test/nl.json', {'nl'})):
+            with self.subTest(path=name):
+                self._test_outdated(self.filename.parent / name, stale)
+
+    def _test_outdated(self, path, stale):
+        """Test that the compiled file is not used if path is modified."""
+        stat = path.stat()
+        i18n._get_store.cache_clear()
+        mtime = self.filename.stat().st_mtime + 10
+        os.utime(path, (mtime, mtime))
+        try:
+            # the whole message package is not checked at startup
+            with patch.object(i18n, '_bundles_mtime',
+                              side_effect=AssertionError):
+                store = i18n._get_store()
+            self.assertIsInstance(store, i18n._BundleStore)
+            with patch.object(pywikibot, 'warning') as w, \
+                 patch.object(store, 'get', side_effect=AssertionError):
+                for lang in stale:
+                    self.assertFalse(store.is_fresh('test', lang))
+                self.assertEqual(i18n._get_translation('nl', 'test-localized'),
+                                 'test-localized NL')
+            w.assert_called_once()
+            if 'de' not in stale:
+                self.assertTrue(store.is_fresh('test', 'de'))
+                with patch.object(i18n, '_get_bundle',
+                                  side_effect=AssertionError):
+                    self.assertEqual(
+                        i18n._get_translation('de', 'test-plural'),
+                        'Bot: Ändere %(num)d {{PLURAL:num|Seite|Seiten}}.')
+        finally:
+            os.utime(path, (stat.st_atime, stat.st_mtime))
+            i18n._get_store.cache_clear()
+
+
 class InputTestCase(TWNTestCaseBase, UserInterfaceLangTestCase, PwbTestCase):
 
     """Test i18n.input."""
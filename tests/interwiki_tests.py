@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Tests for interwiki script."""
+#
+# (C) Pywikibot team, 2024
+#
+# Distributed under the terms of the MIT license.
+#
+import threading
+import unittest
+from contextlib import suppress
+from unittest.mock import patch
+
+import pywikibot
+from scripts.interwiki import InterwikiBot, InterwikiBotConfig, Subject
+from tests.aspects import TestCase
+
+
+class TestConcurrentBatches(TestCase):
+
+    """Test preloading batches of several sites at the same time."""
+
+    sites = {
+        'en': {'family': 'wikipedia', 'code': 'en'},
+        'de': {'family': 'wikipedia', 'code': 'de'},
+        'fr': {'family': 'wikipedia', 'code': 'fr'},
+    }
+
+    dry = True
+
+    def setUp(self):
+        """Patch methods which request the sites."""
+        super().setUp()
+        self.home = self.get_site('en')
+        self.de = self.get_site('de')
+        self.fr = self.get_site('fr')
+        self.checked = []
+        self.loaded = []
+        self.release = threading.Event()
+
+        def check_page(subject, page, counter):
+            self.checked.append(page)
+
+        def preload(site, pages):
+            # the batch of the home site is answered last
+            if site == self.home:
+                self.assertTrue(self.release.wait(10))
+            self.loaded.append((site, list(pages)))
+
+        for obj, name, new in (
+                (pywikibot, 'Site', lambda *args, **kwargs: self.home),
+                (pywikibot, 'info', lambda *args, **kwargs: None),
+                (Subject, 'translate', lambda *args, **kwargs: None),
+                (Subject, 'check_page', check_page),
+                (Subject, 'askForHints', lambda subject, counter: None),
+                (InterwikiBot, 'preload', staticmethod(preload))):
+            patcher = patch.object(obj, name, new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.conf = InterwikiBotConfig()
+        self.conf.querysites = 2
+        self.bot = InterwikiBot(self.conf)
+
+    def tearDown(self):
+        """Stop the preload threads."""
+        self.release.set()
+        if self.bot.executor is not None:
+            self.bot.executor.shutdown()
+        super().tearDown()
+
+    def subject(self, *pages):
+        """Return a subject whose todo list contains pages."""
+        subject = Subject(pages[0], conf=self.conf)
+        for page in pages[1:]:
+            subject.todo.append(page)
+        return subject
+
+    def test_pending_sites(self):
+        """Test that pending pages are cleared for the loaded site only."""
+        en = pywikibot.Page(self.home, 'Foo')
+        de = pywikibot.Page(self.de, 'Foo')
+        fr = pywikibot.Page(self.fr, 'Foo')
+        subject = self.subject(en, de, fr)
+        self.assertEqual(subject.whatsNextPageBatch(self.de), [de])
+        self.assertEqual(subject.whatsNextPageBatch(self.fr), [fr])
+        with self.assertRaisesRegex(RuntimeError, "Can't start to work on"):
+            subject.whatsNextPageBatch(self.de)
+
+        subject.batchLoaded(self.bot, self.fr)
+        self.assertEqual(self.checked, [fr])
+        self.assertEqual(list(subject.done), [fr])
+        self.assertEqual(list(subject.pending), [de])
+        self.assertEqual(subject.whatsNextPageBatch(self.fr), [])
+
+        subject.batchLoaded(self.bot, self.de)
+        self.assertEqual(self.checked, [fr, de])
+        self.assertEqual(list(subject.pending), [])
+        self.assertFalse(subject.isDone())  # en is still todo
+        self.assertEqual(subject.whatsNextPageBatch(self.home), [en])
+        self.assertFalse(subject.isDone())  # en is pending
+        subject.batchLoaded(self.bot, self.home)
+        self.assertTrue(subject.isDone())
+
+    def test_out_of_order(self):
+        """Test two sites in flight whose results arrive out of order."""
+        first = pywikibot.Page(self.home, 'Foo')
+        second = pywikibot.Page(self.home, 'Bar')
+        de = pywikibot.Page(self.de, 'Foo')
+        for subject in (self.subject(first, de), self.subject(second)):
+            self.bot.subjects.append(subject)
+            for site, count in subject.openSites():
+                self.bot.plus(site, count)
+
+        # home site and de are queried; de arrives first
+        self.assertTrue(self.bot.oneQuery())
+        self.assertEqual(self.loaded, [(self.de, [de])])
+        self.assertEqual(self.checked, [de])
+        self.assertLength(self.bot.queries, 1)
+        (site, subjects), = self.bot.queries.values()
+        self.assertEqual(site, self.home)
+        self.assertEqual(subjects, self.bot.subjects)
+        self.assertEqual([list(subject.pending)
+                          for subject in self.bot.subjects],
+                         [[first], [second]])
+        self.assertFalse(any(subject.isDone()
+                             for subject in self.bot.subjects))
+
+        # the home site arrives later
+        self.release.set()
+        self.assertTrue(self.bot.oneQuery())
+        self.assertEqual(self.checked, [de, first, second])
+        self.assertEqual(self.bot.queries, {})
+        self.assertTrue(all(subject.isDone()
+                            for subject in self.bot.subjects))
+        self.assertEqual(self.bot.counts, {})
+        self.assertFalse(self.bot.oneQuery())
+
+
+if __name__ == '__main__':
+    with suppress(SystemExit):
+        unittest.main()
@@ -190,6 +190,32 @@ class TestDryPageGenerators(TestCase):
                                                           quantifier='none')
         self.assertLength(tuple(gen), 9)
 
+    def test_RegexFilter_processes(self):
+        """Test RegexFilter with a process pool."""
+        for quantifier in ('any', 'all', 'none'):
+            with self.subTest(quantifier=quantifier):
+                gen = pagegenerators.PagesFromTitlesGenerator(self.titles,
+                                                              self.site)
+                expected = [page.title() for page in
+                            pagegenerators.RegexFilterPageGenerator(
+                                gen, ['template', '/meta'], quantifier,
+                                processes=0)]
+                gen = pagegenerators.PagesFromTitlesGenerator(self.titles,
+                                                              self.site)
+                gen = pagegenerators.RegexFilterPageGenerator(
+                    gen, ['template', '/meta'], quantifier, processes=2)
+                self.assertPageTitlesEqual(gen, expected)
+
+        pages = []
+        for title in self.titles:
+            page = pywikibot.Page(self.site, title)
+            page.text = f'This is the content of {title} as a sample'
+            pages.append(page)
+        gen = pagegenerators.RegexBodyFilterPageGenerator(iter(pages), '/doc',
+                                                          processes=2)
+        self.assertPageTitlesEqual(gen,
+                                   ('Template:!/Doc', 'Template:Template/Doc'))
+
 
 class BasetitleTestCase(TestCase):
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Tests for the redirect.py script."""
 #
-# (C) Pywikibot team, 2017-2022
+# (C) Pywikibot team, 2017-2024
 #
 # Distributed under the terms of the MIT license.
 #
@@ -11,8 +11,12 @@ from unittest.mock import Mock, patch
 
 import pywikibot
 from pywikibot import Page, i18n
-from scripts.redirect import RedirectRobot
-from tests.aspects import DefaultSiteTestCase
+from scripts.redirect import (
+    RedirectGenerator,
+    RedirectRobot,
+    resolve_redirect_chains,
+)
+from tests.aspects import DefaultSiteTestCase, TestCase
 
 
 class RedirectTestRobot(RedirectRobot):
@@ -66,6 +70,49 @@ class TestGetSDTemplateNoSysop(DefaultSiteTestCase):
         w.assert_called_with('No speedy deletion template "n" available.')
 
 
+class TestResolveRedirectChains(TestCase):
+
+    """Test resolve_redirect_chains function."""
+
+    net = False
+
+    def test_chains(self):
+        """Test chains, loops and static redirects."""
+        redirects = {'A': 'B', 'B': 'C', 'C': 'D', 'E': 'C', 'F': 'G',
+                     'G': 'H', 'H': 'F', 'I': 'G', 'J': 'J', 'K': 'S',
+                     'S': 'A'}
+        self.assertEqual(resolve_redirect_chains(redirects, {'S'}), {
+            'A': (3, 'D'), 'B': (2, 'D'), 'C': (1, 'D'), 'E': (2, 'D'),
+            'F': (None, 'F'), 'G': (None, 'F'), 'H': (None, 'F'),
+            'I': (None, 'F'), 'J': (None, 'J'), 'K': (1, 'S'),
+            'S': (4, 'D')})
+
+
+class TestRedirectsInBulk(DefaultSiteTestCase):
+
+    """Test RedirectGenerator.retrieve_redirects_in_bulk method."""
+
+    redirects = {'A': 'B', 'B': 'C', 'D': 'Missing', 'E': 'D', 'F': 'G',
+                 'G': 'F'}
+
+    def retrieve(self, action):
+        """Return the titles and types of the retrieved redirects."""
+        gen = RedirectGenerator(action, bulk=True)
+        with patch.object(gen, 'get_redirect_map',
+                          return_value=(self.redirects, {'C'}, set())), \
+             patch.object(self.site, 'preloadpages', new=iter), \
+             patch.object(pywikibot, 'warning'):
+            return [(page.title(), page._redirect_type, page._redirect_final)
+                    for page in gen.retrieve_redirects_in_bulk(action)]
+
+    def test_actions(self):
+        """Test double, broken and both actions."""
+        self.assertEqual(self.retrieve('double'), [('A', 2, 'C')])
+        self.assertEqual(self.retrieve('broken'), [('D', 0, 'Missing')])
+        self.assertEqual(self.retrieve('both'),
+                         [('A', 2, 'C'), ('D', 0, 'Missing')])
+
+
 if __name__ == '__main__':  # pragma: no cover
     with suppress(SystemExit):
         unittest.main()
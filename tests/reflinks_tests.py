@@ -5,11 +5,31 @@
 #
 # Distributed under the terms of the MIT license.
 #
+import os
+import tempfile
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from types import SimpleNamespace
+from unittest.mock import patch
 
-from scripts.reflinks import ReferencesRobot, XmlDumpPageGenerator, main
+from pywikibot import i18n
+from scripts.reflinks import (
+    ReferencesRobot,
+    TitleCache,
+    XmlDumpPageGenerator,
+    main,
+)
 from tests import join_xml_data_path
-from tests.aspects import ScriptMainTestCase, TestCase
+from tests.aspects import (
+    DefaultDrySiteTestCase,
+    ScriptMainTestCase,
+    TestCase,
+)
 from tests.utils import empty_sites
 
 
@@ -166,6 +186,140 @@ class TestReferencesBotConstructor(ScriptMainTestCase):
                                    site=self.get_site())
 
 
+class TestTitleCache(TestCase):
+
+    """Test the persistent title cache."""
+
+    net = False
+
+    def test_cache(self):
+        """Test storing and expiring link information."""
+        info = {'url': 'https://example.org/', 'status': 200,
+                'titles': ['Example']}
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir, 'cache.sqlite')
+            cache = TitleCache(filename, ttl=60)
+            self.assertIsNone(cache.get('https://example.org/'))
+            cache.set('https://example.org/', info)
+            self.assertEqual(cache.get('https://example.org/'), info)
+            cache.close()
+
+            # reopened with a ttl which lets the entry expire
+            cache = TitleCache(filename, ttl=-1)
+            self.assertIsNone(cache.get('https://example.org/'))
+            cache.close()
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+
+    """Local HTTP server which serves linked pages."""
+
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    """Request handler which counts simultaneous requests."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # noqa: N802
+        """Answer a GET request slowly."""
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        time.sleep(0.1)
+        with server.lock:
+            server.active -= 1
+
+        if self.path.startswith('/missing'):
+            status, body = HTTPStatus.NOT_FOUND, b''
+        else:
+            status = HTTPStatus.OK
+            body = '<html><head><title>Page {}</title></head></html>' \
+                   .format(self.path).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        """Be quiet."""
+
+
+class TestPrefetch(DefaultDrySiteTestCase):
+
+    """Test prefetching links against a local HTTP server."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Verify that the translations are available."""
+        if not i18n.twhas_key('en', 'reflinks-msg'):
+            raise unittest.SkipTest('reflinks i18n messages are not available')
+        super().setUpClass()
+
+    def setUp(self):
+        """Start the local server and set up the bot."""
+        super().setUp()
+        self.server = _Server(('127.0.0.1', 0), _Handler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.active = self.server.max_active = 0
+        thread = threading.Thread(target=self.server.serve_forever,
+                                  daemon=True)
+        thread.start()
+        self.base = 'http://127.0.0.1:{}'.format(self.server.server_port)
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.cache = TitleCache(os.path.join(self.tempdir.name,
+                                             'cache.sqlite'), ttl=60)
+        with patch('scripts.noreferences.NoReferencesBot'):
+            self.bot = ReferencesRobot(site=self.site, lookahead=2)
+
+    def tearDown(self):
+        """Stop the local server and remove the cache."""
+        self.server.shutdown()
+        self.server.server_close()
+        self.cache.close()
+        self.tempdir.cleanup()
+        super().tearDown()
+
+    def run_bot(self, pages):
+        """Prefetch and get the links of pages like the bot does."""
+        self.bot.cache = self.cache
+        self.bot._executor = ThreadPoolExecutor(max_workers=6)
+        infos = {}
+        for page in self.bot.lookahead(iter(pages)):
+            for url in page.urls:
+                infos[url[len(self.base):]] = self.bot.get_link_info(url)
+        self.bot._executor.shutdown()
+        return infos
+
+    def test_prefetch(self):
+        """Test the host limit and that cached links are not fetched."""
+        paths = ['/a', '/b', '/c', '/missing', '/d', '/e']
+        pages = []
+        for i in range(0, len(paths), 2):
+            urls = [self.base + path for path in paths[i:i + 2]]
+            pages.append(SimpleNamespace(
+                urls=urls,
+                text=''.join(f'<ref>{url}</ref>' for url in urls)))
+
+        infos = self.run_bot(pages)
+        self.assertEqual(sorted(self.server.requests), sorted(paths))
+        self.assertEqual(self.server.max_active,
+                         ReferencesRobot.host_connections)
+        self.assertEqual(infos['/a']['titles'], ['Page /a'])
+        self.assertEqual(infos['/missing']['status'], HTTPStatus.NOT_FOUND)
+
+        # only the link with the error status is fetched again
+        self.server.requests.clear()
+        self.assertEqual(self.run_bot(pages), infos)
+        self.assertEqual(self.server.requests, ['/missing'])
+
+
 def dummy_constructor(self, *args, **kwargs):
     """A constructor faking the actual constructor."""
     TestReferencesBotConstructor.constructor_args = args
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Tests for replicate_wiki script."""
+#
+# (C) Pywikibot team, 2024
+#
+# Distributed under the terms of the MIT license.
+#
+import unittest
+from contextlib import suppress
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pywikibot
+from scripts.replicate_wiki import (
+    replicate_pages,
+    replicate_to_sites,
+    text_sha1,
+)
+from tests.aspects import TestCase
+
+
+class TestReplicatePages(TestCase):
+
+    """Test replicate_pages and replicate_to_sites with patched pages."""
+
+    sites = {
+        'li': {'family': 'wikipedia', 'code': 'li'},
+        'fy': {'family': 'wikipedia', 'code': 'fy'},
+    }
+
+    dry = True
+
+    #: current texts of the target pages of all sites
+    current = {'Same': 'same text', 'Differs': 'old text'}
+
+    def setUp(self):
+        """Patch the methods which request the site."""
+        super().setUp()
+        self.preloaded = []
+        self.diffed = []
+        self.saved = []
+
+        def preloadpages(site, pages, **kwargs):
+            pages = list(pages)
+            self.preloaded.append((site, [page.title() for page in pages]))
+            return iter(pages)
+
+        def save(page, summary, **kwargs):
+            self.saved.append((page.site, page.title(), page._text, summary))
+
+        def show_diff(old, new):
+            self.diffed.append(old)
+
+        revision = property(lambda page: SimpleNamespace(
+            sha1=text_sha1(self.current[page.title()])))
+        text = property(lambda page: self.current[page.title()],
+                        lambda page, value: setattr(page, '_text', value))
+
+        for obj, name, new in (
+                (pywikibot.site.APISite, 'preloadpages', preloadpages),
+                (pywikibot.Page, 'exists',
+                 lambda page: page.title() in self.current),
+                (pywikibot.Page, 'latest_revision', revision),
+                (pywikibot.Page, 'text', text),
+                (pywikibot.Page, 'save', save),
+                (pywikibot, 'showDiff', show_diff),
+                (pywikibot, 'info', lambda *args, **kwargs: None)):
+            patcher = patch.object(obj, name, new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_replicate_pages(self):
+        """Test that only missing or differing pages are saved."""
+        site = self.get_site('li')
+        texts = {'Same': 'same text', 'Differs': 'new text',
+                 'Missing': 'missing text'}
+        self.assertEqual(replicate_pages(site, texts, 'Sync', minor=True),
+                         ['Differs', 'Missing'])
+        self.assertEqual(self.preloaded,
+                         [(site, ['Same', 'Differs', 'Missing'])])
+        self.assertEqual(self.diffed, ['old text'])
+        self.assertEqual(self.saved,
+                         [(site, 'Differs', 'new text', 'Sync'),
+                          (site, 'Missing', 'missing text', 'Sync')])
+
+    def test_no_replace(self):
+        """Test that differing pages are only shown without replace."""
+        site = self.get_site('li')
+        texts = {'Same': 'same text', 'Differs': 'new text'}
+        self.assertEqual(replicate_pages(site, texts, 'Sync', replace=False),
+                         ['Differs'])
+        self.assertEqual(self.diffed, ['old text'])
+        self.assertEqual(self.saved, [])
+
+    def test_replicate_to_sites(self):
+        """Test replicating to several sites."""
+        li = self.get_site('li')
+        fy = self.get_site('fy')
+        texts = {li: {'Same': 'same text'},
+                 fy: {'Same': 'other text', 'Differs': 'old text'}}
+        result = replicate_to_sites([li, fy], texts.get,
+                                    lambda site: f'Sync {site.code}')
+        self.assertEqual(result, {li: [], fy: ['Same']})
+        self.assertEqual(self.diffed, ['same text'])
+        self.assertEqual(self.saved,
+                         [(fy, 'Same', 'other text', 'Sync fy')])
+
+
+if __name__ == '__main__':
+    with suppress(SystemExit):
+        unittest.main()
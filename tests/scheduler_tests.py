@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Test scheduler script."""
+#
+# (C) Pywikibot team, 2024
+#
+# Distributed under the terms of the MIT license.
+#
+import json
+import os
+import tempfile
+import unittest
+from contextlib import suppress
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from pywikibot.scripts.scheduler import (
+    CronSchedule,
+    Job,
+    Scheduler,
+    load_jobs,
+    main,
+    parse_command,
+)
+from tests.aspects import TestCase
+
+
+class TestCronSchedule(TestCase):
+
+    """Test CronSchedule."""
+
+    net = False
+
+    def test_every_minute(self):
+        """Test a schedule without restrictions."""
+        schedule = CronSchedule('* * * * *')
+        self.assertTrue(schedule.match(datetime(2024, 2, 29, 23, 59)))
+
+    def test_steps_and_lists(self):
+        """Test steps, ranges and lists."""
+        schedule = CronSchedule('*/20 3,15 * * *')
+        self.assertEqual(schedule.minutes, {0, 20, 40})
+        self.assertEqual(schedule.hours, {3, 15})
+        self.assertTrue(schedule.match(datetime(2024, 1, 1, 15, 40)))
+        self.assertFalse(schedule.match(datetime(2024, 1, 1, 15, 41)))
+        self.assertFalse(schedule.match(datetime(2024, 1, 1, 4, 40)))
+        self.assertEqual(CronSchedule('5-20/5 * * * *').minutes,
+                         {5, 10, 15, 20})
+        self.assertEqual(CronSchedule('50/5 * * * *').minutes, {50, 55})
+
+    def test_days(self):
+        """Test day of month and day of week."""
+        # 2024-01-03 is a Wednesday
+        weekly = CronSchedule('0 4 * * 3')
+        self.assertTrue(weekly.match(datetime(2024, 1, 3, 4, 0)))
+        self.assertFalse(weekly.match(datetime(2024, 1, 4, 4, 0)))
+        sunday = CronSchedule('0 0 * * 7')
+        self.assertTrue(sunday.match(datetime(2024, 1, 7, 0, 0)))
+        every_third = CronSchedule('1 3 */3 * *')
+        self.assertTrue(every_third.match(datetime(2024, 1, 4, 3, 1)))
+        self.assertFalse(every_third.match(datetime(2024, 1, 5, 3, 1)))
+        # either day of month or day of week if both are restricted
+        both = CronSchedule('0 0 1 * 3')
+        self.assertTrue(both.match(datetime(2024, 1, 1, 0, 0)))
+        self.assertTrue(both.match(datetime(2024, 1, 3, 0, 0)))
+        self.assertFalse(both.match(datetime(2024, 1, 4, 0, 0)))
+
+    def test_invalid(self):
+        """Test invalid expressions."""
+        for expression in ('* * * *', '60 * * * *', '* * 0 * *',
+                           '*/0 * * * *', '5-1 * * * *', 'a * * * *'):
+            with self.subTest(expression=expression), \
+                 self.assertRaises(ValueError):
+                CronSchedule(expression)
+
+
+class TestJobTable(TestCase):
+
+    """Test reading the job table."""
+
+    net = False
+
+    def test_parse_command(self):
+        """Test parse_command function."""
+        self.assertEqual(
+            parse_command('pyvenv/bin/python bot/pwb.py bot/pwb.py '
+                          'pers-bek-info-bot.py -always "-summary:a b"'),
+            ('pers-bek-info-bot.py', ['-always', '-summary:a b']))
+        for command in ('sh ~/bot/jobs/daily-log-cleanup.sh',
+                        'python pwb.py', ''):
+            with self.subTest(command=command), \
+                 self.assertRaises(ValueError):
+                parse_command(command)
+
+    def test_load_jobs(self):
+        """Test load_jobs function."""
+        entries = [
+            {'name': 'stats', 'schedule': '0 4 * * 3',
+             'command': 'python pwb.py bot-stats.py -always'},
+            {'name': 'helper', 'schedule': '*/20 * * * *',
+             'script': 'mp-helper', 'args': '-force', 'log': 'mp.log',
+             'emails': 'onfailure'},
+            {'name': 'cleanup', 'schedule': '59 23 * * *',
+             'command': 'sh cleanup.sh'},
+            {'name': 'scheduler', 'command': 'python pwb.py scheduler'},
+        ]
+        with tempfile.NamedTemporaryFile('w', suffix='.json',
+                                         delete=False) as f:
+            json.dump(entries, f)
+        try:
+            jobs = load_jobs(f.name)
+        finally:
+            os.remove(f.name)
+        self.assertEqual([job.name for job in jobs], ['stats', 'helper'])
+        stats, helper = jobs
+        self.assertEqual(stats.script, 'bot-stats.py')
+        self.assertEqual(stats.args, ('-always',))
+        self.assertEqual(stats.emails, 'none')
+        self.assertIsNone(stats.log)
+        self.assertEqual(helper.script, 'mp-helper.py')
+        self.assertEqual(helper.args, ('-force',))
+        self.assertEqual(helper.emails, 'onfailure')
+        self.assertEqual(helper.log, 'mp.log')
+
+
+class TestScheduler(TestCase):
+
+    """Test Scheduler queue handling."""
+
+    net = False
+
+    def test_submit(self):
+        """Test that a job is queued only once."""
+        job = Job('helper', CronSchedule('* * * * *'), 'mp-helper.py')
+        scheduler = Scheduler([job], logdir='logs')
+        scheduler.submit(job)
+        scheduler.submit(job)  # still queued
+        self.assertEqual(list(scheduler.pending), [job])
+        self.assertEqual(scheduler.log_file(job),
+                         os.path.join('logs', 'helper.log'))
+
+    def test_submit_due(self):
+        """Test that no minute is missed after a stall."""
+        hourly = Job('hourly', CronSchedule('0 * * * *'), 'a.py')
+        often = Job('often', CronSchedule('58,59 * * * *'), 'b.py')
+        scheduler = Scheduler([hourly, often])
+        last = datetime(2024, 1, 1, 11, 57)
+        now = last + timedelta(minutes=4)
+        self.assertEqual(scheduler.submit_due(last, now), now)
+        self.assertEqual(list(scheduler.pending), [often, hourly])
+        # nothing is checked twice
+        scheduler.pending.clear()
+        self.assertEqual(scheduler.submit_due(now, now), now)
+        self.assertEqual(list(scheduler.pending), [])
+
+    def test_notify(self):
+        """Test mails about failed jobs."""
+        with tempfile.TemporaryDirectory() as logdir:
+            quiet = Job('quiet', CronSchedule('* * * * *'), 'a.py')
+            mailing = Job('mailing', CronSchedule('* * * * *'), 'b.py',
+                          emails='onfailure')
+            self.assertEqual(quiet.args, ())
+            scheduler = Scheduler([quiet, mailing], logdir=logdir,
+                                  mailto='bot@example.org', smtp='smtp.test')
+            with open(scheduler.log_file(mailing), 'w') as f:
+                f.write('Traceback\n')
+            with patch('smtplib.SMTP') as smtp:
+                scheduler.notify(quiet, 1, 'quiet failed')
+                scheduler.notify(mailing, 0, 'mailing finished')
+                smtp.assert_not_called()
+                scheduler.notify(mailing, 1, 'mailing failed')
+        smtp.assert_called_once_with('smtp.test', timeout=30)
+        mail = smtp.return_value.__enter__.return_value.send_message \
+            .call_args[0][0]
+        self.assertEqual(mail['To'], 'bot@example.org')
+        self.assertEqual(mail['Subject'], '[scheduler] mailing failed')
+        self.assertIn('Traceback', mail.get_content())
+
+
+class TestMain(TestCase):
+
+    """Test command line handling of the scheduler."""
+
+    net = False
+
+    def test_unknown_parameters(self):
+        """Test that unknown parameters are reported."""
+        with patch('pywikibot.scripts.scheduler.suggest_help',
+                   return_value=True) as suggest_help, \
+             patch('pywikibot.scripts.scheduler.load_jobs') as load_jobs, \
+             patch('pywikibot.handle_args', side_effect=list):
+            main('-jobs:jobs.json', '-workers', '-foo')
+        suggest_help.assert_called_once_with(
+            missing_parameters=[], unknown_parameters=['-workers', '-foo'])
+        load_jobs.assert_not_called()
+
+
+if __name__ == '__main__':
+    with suppress(SystemExit):
+        unittest.main()
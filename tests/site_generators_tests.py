@@ -1531,6 +1531,18 @@ class TestUserList(DefaultSiteTestCase):
                     self.assertNotIn('missing', user)
         self.assertEqual(cnt, len(all_users), 'Some test usernames not found')
 
+    def test_preloadusers(self):
+        """Test the site.preloadusers() method."""
+        user_list = ['Jimbo Wales', 'Brion VIBBER', 'Tim Starling']
+        users = [pywikibot.User(self.site, name) for name in user_list]
+        users.append(users[0])  # duplicate
+        preloaded = list(self.site.preloadusers(users, groupsize=2))
+        self.assertEqual(preloaded, users)
+        for user in preloaded:
+            with self.subTest(user=user.username):
+                self.assertTrue(hasattr(user, '_userprops'))
+                self.assertEqual(user.getprops()['name'], user.username)
+
 
 class SiteRandomTestCase(DefaultSiteTestCase):
 
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Tests for solve_disambiguation script."""
+#
+# (C) Pywikibot team, 2024
+#
+# Distributed under the terms of the MIT license.
+#
+import unittest
+from contextlib import suppress
+from unittest.mock import patch
+
+import pywikibot
+from scripts.solve_disambiguation import (
+    DisambiguationRobot,
+    ReferringPageGeneratorWithIgnore,
+)
+from tests.aspects import DefaultDrySiteTestCase
+
+
+class TestBatchMode(DefaultDrySiteTestCase):
+
+    """Test batch mode of DisambiguationRobot."""
+
+    references = {'Foo': ['A', 'B'], 'Bar': ['B']}
+
+    def setUp(self):
+        """Patch methods which request the site."""
+        super().setUp()
+        site = self.site
+
+        def refs(gen):
+            return iter(pywikibot.Page(site, title)
+                        for title in self.references[gen.page.title()])
+
+        def alternatives(bot, page):
+            bot.opt.pos.append(page.title() + ' (thing)')
+            return True
+
+        for obj, name, new in (
+                (ReferringPageGeneratorWithIgnore, '__iter__', refs),
+                (DisambiguationRobot, 'findAlternatives', alternatives),
+                (pywikibot.Page, 'getReferences', lambda *a, **k: iter([])),
+                (pywikibot, 'info', lambda *args, **kwargs: None)):
+            patcher = patch.object(obj, name, new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.bot = DisambiguationRobot(generator=[], batch=10, always='1',
+                                       site=site)
+        self.bot.setup()
+
+    def test_collect_references(self):
+        """Test the inverted index of referring pages."""
+        foo = pywikibot.Page(self.site, 'Foo')
+        bar = pywikibot.Page(self.site, 'Bar')
+        self.bot.collect_references([foo, bar])
+        self.assertEqual(self.bot.referring, {'A': [foo], 'B': [foo, bar]})
+        self.assertEqual(self.bot.disamb_alternatives,
+                         {foo: ['Foo (thing)'], bar: ['Bar (thing)']})
+
+    def test_single_edit(self):
+        """Test that all links are fixed in a single edit."""
+        self.bot.collect_references([pywikibot.Page(self.site, 'Foo'),
+                                     pywikibot.Page(self.site, 'Bar')])
+        page = pywikibot.Page(self.site, 'B')
+        page.text = 'A [[Foo]] and a [[bar|Bar]].'
+        with patch.object(pywikibot.Page, 'get', lambda *a, **k: 'old'), \
+             patch.object(pywikibot.Page, 'isRedirectPage',
+                          lambda *a, **k: False), \
+             patch.object(pywikibot, 'input_choice',
+                          lambda question, options, **kwargs:
+                          options[0].result(kwargs['default'])), \
+             patch.object(pywikibot, 'showDiff'), \
+             patch.object(self.site, 'mediawiki_message',
+                          return_value='; '), \
+             patch.object(self.bot, 'setSummaryMessage',
+                          lambda page, *args: setattr(
+                              self.bot, 'summary', page.title())), \
+             patch.object(self.bot, 'save') as save:
+            self.bot.treat_referring_page(page)
+        save.assert_called_once()
+        self.assertEqual(save.call_args[0][1:], (
+            'A [[Foo (thing)|Foo]] and a [[Bar (thing)|Bar]].', 'Foo; Bar'))
+
+
+if __name__ == '__main__':
+    with suppress(SystemExit):
+        unittest.main()
@@ -75,6 +75,20 @@ class TestXMLPageGenerator(TestCase):
         self.assertLength(pages, 1)
         self.assertPageTitlesEqual(pages, ['Pear'], site=self.site)
 
+    def test_match_processes(self):
+        """Test pages with a predicate evaluated in a process pool."""
+        template = pywikibot.Page(self.site, 'Template:Taxobox')
+        builder = MultiTemplateMatchBuilder(self.site)
+        predicate = builder.search_any_predicate([template])
+        gen = XMLDumpPageGenerator(
+            filename=join_xml_data_path('article-pear-0.10.xml'),
+            site=self.site,
+            text_predicate=predicate,
+            processes=2)
+        pages = list(gen)
+        self.assertLength(pages, 1)
+        self.assertPageTitlesEqual(pages, ['Pear'], site=self.site)
+
     def test_match_msg(self):
         """Test pages with {{msg:..}}."""
         pages = self.generator('Foo', 'dummy-template.xml')
@@ -536,6 +536,40 @@ class TestTemplateParams(TestCase):
                                ('d', OrderedDict([('1', '')]))
                                ])
 
+    def test_extract_templates_params_builtin(self):
+        """Test using the built-in scanner."""
+        func = textlib.extract_templates_and_params_builtin
+        self._common_results(func)
+        self._order_differs(func)
+        self._unstripped(func)
+        self._etp_regex_differs(func)
+
+        for template in ('{{subst:a|b=c}}', '{{safesubst:a|b=c}}',
+                         '{{msgnw:a|b=c}}', '{{subst::a|b=c}}'):
+            with self.subTest(template=template):
+                name = template.strip('{}').split('|')[0]
+                self.assertEqual(func(template),
+                                 [(name, OrderedDict((('b', 'c'), )))])
+
+        self.assertEqual(func('{{a|{{c|{{d}}}}}}'),
+                         [('a', OrderedDict([('1', '{{c|{{d}}}}')])),
+                          ('c', OrderedDict((('1', '{{d}}'), ))),
+                          ('d', OrderedDict())])
+        self.assertEqual(func('{{a|[[b|c]]|d=[[e=f]]|<ref name=g>h|}}</ref>'
+                              '|<nowiki>|</nowiki>}}'),
+                         [('a', OrderedDict([('1', '[[b|c]]'),
+                                             ('d', '[[e=f]]'),
+                                             ('2', '<ref name=g>h|}}</ref>'),
+                                             ('3', '<nowiki>|</nowiki>')]))])
+        self.assertEqual(func('{{#if:a|{{b}}}}<!-- {{c}} -->{{}}'),
+                         [('b', OrderedDict())])
+
+        func = functools.partial(textlib.extract_templates_and_params_builtin,
+                                 strip=True)
+        self._common_results(func)
+        self._order_differs(func)
+        self._stripped(func)
+
     def test_extract_templates_params(self):
         """Test that the normal entry point works."""
         func = functools.partial(textlib.extract_templates_and_params,
@@ -672,6 +706,97 @@ class TestDisabledParts(DefaultDrySiteTestCase):
             'text This is a reference. text')
 
 
+class TestWikitextLexer(DefaultDrySiteTestCase):
+
+    """Test textlib functions with a WikitextLexer."""
+
+    texts = (
+        'text <nowiki>tag</nowiki> text',
+        'A <!-- x --> B <pre>x</pre> x <source>x</source> x',
+        '<nowiki>a<!-- </nowiki> -->b</nowiki>c',
+        'a {{templatename | 1={{a}}2{{a}} | 2={{a}}1{{a}} }} a',
+        '\n==x==\nx <!-- x -->\n== <!-- x --> ==\nx\n',
+        '[[Category:x]] <nowiki>[[Category:y]]</nowiki> [[de:x]]',
+    )
+
+    def test_remove_disabled_parts(self):
+        """Test removeDisabledParts with a lexer."""
+        for text in self.texts:
+            for tags in (None, ['nowiki', 'comment'], ['template', 'link']):
+                with self.subTest(text=text, tags=tags):
+                    lexer = textlib.WikitextLexer(text, self.site)
+                    self.assertEqual(
+                        textlib.removeDisabledParts(text, tags, lexer=lexer),
+                        textlib.removeDisabledParts(text, tags))
+
+    def test_is_disabled(self):
+        """Test isDisabled with a lexer."""
+        text = 'a<!-- b -->c<nowiki>d</nowiki>e <pre>f</pre>'
+        lexer = textlib.WikitextLexer(text, self.site)
+        for char, disabled in zip('abcdef', (False, True, False,
+                                             True, False, True)):
+            index = text.index(char)
+            with self.subTest(char=char):
+                self.assertEqual(
+                    textlib.isDisabled(text, index, lexer=lexer), disabled)
+                self.assertEqual(textlib.isDisabled(text, index), disabled)
+
+    def test_replace_except(self):
+        """Test replaceExcept with a lexer."""
+        for text in self.texts:
+            for new in ('y', 'verylongreplacement', ''):
+                with self.subTest(text=text, new=new):
+                    exceptions = ['comment', 'nowiki', 'pre', 'source',
+                                  'template', 'header']
+                    lexer = textlib.WikitextLexer(text, self.site)
+                    self.assertEqual(
+                        textlib.replaceExcept(text, 'x|a', new, exceptions,
+                                              site=self.site, lexer=lexer),
+                        textlib.replaceExcept(text, 'x|a', new, exceptions,
+                                              site=self.site))
+
+    def test_extract_sections(self):
+        """Test extract_sections with a lexer."""
+        text = self.texts[4]
+        lexer = textlib.WikitextLexer(text, self.site)
+        result = extract_sections(text, self.site, lexer=lexer)
+        self.assertEqual([section.title for section in result.sections],
+                         ['==x==', '== <!-- x --> =='])
+        text = '<!--\n== x ==\n-->\n== y ==\n'
+        result = extract_sections(text, self.site)
+        self.assertEqual([section.title for section in result.sections],
+                         ['== y =='])
+
+    def test_get_category_links(self):
+        """Test getCategoryLinks with a lexer."""
+        text = self.texts[5]
+        lexer = textlib.WikitextLexer.for_text(text, self.site)
+        self.assertIs(lexer, textlib.WikitextLexer.for_text(text, self.site))
+        self.assertEqual(
+            textlib.getCategoryLinks(text, self.site, lexer=lexer),
+            textlib.getCategoryLinks(text, self.site))
+
+    def test_different_text(self):
+        """Test lexer with another text."""
+        lexer = textlib.WikitextLexer('foo', self.site)
+        with self.assertRaisesRegex(ValueError, 'different text'):
+            textlib.removeDisabledParts('bar', lexer=lexer)
+
+    def test_different_site(self):
+        """Test lexer with another site."""
+        lexer = textlib.WikitextLexer('foo', None)
+        for func in (textlib.removeDisabledParts, extract_sections):
+            with self.subTest(func=func.__name__), \
+                    self.assertRaisesRegex(ValueError, 'created for site'):
+                func('foo', site=self.site, lexer=lexer)
+        with self.assertRaisesRegex(ValueError, 'created for site'):
+            textlib.replaceExcept('foo', 'x', 'y', [], site=self.site,
+                                  lexer=lexer)
+        # the lexer site is used if no site is given
+        self.assertEqual(textlib.replaceExcept('foo', 'o', 'a', [],
+                                               lexer=lexer), 'faa')
+
+
 class TestReplaceLinks(TestCase):
 
     """Test the replace_links function in textlib."""
@@ -6,6 +6,7 @@
 # Distributed under the terms of the MIT license.
 import decimal
 import hashlib
+import logging
 import os
 import subprocess
 import tempfile
@@ -17,6 +18,10 @@ from functools import partial
 from unittest import mock
 
 from pywikibot import config, tools
+from pywikibot.logging import (
+    CompressedRotatingFileHandler,
+    _compression_queue,
+)
 from pywikibot.tools import (
     cached,
     classproperty,
@@ -188,6 +193,36 @@ class OpenArchiveWriteTestCase(TestCase):
         self.assertEqual(content[:6], b'\xFD7zXZ\x00')
 
 
+class CompressedLogHandlerTestCase(TestCase):
+
+    """Test compression of rotated log files."""
+
+    net = False
+
+    def test_rotating_handler(self):
+        """Test CompressedRotatingFileHandler."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logfile = os.path.join(tmpdir, 'bot.log')
+            handler = CompressedRotatingFileHandler(
+                logfile, maxBytes=100, backupCount=2, compression='bz2',
+                encoding='utf-8')
+            logger = logging.getLogger('pywiki.tests.compression')
+            logger.addHandler(handler)
+            try:
+                for i in range(6):
+                    logger.warning('message %d %s', i, 'x' * 60)
+            finally:
+                logger.removeHandler(handler)
+                handler.close()
+            _compression_queue.join()
+
+            self.assertEqual(sorted(os.listdir(tmpdir)),
+                             ['bot.log', 'bot.log.1.bz2', 'bot.log.2.bz2'])
+            with tools.open_archive(logfile + '.1.bz2') as f:
+                self.assertEqual(f.read().decode(),
+                                 f'message 4 {"x" * 60}\n')
+
+
 class MergeUniqueDicts(TestCase):
 
     """Test merge_unique_dicts."""
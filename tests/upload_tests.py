@@ -5,16 +5,21 @@ Site upload test.
 These tests write to the wiki.
 """
 #
-# (C) Pywikibot team, 2014-2022
+# (C) Pywikibot team, 2014-2024
 #
 # Distributed under the terms of the MIT license.
 #
+import hashlib
 import unittest
 from contextlib import suppress
+from unittest.mock import patch
 
 import pywikibot
+from pywikibot import config
+from pywikibot.site._upload import ChunkReader, Uploader
+from pywikibot.tools import compute_file_hash
 from tests import join_images_path
-from tests.aspects import TestCase
+from tests.aspects import DefaultDrySiteTestCase, TestCase
 
 
 class TestUpload(TestCase):
@@ -150,6 +155,71 @@ class TestUpload(TestCase):
         self._verify_stash()
 
 
+class TestChunkReader(TestCase):
+
+    """Test ChunkReader without writing to a wiki."""
+
+    net = False
+
+    sounds_png = join_images_path('MP_sounds.png')
+
+    def test_read(self):
+        """Test reading ahead and hashing in the same pass."""
+        with open(self.sounds_png, 'rb') as f:
+            content = f.read()
+            with ChunkReader(f, 500) as reader:
+                self.assertEqual(reader.read(0), content[:500])
+                self.assertEqual(reader.read(500), content[500:1000])
+                # a repeated chunk is not hashed twice
+                self.assertEqual(reader.read(500), content[500:1000])
+                self.assertEqual(reader.read(1000), content[1000:])
+                self.assertEqual(reader.read(1276), b'')
+                self.assertEqual(reader.hexdigest(len(content)),
+                                 hashlib.sha1(content).hexdigest())
+
+    def test_resume(self):
+        """Test continuing the hash of an already uploaded part."""
+        digest = hashlib.sha1()
+        compute_file_hash(self.sounds_png, lambda: digest, bytes_to_read=600)
+        with open(self.sounds_png, 'rb') as f, \
+                ChunkReader(f, 1000, digest=digest, hashed=600) as reader:
+            self.assertLength(reader.read(600), 676)
+            self.assertEqual(reader.hexdigest(1276),
+                             compute_file_hash(self.sounds_png))
+
+
+class TestDryUploader(DefaultDrySiteTestCase):
+
+    """Test Uploader without a request to the wiki."""
+
+    sounds_png = join_images_path('MP_sounds.png')
+
+    def upload(self, chunk_size):
+        """Upload the file and return the request and ChunkReader mocks."""
+        filepage = pywikibot.FilePage(self.site, 'File:MP sounds.jpg')
+        uploader = Uploader(self.site, filepage,
+                            source_filename=self.sounds_png,
+                            comment='Test', text='Test',
+                            chunk_size=chunk_size)
+        with patch.object(self.site, '_tokens', {'csrf': '+\\'}), \
+                patch.object(self.site, '_request') as request, \
+                patch.object(Uploader, 'submit', return_value=True), \
+                patch('pywikibot.site._upload.ChunkReader') as reader:
+            self.assertTrue(uploader.upload())
+        return request, reader
+
+    def test_whole_upload(self):
+        """Test that the file is not read ahead if not chunked."""
+        self.assertEqual(config.upload_chunk_size, 0)
+        for chunk_size in (0, 2000):
+            with self.subTest(chunk_size=chunk_size):
+                request, reader = self.upload(chunk_size)
+                reader.assert_not_called()
+                file_contents = request.return_value.mime['file'][0]
+                with open(self.sounds_png, 'rb') as f:
+                    self.assertEqual(file_contents, f.read())
+
+
 if __name__ == '__main__':  # pragma: no cover
     with suppress(SystemExit):
         unittest.main()
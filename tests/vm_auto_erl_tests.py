@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Tests for VM-auto-erl user script."""
+#
+# (C) Pywikibot team, 2024
+#
+# Distributed under the terms of the MIT license.
+#
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+from contextlib import suppress
+from pathlib import Path
+from unittest.mock import patch
+
+import pywikibot
+from pywikibot import config
+from tests.aspects import DefaultDrySiteTestCase
+
+
+def load_script():
+    """Import the user script whose file name is not an identifier."""
+    path = Path(__file__).parent.parent / 'scripts' / 'userscripts' \
+        / 'VM-auto-erl.py'
+    spec = importlib.util.spec_from_file_location('vm_auto_erl', str(path))
+    module = importlib.util.module_from_spec(spec)
+    # the script changes throttle settings when it is imported
+    with patch.object(config, 'maxlag', config.maxlag), \
+         patch.object(config, 'put_throttle', config.put_throttle):
+        spec.loader.exec_module(module)
+    return module
+
+
+def section(user, minute):
+    """Return a WP:VM section reporting user."""
+    return ('== [[Benutzer:{user}]] ==\n'
+            'Vandalismus. [[Benutzer:Melder|Melder]] ([[Benutzer Diskussion:'
+            'Melder|Diskussion]]) 12:{minute:02}, 3. Jan. 2024 (CET)\n'
+            .format(user=user, minute=minute))
+
+
+class TestVMAutoErl(DefaultDrySiteTestCase):
+
+    """Test notifications of VM-auto-erl."""
+
+    def setUp(self):
+        """Set up the bot with patched page access."""
+        super().setUp()
+        self.module = load_script()
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        self.vm_text = ''
+        self.notified = []
+
+        def save(page, *args, **kwargs):
+            self.notified.append(page.title(with_ns=False))
+
+        bot_class = self.module.VMAutoErlBot
+        for obj, name, new in (
+                (config, 'datafilepath',
+                 lambda *path: os.path.join(self.tempdir.name, path[-1])),
+                (bot_class, 'optOutUsersToCheck', lambda self, name: ['X']),
+                (bot_class, 'userIsExperienced', lambda self, name: True),
+                (pywikibot.Page, 'get', lambda page: self.vm_text),
+                (pywikibot.Page, 'text', property(lambda page: '',
+                                                  lambda page, value: None)),
+                (pywikibot.Page, 'save', save),
+                (pywikibot, 'output', lambda *args, **kwargs: None),
+                (pywikibot, 'showDiff', lambda *args, **kwargs: None)):
+            patcher = patch.object(obj, name, new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.bot = bot_class(self.site)
+
+    def replay(self, events):
+        """Write events to a file and replay them like ``-events:``."""
+        filename = os.path.join(self.tempdir.name, 'events.json')
+        with open(filename, 'w', encoding='utf-8') as f:
+            for event in events:
+                f.write(json.dumps(event) + '\n')
+        for event in self.bot.replay(filename):
+            self.bot.handleEvent(event)
+
+    def test_notified_once(self):
+        """Test that each defendant is notified exactly once."""
+        old = ''.join(section('Alt{}'.format(i), i % 60) for i in range(60))
+        self.vm_text = 'Intro\n' + old
+        self.bot.contactDefendants(bootmode=True)
+        self.assertEqual(self.notified, [])
+
+        edit = {'type': 'edit', 'title': self.module.vmPageName,
+                'user': 'Melder', 'meta': {'dt': '2024-01-03T11:00:00Z'}}
+        self.vm_text += section('Neu', 0)
+        self.replay([edit] * 3)
+        self.assertEqual(self.notified, ['Neu'])
+
+        # archived sections are forgotten
+        self.vm_text = 'Intro\n' + section('Neu', 0)
+        self.replay([edit])
+        self.assertEqual(self.notified, ['Neu'])
+        self.assertEqual(self.bot.alreadySeenReceiver,
+                         {('Neu', '2024 Jan 3 12:00')})
+        with open(self.bot.checkpointFile, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), {'since': edit['meta']['dt']})
+
+
+if __name__ == '__main__':
+    with suppress(SystemExit):
+        unittest.main()
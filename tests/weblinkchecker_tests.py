@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""Tests for weblinkchecker script."""
+#
+# (C) Pywikibot team, 2024
+#
+# Distributed under the terms of the MIT license.
+#
+import os
+import pickle
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import suppress
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from scripts.weblinkchecker import (
+    History,
+    LinkChecker,
+    LinkCheckThread,
+    RepeatPageGenerator,
+)
+from tests.aspects import TestCase
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+
+    """Local HTTP server which answers the link checker."""
+
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    """Request handler which serves a few well known paths."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _answer(self, method):
+        self.server.requests.append((method, self.path, time.monotonic()))
+        if self.path == '/missing' \
+           or self.path == '/nohead' and method == 'HEAD':
+            status = HTTPStatus.NOT_FOUND
+        else:
+            status = HTTPStatus.OK
+        body = b'' if method == 'HEAD' else b'content'
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(b'content')))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):  # noqa: N802
+        """Answer a HEAD request."""
+        self._answer('HEAD')
+
+    def do_GET(self):  # noqa: N802
+        """Answer a GET request."""
+        self._answer('GET')
+
+    def log_message(self, *args):
+        """Be quiet."""
+
+
+class _History:
+
+    """History stand-in which collects the results."""
+
+    def __init__(self):
+        self.batches = []
+
+    def update(self, results):
+        self.batches.append(results)
+
+
+class TestLinkChecker(TestCase):
+
+    """Test LinkChecker against a local HTTP server."""
+
+    net = False
+
+    def setUp(self):
+        """Start the local server."""
+        super().setUp()
+        self.server = _Server(('127.0.0.1', 0), _Handler)
+        self.server.requests = []
+        thread = threading.Thread(target=self.server.serve_forever,
+                                  daemon=True)
+        thread.start()
+        self.base = 'http://127.0.0.1:{}'.format(self.server.server_port)
+
+    def tearDown(self):
+        """Stop the local server."""
+        self.server.shutdown()
+        self.server.server_close()
+        super().tearDown()
+
+    def run_checker(self, paths, **kwargs):
+        """Check the given paths and return results and requests."""
+        history = _History()
+        checker = LinkChecker(history, **kwargs)
+        checker.start()
+        for path in paths:
+            checker.add('Page', self.base + path)
+        self.assertTrue(checker.join(timeout=30))
+        results = {url[len(self.base):]: error
+                   for batch in history.batches
+                   for url, page, error in batch}
+        return history.batches, results, self.server.requests
+
+    def test_head_then_get(self):
+        """Test that GET is only used if HEAD fails."""
+        _, results, requests = self.run_checker(
+            ['/ok', '/nohead', '/missing'], workers=3, host_connections=3,
+            host_delay=0)
+        self.assertEqual(results, {'/ok': None, '/nohead': None,
+                                   '/missing': 'Not Found'})
+        methods = sorted((path, method) for method, path, _ in requests)
+        self.assertEqual(methods, [('/missing', 'GET'), ('/missing', 'HEAD'),
+                                   ('/nohead', 'GET'), ('/nohead', 'HEAD'),
+                                   ('/ok', 'HEAD')])
+
+    def test_http_ignores(self):
+        """Test that ignored status codes are not reported."""
+        _, results, _ = self.run_checker(['/missing'], http_ignores=[404],
+                                         host_delay=0)
+        self.assertEqual(results, {'/missing': None})
+
+    def test_exception(self):
+        """Test that a failed check is not recorded."""
+        with patch.object(LinkChecker, 'check', side_effect=RuntimeError), \
+             patch('pywikibot.error') as error, patch('pywikibot.info'):
+            batches, results, _ = self.run_checker(['/ok'], host_delay=0)
+        error.assert_called_once()
+        self.assertEqual(batches, [])
+        self.assertEqual(results, {})
+
+    def test_host_delay(self):
+        """Test per host delay and result batches."""
+        batches, results, requests = self.run_checker(
+            ['/ok?1', '/ok?2', '/ok?3'], workers=3, host_delay=0.3,
+            batch_size=2)
+        self.assertLength(results, 3)
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        starts = [start for *_, start in requests]
+        self.assertLength(starts, 3)
+        for first, second in zip(starts, starts[1:]):
+            self.assertGreaterEqual(second - first, 0.25)
+
+    def test_link_check_thread(self):
+        """Test the deprecated LinkCheckThread."""
+        history = _History()
+        with self.assertWarnsRegex(FutureWarning, 'LinkChecker'):
+            thread = LinkCheckThread('Page', self.base + '/missing', history,
+                                     [], 7)
+        thread.start()
+        thread.join(timeout=30)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(history.batches,
+                         [[(self.base + '/missing', 'Page', 'Not Found')]])
+
+
+class _Page(str):
+
+    """Page stand-in."""
+
+    def title(self):
+        return str(self)
+
+
+class TestHistory(TestCase):
+
+    """Test the History database."""
+
+    net = False
+
+    def setUp(self):
+        """Create a History in a temporary directory."""
+        super().setUp()
+        self.tempdir = tempfile.TemporaryDirectory()
+        patcher = patch('pywikibot.config.datafilepath',
+                        lambda *path: os.path.join(self.tempdir.name,
+                                                   path[-1]))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.site = SimpleNamespace(family=SimpleNamespace(name='wikipedia'),
+                                    code='test')
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tempdir.cleanup()
+        super().tearDown()
+
+    def test_update(self):
+        """Test recording dead and alive links."""
+        history = History(None, site=self.site)
+        history.update([('http://a', _Page('A'), 'Not Found'),
+                        ('http://b', _Page('B'), 'Gone'),
+                        ('http://b', _Page('C'), 'Gone'),
+                        ('http://c', _Page('C'), None)])
+        # the same link is recorded once per hour
+        sightings = history.sightings('http://b')
+        self.assertEqual([title for title, *_ in sightings], ['B'])
+        self.assertEqual(list(history.page_titles()), ['A', 'B'])
+        self.assertTrue(history.set_link_alive('http://a'))
+        self.assertFalse(history.set_link_alive('http://a'))
+        self.assertEqual(history.sightings('http://a'), [])
+        history.save()
+
+        # the database persists
+        history = History(None, site=self.site)
+        self.assertEqual(list(history.page_titles()), ['B'])
+        history.save()
+
+    def test_pickle(self):
+        """Test import and export of the old history file."""
+        old = {'http://a': [('A', 1000.0, 'Not Found'),
+                            ('B', 2000.0, 'Not Found')],
+               'http://b': [('B', 1500.0, 'Gone')]}
+        datfile = os.path.join(self.tempdir.name,
+                               'deadlinks-wikipedia-test.dat')
+        with open(datfile, 'wb') as f:
+            pickle.dump(old, f)
+
+        history = History(None, site=self.site)  # imports the .dat file
+        self.assertEqual(history.import_pickle(), 2)  # nothing new
+        self.assertEqual(history.sightings('http://a'), old['http://a'])
+        self.assertEqual(list(history.page_titles()), ['A', 'B'])
+        os.remove(datfile)
+        self.assertEqual(history.export_pickle(), 2)
+        history.save()
+        with open(datfile, 'rb') as f:
+            self.assertEqual(pickle.load(f), old)
+
+    def test_repeat_page_generator(self):
+        """Test that RepeatPageGenerator closes the database."""
+        history = History(None, site=self.site)
+        history.update([('http://a', _Page('A'), 'Not Found'),
+                        ('http://b', _Page('B'), 'Gone')])
+        history.save()
+
+        with patch('pywikibot.Site', return_value=self.site), \
+                patch('pywikibot.Page', lambda site, title: title), \
+                patch.object(History, 'save', autospec=True,
+                             side_effect=History.save) as save:
+            self.assertEqual(list(RepeatPageGenerator()), ['A', 'B'])
+            self.assertEqual(save.call_count, 1)
+            gen = RepeatPageGenerator()
+            self.assertEqual(next(gen), 'A')
+            gen.close()
+            self.assertEqual(save.call_count, 2)
+
+
+if __name__ == '__main__':
+    with suppress(SystemExit):
+        unittest.main()